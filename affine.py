@@ -0,0 +1,226 @@
+from __future__ import annotations
+from matrix import Matrix
+from tuple import Tuple
+from utils import equal
+
+
+class AffineTransform:
+    """
+    A 4x4 transformation whose bottom row is (0, 0, 0, 1), stored as a 3x3 linear part and a translation.
+    """
+
+    rows = 4
+    cols = 4
+
+    def __init__(self, linear: list = None, offset: list = None):
+        self.linear = [1, 0, 0, 0, 1, 0, 0, 0, 1] if linear is None else linear
+        self.offset = [0, 0, 0] if offset is None else offset
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix) -> AffineTransform:
+        """
+        Builds an affine transform from a 4x4 matrix.
+
+            Parameters:
+                matrix (Matrix): 4x4 matrix with a bottom row of (0, 0, 0, 1)
+
+            Returns:
+                affine (AffineTransform)
+        """
+
+        if not is_affine(matrix):
+            raise ValueError("Matrix is not affine")
+        m = matrix.matrix
+        return cls(
+            [m[0], m[1], m[2], m[4], m[5], m[6], m[8], m[9], m[10]], [m[3], m[7], m[11]]
+        )
+
+    @property
+    def matrix(self) -> list:
+        # Row-major cells, so AffineTransform can stand in wherever a Matrix is read
+        l = self.linear
+        t = self.offset
+        return [
+            l[0],
+            l[1],
+            l[2],
+            t[0],
+            l[3],
+            l[4],
+            l[5],
+            t[1],
+            l[6],
+            l[7],
+            l[8],
+            t[2],
+            0,
+            0,
+            0,
+            1,
+        ]
+
+    def to_matrix(self) -> Matrix:
+        """
+        Converts to an equivalent 4x4 Matrix.
+
+            Returns:
+                matrix (Matrix)
+        """
+
+        return Matrix(4, 4, self.matrix)
+
+    def apply_point(self, p: Tuple) -> Tuple:
+        """
+        Transforms a point, applying both the linear part and the translation.
+
+            Parameters:
+                p (Tuple): Tuple with type=point
+
+            Returns:
+                transformed (Tuple)
+        """
+
+        l = self.linear
+        t = self.offset
+        x, y, z = p.x, p.y, p.z
+        return Tuple(
+            l[0] * x + l[1] * y + l[2] * z + t[0],
+            l[3] * x + l[4] * y + l[5] * z + t[1],
+            l[6] * x + l[7] * y + l[8] * z + t[2],
+            p.w,
+        )
+
+    def apply_vector(self, v: Tuple) -> Tuple:
+        """
+        Transforms a vector, which is unaffected by translation.
+
+            Parameters:
+                v (Tuple): Tuple with type=vector
+
+            Returns:
+                transformed (Tuple)
+        """
+
+        l = self.linear
+        x, y, z = v.x, v.y, v.z
+        return Tuple(
+            l[0] * x + l[1] * y + l[2] * z,
+            l[3] * x + l[4] * y + l[5] * z,
+            l[6] * x + l[7] * y + l[8] * z,
+            v.w,
+        )
+
+    def inverse(self) -> AffineTransform:
+        """
+        Inverts the transform using the 3x3 inverse of the linear part and a back-translation.
+
+            Returns:
+                inverted (AffineTransform)
+        """
+
+        a, b, c, d, e, f, g, h, i = self.linear
+        c0 = e * i - f * h
+        c1 = f * g - d * i
+        c2 = d * h - e * g
+        det = a * c0 + b * c1 + c * c2
+        if det == 0:
+            raise ValueError("Matrix cannot be inverted")
+        inv = 1 / det
+        linear = [
+            c0 * inv,
+            (c * h - b * i) * inv,
+            (b * f - c * e) * inv,
+            c1 * inv,
+            (a * i - c * g) * inv,
+            (c * d - a * f) * inv,
+            c2 * inv,
+            (b * g - a * h) * inv,
+            (a * e - b * d) * inv,
+        ]
+        tx, ty, tz = self.offset
+        offset = [
+            -(linear[0] * tx + linear[1] * ty + linear[2] * tz),
+            -(linear[3] * tx + linear[4] * ty + linear[5] * tz),
+            -(linear[6] * tx + linear[7] * ty + linear[8] * tz),
+        ]
+        return AffineTransform(linear, offset)
+
+    def __mul__(self, other):
+        if isinstance(other, AffineTransform):
+            # Compose: (A * B) applies B first, then A
+            a = self.linear
+            b = other.linear
+            t = self.offset
+            u = other.offset
+            linear = [
+                a[0] * b[0] + a[1] * b[3] + a[2] * b[6],
+                a[0] * b[1] + a[1] * b[4] + a[2] * b[7],
+                a[0] * b[2] + a[1] * b[5] + a[2] * b[8],
+                a[3] * b[0] + a[4] * b[3] + a[5] * b[6],
+                a[3] * b[1] + a[4] * b[4] + a[5] * b[7],
+                a[3] * b[2] + a[4] * b[5] + a[5] * b[8],
+                a[6] * b[0] + a[7] * b[3] + a[8] * b[6],
+                a[6] * b[1] + a[7] * b[4] + a[8] * b[7],
+                a[6] * b[2] + a[7] * b[5] + a[8] * b[8],
+            ]
+            offset = [
+                a[0] * u[0] + a[1] * u[1] + a[2] * u[2] + t[0],
+                a[3] * u[0] + a[4] * u[1] + a[5] * u[2] + t[1],
+                a[6] * u[0] + a[7] * u[1] + a[8] * u[2] + t[2],
+            ]
+            return AffineTransform(linear, offset)
+        elif isinstance(other, Tuple):
+            # w=1 picks up the translation, w=0 ignores it
+            l = self.linear
+            t = self.offset
+            x, y, z, w = other.x, other.y, other.z, other.w
+            return Tuple(
+                l[0] * x + l[1] * y + l[2] * z + t[0] * w,
+                l[3] * x + l[4] * y + l[5] * z + t[1] * w,
+                l[6] * x + l[7] * y + l[8] * z + t[2] * w,
+                w,
+            )
+        elif isinstance(other, Matrix):
+            return self.to_matrix() * other
+        return NotImplemented
+
+    def __rmul__(self, other):
+        if isinstance(other, Matrix):
+            return other * self.to_matrix()
+        return NotImplemented
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AffineTransform):
+            return all(equal(a, b) for a, b in zip(self.linear, other.linear)) and all(
+                equal(a, b) for a, b in zip(self.offset, other.offset)
+            )
+        elif isinstance(other, Matrix):
+            return other == self.to_matrix()
+        return False
+
+    def __getitem__(self, row):
+        return self.matrix[row * 4 : row * 4 + 4]
+
+    def __copy__(self) -> AffineTransform:
+        return AffineTransform(self.linear.copy(), self.offset.copy())
+
+    def __repr__(self):
+        return repr(self.to_matrix())
+
+
+def is_affine(matrix: Matrix) -> bool:
+    """
+    Determines whether a 4x4 matrix is affine (bottom row of (0, 0, 0, 1)).
+
+        Parameters:
+            matrix (Matrix)
+
+        Returns:
+            affine (bool)
+    """
+
+    if isinstance(matrix, AffineTransform):
+        return True
+    if matrix.rows != 4 or matrix.cols != 4:
+        return False
+    return matrix.matrix[12:16] == [0, 0, 0, 1]
@@ -0,0 +1,110 @@
+from math import pi
+from affine import AffineTransform, is_affine
+from matrix import Matrix, identity_matrix, inverse
+from transformations import translation, scaling, rotation_x, rotation_y, shearing
+from tuple import point, vector
+import unittest
+
+
+class Tests(unittest.TestCase):
+    def test_scenario1(self):
+        """
+        Scenario: Transformations are affine
+            Given t ← translation(1, 2, 3) * rotation_x(π/4) * scaling(2, 2, 2)
+            Then is_affine(t) = true
+            And is_affine(identity_matrix) = true
+        """
+
+        t = translation(1, 2, 3) * rotation_x(pi / 4) * scaling(2, 2, 2)
+        self.assertTrue(is_affine(t))
+        self.assertTrue(is_affine(identity_matrix))
+
+    def test_scenario2(self):
+        """
+        Scenario: A projective matrix is not affine
+            Given m ← matrix with bottom row (0, 0, 1, 0)
+            Then is_affine(m) = false
+            And from_matrix(m) raises an error
+        """
+
+        m = Matrix(4, 4, [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0])
+        self.assertFalse(is_affine(m))
+        with self.assertRaises(ValueError):
+            AffineTransform.from_matrix(m)
+
+    def test_scenario3(self):
+        """
+        Scenario: An affine transform round-trips through Matrix
+            Given m ← translation(5, -3, 2) * shearing(1, 0, 0, 0, 0, 1)
+            When a ← from_matrix(m)
+            Then a = m
+            And to_matrix(a) = m
+        """
+
+        m = translation(5, -3, 2) * shearing(1, 0, 0, 0, 0, 1)
+        a = AffineTransform.from_matrix(m)
+        self.assertEqual(a, m)
+        self.assertEqual(m, a)
+        self.assertEqual(a.to_matrix(), m)
+
+    def test_scenario4(self):
+        """
+        Scenario: Composing affine transforms matches matrix multiplication
+            Given A ← translation(10, 5, 7)
+            And B ← rotation_y(π/3) * scaling(5, 5, 5)
+            Then from_matrix(A) * from_matrix(B) = A * B
+        """
+
+        A = translation(10, 5, 7)
+        B = rotation_y(pi / 3) * scaling(5, 5, 5)
+        composed = AffineTransform.from_matrix(A) * AffineTransform.from_matrix(B)
+        self.assertEqual(composed, A * B)
+
+    def test_scenario5(self):
+        """
+        Scenario: Points are translated but vectors are not
+            Given a ← from_matrix(translation(5, -3, 2))
+            Then a * point(-3, 4, 5) = point(2, 1, 7)
+            And apply_point(a, point(-3, 4, 5)) = point(2, 1, 7)
+            And a * vector(-3, 4, 5) = vector(-3, 4, 5)
+            And apply_vector(a, vector(-3, 4, 5)) = vector(-3, 4, 5)
+        """
+
+        a = AffineTransform.from_matrix(translation(5, -3, 2))
+        self.assertEqual(a * point(-3, 4, 5), point(2, 1, 7))
+        self.assertEqual(a.apply_point(point(-3, 4, 5)), point(2, 1, 7))
+        self.assertEqual(a * vector(-3, 4, 5), vector(-3, 4, 5))
+        self.assertEqual(a.apply_vector(vector(-3, 4, 5)), vector(-3, 4, 5))
+
+    def test_scenario6(self):
+        """
+        Scenario: The affine inverse matches the general inverse
+            Given m ← translation(1, 2, 3) * rotation_x(π/5) * shearing(0, 1, 0, 0, 2, 0) * scaling(2, 3, 4)
+            Then inverse(from_matrix(m)) = inverse(m)
+        """
+
+        m = (
+            translation(1, 2, 3)
+            * rotation_x(pi / 5)
+            * shearing(0, 1, 0, 0, 2, 0)
+            * scaling(2, 3, 4)
+        )
+        self.assertEqual(AffineTransform.from_matrix(m).inverse(), inverse(m))
+
+    def test_scenario7(self):
+        """
+        Scenario: Affine transforms interoperate with Matrix multiplication
+            Given A ← translation(1, 2, 3)
+            And B ← scaling(2, 2, 2)
+            Then A * from_matrix(B) = A * B
+            And from_matrix(A) * B = A * B
+        """
+
+        A = translation(1, 2, 3)
+        B = scaling(2, 2, 2)
+        self.assertEqual(A * AffineTransform.from_matrix(B), A * B)
+        self.assertEqual(AffineTransform.from_matrix(A) * B, A * B)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,412 @@
+from __future__ import annotations
+import numpy as np
+from tuple import Tuple, Color
+from utils import EPSILON
+
+
+class TupleArray:
+    """
+    N points/vectors stored as a structure of arrays: data[0] holds every x, data[1] every y, and so on.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = np.ascontiguousarray(data, dtype=np.float64).reshape(4, -1)
+
+    @classmethod
+    def from_tuples(cls, tuples: list) -> TupleArray:
+        """
+        Packs a list of Tuples into a TupleArray.
+
+            Parameters:
+                tuples (list)
+
+            Returns:
+                packed (TupleArray)
+        """
+
+        return cls(
+            [
+                [t.x for t in tuples],
+                [t.y for t in tuples],
+                [t.z for t in tuples],
+                [t.w for t in tuples],
+            ]
+        )
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.data[0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.data[1]
+
+    @property
+    def z(self) -> np.ndarray:
+        return self.data[2]
+
+    @property
+    def w(self) -> np.ndarray:
+        return self.data[3]
+
+    def to_tuples(self) -> list:
+        """
+        Unpacks into a list of Tuples.
+
+            Returns:
+                tuples (list)
+        """
+
+        return [Tuple(*column) for column in self.data.T.tolist()]
+
+    def __len__(self) -> int:
+        return self.data.shape[1]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Tuple(*self.data[:, index].tolist())
+        return TupleArray(self.data[:, index])
+
+    def __eq__(self, other: TupleArray) -> bool:
+        return self.data.shape == other.data.shape and bool(
+            np.all(np.abs(self.data - other.data) < EPSILON)
+        )
+
+    def __add__(self, other: TupleArray) -> TupleArray:
+        return TupleArray(self.data + _components(other))
+
+    def __sub__(self, other: TupleArray) -> TupleArray:
+        return TupleArray(self.data - _components(other))
+
+    def __mul__(self, other) -> TupleArray:
+        # Scalar, or one factor per tuple
+        return TupleArray(self.data * other)
+
+    def __truediv__(self, other) -> TupleArray:
+        return TupleArray(self.data / other)
+
+    def __neg__(self) -> TupleArray:
+        return TupleArray(-self.data)
+
+    def __rmul__(self, other) -> TupleArray:
+        if hasattr(other, "matrix") and hasattr(other, "rows"):
+            # Matrix (or AffineTransform) applied to every tuple in one product
+            m = np.asarray(other.matrix, dtype=np.float64).reshape(
+                other.rows, other.cols
+            )
+            return TupleArray(m @ self.data)
+        return TupleArray(self.data * other)
+
+    def __copy__(self) -> TupleArray:
+        return TupleArray(self.data.copy())
+
+    def __repr__(self) -> str:
+        return f"TupleArray of {len(self)}"
+
+
+class ColorArray:
+    """
+    N colors stored as a structure of arrays: data[0] holds every red, data[1] every green, data[2] every blue.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = np.ascontiguousarray(data, dtype=np.float64).reshape(3, -1)
+
+    @classmethod
+    def from_colors(cls, colors: list) -> ColorArray:
+        """
+        Packs a list of Colors into a ColorArray.
+
+            Parameters:
+                colors (list)
+
+            Returns:
+                packed (ColorArray)
+        """
+
+        return cls(
+            [
+                [c.red for c in colors],
+                [c.green for c in colors],
+                [c.blue for c in colors],
+            ]
+        )
+
+    @property
+    def red(self) -> np.ndarray:
+        return self.data[0]
+
+    @property
+    def green(self) -> np.ndarray:
+        return self.data[1]
+
+    @property
+    def blue(self) -> np.ndarray:
+        return self.data[2]
+
+    def to_colors(self) -> list:
+        """
+        Unpacks into a list of Colors.
+
+            Returns:
+                colors (list)
+        """
+
+        return [Color(*column) for column in self.data.T.tolist()]
+
+    def __len__(self) -> int:
+        return self.data.shape[1]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Color(*self.data[:, index].tolist())
+        return ColorArray(self.data[:, index])
+
+    def __eq__(self, other: ColorArray) -> bool:
+        return self.data.shape == other.data.shape and bool(
+            np.all(np.abs(self.data - other.data) < EPSILON)
+        )
+
+    def __add__(self, other: ColorArray) -> ColorArray:
+        return ColorArray(self.data + _components(other))
+
+    def __sub__(self, other: ColorArray) -> ColorArray:
+        return ColorArray(self.data - _components(other))
+
+    def __mul__(self, other) -> ColorArray:
+        # Hadamard product with other colors, or a scalar / per-color factor
+        return ColorArray(self.data * _components(other))
+
+    def __rmul__(self, other) -> ColorArray:
+        return ColorArray(self.data * other)
+
+    def __copy__(self) -> ColorArray:
+        return ColorArray(self.data.copy())
+
+    def __repr__(self) -> str:
+        return f"ColorArray of {len(self)}"
+
+
+def _components(value):
+    # Broadcastable column for scalar Tuple/Color operands, raw data for arrays
+    if isinstance(value, (TupleArray, ColorArray)):
+        return value.data
+    elif isinstance(value, Tuple):
+        return np.array([[value.x], [value.y], [value.z], [value.w]])
+    elif isinstance(value, Color):
+        return np.array([[value.red], [value.green], [value.blue]])
+    return value
+
+
+def points(xs, ys, zs) -> TupleArray:
+    """
+    Returns a TupleArray with type=point.
+
+        Parameters:
+            xs (array)
+            ys (array)
+            zs (array)
+
+        Returns:
+            p (TupleArray)
+    """
+
+    xs = np.asarray(xs, dtype=np.float64)
+    p = TupleArray(
+        np.stack(
+            [
+                xs,
+                np.broadcast_to(ys, xs.shape),
+                np.broadcast_to(zs, xs.shape),
+                np.ones_like(xs),
+            ]
+        )
+    )
+    return p
+
+
+def vectors(xs, ys, zs) -> TupleArray:
+    """
+    Returns a TupleArray with type=vector.
+
+        Parameters:
+            xs (array)
+            ys (array)
+            zs (array)
+
+        Returns:
+            v (TupleArray)
+    """
+
+    xs = np.asarray(xs, dtype=np.float64)
+    v = TupleArray(
+        np.stack(
+            [
+                xs,
+                np.broadcast_to(ys, xs.shape),
+                np.broadcast_to(zs, xs.shape),
+                np.zeros_like(xs),
+            ]
+        )
+    )
+    return v
+
+
+def magnitude(v: TupleArray) -> np.ndarray:
+    """
+    Returns the magnitude of every vector.
+
+        Parameters:
+            v (TupleArray): With type=vector.
+
+        Returns:
+            magnitude (ndarray)
+    """
+
+    magnitude = np.sqrt(np.einsum("ij,ij->j", v.data, v.data))
+    return magnitude
+
+
+def normalize(v: TupleArray) -> TupleArray:
+    """
+    Normalizes every vector.
+
+        Parameters:
+            v (TupleArray): With type=vector.
+
+        Returns:
+            normalized (TupleArray)
+    """
+
+    normalized = TupleArray(v.data / magnitude(v))
+    return normalized
+
+
+def dot(a: TupleArray, b: TupleArray) -> np.ndarray:
+    """
+    Returns the dot product of each pair of vectors.
+
+        Parameters:
+            a (TupleArray)
+            b (TupleArray)
+
+        Returns:
+            product (ndarray)
+    """
+
+    product = (a.data * _components(b)).sum(axis=0)
+    return product
+
+
+def cross(a: TupleArray, b: TupleArray) -> TupleArray:
+    """
+    Returns the cross product of each pair of vectors.
+
+        Parameters:
+            a (TupleArray)
+            b (TupleArray)
+
+        Returns:
+            product (TupleArray)
+    """
+
+    ax, ay, az = a.data[0], a.data[1], a.data[2]
+    b = _components(b)
+    bx, by, bz = b[0], b[1], b[2]
+    product = vectors(ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx)
+    return product
+
+
+def reflect(initial: TupleArray, normal: TupleArray) -> TupleArray:
+    """
+    Reflects every vector around its normal.
+
+        Parameters:
+            initial (TupleArray)
+            normal (TupleArray)
+
+        Returns:
+            reflected (TupleArray)
+    """
+
+    reflected = TupleArray(
+        initial.data - _components(normal) * (2 * dot(initial, normal))
+    )
+    return reflected
+
+
+def intersect_spheres(origins: TupleArray, directions: TupleArray, inverses: list):
+    """
+    Intersects every ray against every sphere at once and keeps the nearest non-negative hit per ray.
+
+        Parameters:
+            origins (TupleArray): Ray origins, type=point
+            directions (TupleArray): Ray directions, type=vector
+            inverses (list): Inverse transformation of each sphere (Matrix or AffineTransform)
+
+        Returns:
+            (t, index) (tuple): Nearest t per ray (inf on a miss) and the index of the sphere hit (-1 on a miss)
+    """
+
+    count = len(origins)
+    if len(inverses) == 0:
+        return np.full(count, np.inf), np.full(count, -1, dtype=np.intp)
+
+    # Move every ray into every sphere's object space: (spheres, components, rays)
+    m = np.array([inverse.matrix for inverse in inverses], dtype=np.float64)
+    m = m.reshape(-1, 4, 4)[:, :3, :]
+    o = np.einsum("sij,jn->sin", m, origins.data)
+    d = np.einsum("sij,jn->sin", m, directions.data)
+
+    # The unit sphere sits at the object space origin, so sphere_to_ray is the local origin
+    a = np.einsum("sin,sin->sn", d, d)
+    b = 2 * np.einsum("sin,sin->sn", d, o)
+    c = np.einsum("sin,sin->sn", o, o) - 1
+    discriminant = b**2 - 4 * a * c
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        root = np.sqrt(discriminant)
+        t1 = (-b - root) / (2 * a)
+        t2 = (-b + root) / (2 * a)
+    t = np.where(t1 >= 0, t1, np.where(t2 >= 0, t2, np.inf))
+    t = np.where(discriminant >= 0, t, np.inf)
+
+    index = np.argmin(t, axis=0)
+    nearest = t[index, np.arange(count)]
+    index = np.where(np.isfinite(nearest), index, -1)
+    return nearest, index
+
+
+def intersect_planes(origins: TupleArray, directions: TupleArray, coefficients: list):
+    """
+    Intersects every ray against every plane at once and keeps the nearest non-negative hit per ray.
+
+        Parameters:
+            origins (TupleArray): Ray origins, type=point
+            directions (TupleArray): Ray directions, type=vector
+            coefficients (list): World-space plane equation (a, b, c, d) of each plane
+
+        Returns:
+            (t, index) (tuple): Nearest t per ray (inf on a miss) and the index of the plane hit (-1 on a miss)
+    """
+
+    count = len(origins)
+    if len(coefficients) == 0:
+        return np.full(count, np.inf), np.full(count, -1, dtype=np.intp)
+
+    # Origins have w = 1 and directions w = 0, so d only enters the numerator
+    planes = np.array(coefficients, dtype=np.float64)
+    numerator = planes @ origins.data
+    denominator = planes @ directions.data
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = -numerator / denominator
+    t = np.where((denominator != 0) & (t >= 0), t, np.inf)
+
+    index = np.argmin(t, axis=0)
+    nearest = t[index, np.arange(count)]
+    index = np.where(np.isfinite(nearest), index, -1)
+    return nearest, index
@@ -0,0 +1,120 @@
+from math import pi, sqrt
+from arrays import (
+    TupleArray,
+    ColorArray,
+    points,
+    vectors,
+    magnitude,
+    normalize,
+    dot,
+    cross,
+    reflect,
+)
+from transformations import rotation_y, translation
+from tuple import Color, point, vector
+import tuple as scalar
+import unittest
+
+
+class Tests(unittest.TestCase):
+    def test_scenario1(self):
+        """
+        Scenario: A TupleArray round-trips Tuples
+            Given ts ← [point(4.3, -4.2, 3.1), vector(1, 2, 3)]
+            When a ← tuple_array(ts)
+            Then a.x = [4.3, 1]
+            And a.w = [1, 0]
+            And a[0] = point(4.3, -4.2, 3.1)
+            And to_tuples(a) = ts
+        """
+
+        ts = [point(4.3, -4.2, 3.1), vector(1, 2, 3)]
+        a = TupleArray.from_tuples(ts)
+        self.assertEqual(list(a.x), [4.3, 1])
+        self.assertEqual(list(a.w), [1, 0])
+        self.assertEqual(a[0], point(4.3, -4.2, 3.1))
+        self.assertEqual(a.to_tuples(), ts)
+
+    def test_scenario2(self):
+        """
+        Scenario: Adding and subtracting TupleArrays
+            Given a ← points([3, 1], [-2, 2], [5, 3])
+            And b ← vectors([-2, 5], [3, 6], [1, 7])
+            Then a + b = points([1, 6], [1, 8], [6, 10])
+            And a - b = points([5, -4], [-5, -4], [4, -4])
+        """
+
+        a = points([3, 1], [-2, 2], [5, 3])
+        b = vectors([-2, 5], [3, 6], [1, 7])
+        self.assertEqual(a + b, points([1, 6], [1, 8], [6, 10]))
+        self.assertEqual(a - b, points([5, -4], [-5, -4], [4, -4]))
+
+    def test_scenario3(self):
+        """
+        Scenario: Vectorized math matches tuple.py
+            Given vs ← [vector(1, 2, 3), vector(4, 0, 0), vector(-1, -2, 3)]
+            And others ← [vector(2, 3, 4), vector(0, 1, 0), vector(1, 1, 1)]
+            Then magnitude, normalize, dot, cross and reflect agree with the scalar versions
+        """
+
+        vs = [vector(1, 2, 3), vector(4, 0, 0), vector(-1, -2, 3)]
+        others = [vector(2, 3, 4), vector(0, 1, 0), vector(1, 1, 1)]
+        a = TupleArray.from_tuples(vs)
+        b = TupleArray.from_tuples(others)
+        for i in range(len(vs)):
+            self.assertAlmostEqual(magnitude(a)[i], scalar.magnitude(vs[i]))
+            self.assertAlmostEqual(dot(a, b)[i], scalar.dot(vs[i], others[i]))
+            self.assertEqual(normalize(a)[i], scalar.normalize(vs[i]))
+            self.assertEqual(cross(a, b)[i], scalar.cross(vs[i], others[i]))
+            self.assertEqual(reflect(a, b)[i], scalar.reflect(vs[i], others[i]))
+
+    def test_scenario4(self):
+        """
+        Scenario: Reflecting a batch of vectors off a slanted surface
+            Given v ← vectors([0], [-1], [0])
+            And n ← vector(√2/2, √2/2, 0)
+            When r ← reflect(v, n)
+            Then r = vectors([1], [0], [0])
+        """
+
+        v = vectors([0], [-1], [0])
+        n = vector(sqrt(2) / 2, sqrt(2) / 2, 0)
+        self.assertEqual(reflect(v, n), vectors([1], [0], [0]))
+
+    def test_scenario5(self):
+        """
+        Scenario: Multiplying a TupleArray by a matrix
+            Given m ← translation(1, 2, 3) * rotation_y(π/2)
+            And ts ← [point(1, 0, 0), vector(0, 0, 1)]
+            Then m * tuple_array(ts) = [m * ts[0], m * ts[1]]
+        """
+
+        m = translation(1, 2, 3) * rotation_y(pi / 2)
+        ts = [point(1, 0, 0), vector(0, 0, 1)]
+        transformed = m * TupleArray.from_tuples(ts)
+        self.assertEqual(transformed.to_tuples(), [m * t for t in ts])
+
+    def test_scenario6(self):
+        """
+        Scenario: ColorArray arithmetic matches Color arithmetic
+            Given cs ← [color(0.9, 0.6, 0.75), color(1, 0.2, 0.4)]
+            And ds ← [color(0.7, 0.1, 0.25), color(0.9, 1, 0.1)]
+            Then color_array(cs) + color_array(ds) = [cs[i] + ds[i]]
+            And color_array(cs) - color_array(ds) = [cs[i] - ds[i]]
+            And color_array(cs) * color_array(ds) = [cs[i] * ds[i]]
+            And color_array(cs) * 2 = [cs[i] * 2]
+        """
+
+        cs = [Color(0.9, 0.6, 0.75), Color(1, 0.2, 0.4)]
+        ds = [Color(0.7, 0.1, 0.25), Color(0.9, 1, 0.1)]
+        a = ColorArray.from_colors(cs)
+        b = ColorArray.from_colors(ds)
+        self.assertEqual((a + b).to_colors(), [c + d for c, d in zip(cs, ds)])
+        self.assertEqual((a - b).to_colors(), [c - d for c, d in zip(cs, ds)])
+        self.assertEqual((a * b).to_colors(), [c * d for c, d in zip(cs, ds)])
+        self.assertEqual((a * 2).to_colors(), [c * 2 for c in cs])
+        self.assertEqual((a * Color(1, 0, 1))[1], Color(1, 0, 0.4))
+
+
+if __name__ == "__main__":
+    unittest.main()
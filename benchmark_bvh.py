@@ -0,0 +1,74 @@
+import sys
+import time
+from random import Random
+from ray import Ray
+from sphere import Sphere
+from transformations import translation, scaling
+from tuple import point, vector, normalize
+from world import World
+
+# Usage: python benchmark_bvh.py [max_objects] [rays]
+# Scales the number of spheres by 10x up to max_objects and times BVH builds and closest-hit queries.
+# The linear search is only timed up to LINEAR_LIMIT objects, past which it takes too long to be worth waiting for.
+
+LINEAR_LIMIT = 1000
+
+max_objects = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+ray_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+rng = Random(1)
+rays = [
+    Ray(
+        point(rng.uniform(-50, 50), rng.uniform(-50, 50), -100),
+        normalize(vector(rng.uniform(-0.2, 0.2), rng.uniform(-0.2, 0.2), 1)),
+    )
+    for _ in range(ray_count)
+]
+
+
+def scene(count: int) -> World:
+    # Spheres spread through a volume that grows with the count, so density stays roughly constant
+    side = 50 * (count / 1000) ** (1 / 3)
+    spheres = []
+    for _ in range(count):
+        s = Sphere()
+        s.set_transform(
+            translation(*(rng.uniform(-side, side) for _ in range(3)))
+            * scaling(0.5, 0.5, 0.5)
+        )
+        spheres.append(s)
+    return World(spheres)
+
+
+def linear_closest_hit(world: World, ray: Ray) -> float:
+    t_max = float("inf")
+    for obj in world.objects:
+        t = ray.nearest(obj, 0, t_max)
+        if t is not None:
+            t_max = t
+    return t_max
+
+
+print(f"{'objects':>8} {'build s':>9} {'bvh us/ray':>11} {'linear us/ray':>14}")
+count = 10
+while count <= max_objects:
+    world = scene(count)
+
+    start = time.perf_counter()
+    world.bvh()
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for ray in rays:
+        world.closest_hit(ray)
+    bvh_per_ray = (time.perf_counter() - start) / ray_count * 1e6
+
+    linear = "-"
+    if count <= LINEAR_LIMIT:
+        start = time.perf_counter()
+        for ray in rays:
+            linear_closest_hit(world, ray)
+        linear = f"{(time.perf_counter() - start) / ray_count * 1e6:.1f}"
+
+    print(f"{count:>8} {build:>9.3f} {bvh_per_ray:>11.1f} {linear:>14}")
+    count *= 10
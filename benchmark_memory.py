@@ -0,0 +1,64 @@
+import resource
+import sys
+from math import pi
+from camera import Camera
+from canvas import Color
+from lights import PointLight
+from material import Material
+from ray import Ray, Intersection
+from sphere import Sphere
+from transformations import view_transform
+from tuple import point, vector
+from world import Computations, default_world
+
+# Usage: python benchmark_memory.py [width] [height]
+# Prints the size of one instance of each core value type, then renders the default world and reports peak RSS.
+
+
+def object_size(obj) -> int:
+    """
+    Size of an object including its attribute dictionary, if it has one.
+
+        Parameters:
+            obj (Any)
+
+        Returns:
+            size (int): Bytes
+    """
+
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def peak_rss() -> int:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+width = int(sys.argv[1]) if len(sys.argv) > 1 else 320
+height = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+samples = {
+    "Tuple": point(1, 2, 3),
+    "Color": Color(0.1, 0.2, 0.3),
+    "Ray": Ray(point(0, 0, 0), vector(0, 0, 1)),
+    "Intersection": Intersection(1, Sphere()),
+    "Computations": Computations(),
+    "Material": Material(),
+    "PointLight": PointLight(point(0, 0, 0), Color(1, 1, 1)),
+}
+for name, obj in samples.items():
+    print(f"{name:<14}{object_size(obj):>6} bytes")
+
+world = default_world()
+camera = Camera(width, height, pi / 3)
+camera.transform = view_transform(point(0, 1.5, -5), point(0, 0, 0), vector(0, 1, 0))
+
+before = peak_rss()
+camera.render(world)
+after = peak_rss()
+print(
+    f"Render {width}x{height}: peak RSS {after} KB ({after - before} KB above pre-render)"
+)
@@ -0,0 +1,60 @@
+import sys
+import time
+from array import array
+from math import cos, pi, sin
+from random import Random
+from compact_mesh import CompactMesh
+from mesh import Mesh
+from ray import Ray
+from tuple import point, vector, normalize
+
+# Usage: python benchmark_mesh.py [segments] [rays]
+# Tessellates a smooth unit sphere into about 2 * segments^2 triangles, encodes it as a CompactMesh and
+# compares the memory held by each representation and how long closest-hit queries take against it.
+
+
+def tessellated_sphere(segments: int) -> Mesh:
+    vertices = array("f")
+    indices = array("I")
+    rings = segments // 2
+    for i in range(rings + 1):
+        theta = pi * i / rings
+        for j in range(segments):
+            phi = 2 * pi * j / segments
+            vertices.extend((sin(theta) * cos(phi), cos(theta), sin(theta) * sin(phi)))
+    for i in range(rings):
+        for j in range(segments):
+            a = i * segments + j
+            b = i * segments + (j + 1) % segments
+            indices.extend((a, a + segments, b, b, a + segments, b + segments))
+    # On a unit sphere every vertex's normal is its position
+    return Mesh(vertices, indices, array("f", vertices), array("I", indices))
+
+
+segments = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+ray_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+rng = Random(1)
+rays = [
+    Ray(
+        point(rng.uniform(-1, 1), rng.uniform(-1, 1), -5),
+        normalize(vector(rng.uniform(-0.05, 0.05), rng.uniform(-0.05, 0.05), 1)),
+    )
+    for _ in range(ray_count)
+]
+
+mesh = tessellated_sphere(segments)
+start = time.perf_counter()
+compact = CompactMesh(mesh)
+encode = time.perf_counter() - start
+
+print(f"{mesh.face_count} faces, encoded in {encode:.2f} s")
+print(f"{'':<8}{'bytes':>12}{'bytes/face':>12}{'us/ray':>10}")
+for name, shape in (("mesh", mesh), ("compact", compact)):
+    start = time.perf_counter()
+    for ray in rays:
+        shape.nearest(ray)
+    per_ray = (time.perf_counter() - start) / ray_count * 1e6
+    size = shape.nbytes()
+    print(f"{name:<8}{size:>12}{size / shape.face_count:>12.1f}{per_ray:>10.1f}")
+print(f"compact / mesh memory: {compact.nbytes() / mesh.nbytes():.2f}")
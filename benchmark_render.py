@@ -0,0 +1,36 @@
+import os
+import sys
+import time
+from math import pi
+from camera import Camera
+from transformations import view_transform
+from tuple import point, vector
+from world import default_world
+
+# Usage: python benchmark_render.py [width] [height] [max_workers]
+# Renders the default world with 1, 2, 4, ... worker processes and reports the speedup over the serial path.
+
+if __name__ == "__main__":
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 320
+    height = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count()
+
+    world = default_world()
+    camera = Camera(width, height, pi / 3)
+    camera.transform = view_transform(
+        point(0, 1.5, -5), point(0, 0, 0), vector(0, 1, 0)
+    )
+
+    start = time.perf_counter()
+    camera.render(world)
+    serial = time.perf_counter() - start
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+    print(f"{'serial':>8} {serial:>9.2f} {1:>8.2f}")
+
+    workers = 1
+    while workers <= max_workers:
+        start = time.perf_counter()
+        camera.render(world, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"{workers:>8} {elapsed:>9.2f} {serial / elapsed:>8.2f}")
+        workers *= 2
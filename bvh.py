@@ -0,0 +1,410 @@
+from __future__ import annotations
+from array import array
+from math import inf
+
+# Nodes with this many items or fewer always become leaves; up to MAX_LEAF_SIZE when SAH finds no split worth making
+LEAF_SIZE = 2
+MAX_LEAF_SIZE = 8
+# Number of centroid bins evaluated per split
+BINS = 12
+# Cost of one node traversal relative to one item intersection
+TRAVERSAL_COST = 0.5
+
+
+def _nearest(item, ray, t_min: float, t_max: float) -> float:
+    return item.nearest(ray, t_min, t_max)
+
+
+class BVH:
+    """
+    Bounding volume hierarchy over items with axis-aligned bounds, built with binned SAH.
+
+    Nodes are stored depth-first in flat arrays, so a node's left child always follows it:
+        bounds[6 * n : 6 * n + 6] are its (xmin, ymin, zmin, xmax, ymax, zmax)
+        count[n] is the number of items in a leaf, or 0 for an interior node
+        offset[n] is the first item of a leaf, or the right child of an interior node
+        axis[n] is the split axis of an interior node
+    """
+
+    def __init__(
+        self,
+        items: list,
+        bounds: list,
+        nearest=_nearest,
+        leaf_size: int = LEAF_SIZE,
+        max_leaf_size: int = MAX_LEAF_SIZE,
+    ):
+        """
+        Builds a hierarchy.
+
+            Parameters:
+                items (list): A list, or an array of item indexes, which keeps its array type
+                bounds (list): (xmin, ymin, zmin, xmax, ymax, zmax) per item
+                nearest (function): nearest(item, ray, t_min, t_max) returns the closest t in range or None
+                leaf_size (int): Nodes with this many items or fewer always become leaves
+                max_leaf_size (int): Largest leaf made when SAH finds no split worth making
+        """
+
+        self.nearest = nearest
+        self.leaf_size = leaf_size
+        self.max_leaf_size = max_leaf_size
+        self.bounds = array("d")
+        self.count = array("l")
+        self.offset = array("l")
+        self.axis = array("b")
+
+        order = list(range(len(items)))
+        centroids = [
+            ((b[0] + b[3]) / 2, (b[1] + b[4]) / 2, (b[2] + b[5]) / 2) for b in bounds
+        ]
+        if items:
+            self._build(order, 0, len(order), bounds, centroids)
+        if isinstance(items, array):
+            # Keep packed item indexes packed, so big meshes don't get one Python int per triangle
+            self.items = array(items.typecode, (items[i] for i in order))
+        else:
+            self.items = [items[i] for i in order]
+
+    @classmethod
+    def from_arrays(cls, items, bounds, count, offset, axis, nearest=_nearest) -> BVH:
+        """
+        Wraps node arrays saved from an earlier build without rebuilding. Anything indexable works,
+        such as memoryviews over a mapped file.
+
+            Parameters:
+                items: Items in leaf order
+                bounds: Six bounds per node
+                count: Items per node
+                offset: Item start or right child per node
+                axis: Split axis per node
+                nearest (function): nearest(item, ray, t_min, t_max) returns the closest t in range or None
+
+            Returns:
+                bvh (BVH)
+        """
+
+        bvh = cls.__new__(cls)
+        bvh.nearest = nearest
+        bvh.items = items
+        bvh.bounds = bounds
+        bvh.count = count
+        bvh.offset = offset
+        bvh.axis = axis
+        return bvh
+
+    def _add_node(self, box: tuple) -> int:
+        self.bounds.extend(box)
+        self.count.append(0)
+        self.offset.append(0)
+        self.axis.append(0)
+        return len(self.count) - 1
+
+    def _build(self, order: list, start: int, end: int, bounds: list, centroids: list):
+        box = _union([bounds[i] for i in order[start:end]])
+        node = self._add_node(box)
+        n = end - start
+
+        if n <= self.leaf_size:
+            self.count[node] = n
+            self.offset[node] = start
+            return
+
+        # Split along the axis where the centroids are most spread out ((x, y, z) * 2 is a point-sized box)
+        cbox = _union([centroids[i] * 2 for i in order[start:end]])
+        extents = [cbox[3] - cbox[0], cbox[4] - cbox[1], cbox[5] - cbox[2]]
+        axis = extents.index(max(extents))
+        if extents[axis] == 0:
+            # Every centroid coincides, so no split can separate them
+            self.count[node] = n
+            self.offset[node] = start
+            return
+
+        lo = cbox[axis]
+        scale = BINS / extents[axis]
+        bin_counts = [0] * BINS
+        bin_boxes = [None] * BINS
+        for i in order[start:end]:
+            b = min(BINS - 1, int((centroids[i][axis] - lo) * scale))
+            bin_counts[b] += 1
+            bin_boxes[b] = (
+                bounds[i] if bin_boxes[b] is None else _union([bin_boxes[b], bounds[i]])
+            )
+
+        # Sweep from the right to get the area and count of every suffix of bins
+        right_area = [0.0] * BINS
+        right_count = [0] * BINS
+        acc = None
+        total = 0
+        for b in range(BINS - 1, 0, -1):
+            if bin_boxes[b] is not None:
+                acc = bin_boxes[b] if acc is None else _union([acc, bin_boxes[b]])
+            total += bin_counts[b]
+            right_area[b] = _area(acc) if acc is not None else 0.0
+            right_count[b] = total
+
+        # Sweep from the left, costing a split after every bin
+        best_cost = inf
+        best_split = None
+        acc = None
+        total = 0
+        for b in range(BINS - 1):
+            if bin_boxes[b] is not None:
+                acc = bin_boxes[b] if acc is None else _union([acc, bin_boxes[b]])
+            total += bin_counts[b]
+            if total == 0 or right_count[b + 1] == 0:
+                continue
+            cost = _area(acc) * total + right_area[b + 1] * right_count[b + 1]
+            if cost < best_cost:
+                best_cost = cost
+                best_split = b
+
+        area = _area(box)
+        leaf_cost = n
+        split_cost = (
+            TRAVERSAL_COST + best_cost / area
+            if area > 0 and best_split is not None
+            else inf
+        )
+
+        if best_split is None or (split_cost >= leaf_cost and n <= self.max_leaf_size):
+            if n <= self.max_leaf_size:
+                self.count[node] = n
+                self.offset[node] = start
+                return
+            # No useful SAH split but too many items for a leaf: fall back to a median split
+            order[start:end] = sorted(
+                order[start:end], key=lambda i: centroids[i][axis]
+            )
+            mid = (start + end) // 2
+        else:
+            left = [
+                i
+                for i in order[start:end]
+                if min(BINS - 1, int((centroids[i][axis] - lo) * scale)) <= best_split
+            ]
+            right = [
+                i
+                for i in order[start:end]
+                if min(BINS - 1, int((centroids[i][axis] - lo) * scale)) > best_split
+            ]
+            order[start:end] = left + right
+            mid = start + len(left)
+
+        self.axis[node] = axis
+        self._build(order, start, mid, bounds, centroids)
+        self.offset[node] = len(self.count)
+        self._build(order, mid, end, bounds, centroids)
+
+    def _traverse(
+        self, ray, t_min: float, t_max: float, any_hit: bool, nearest=None, leaf=None
+    ):
+        if not self.items:
+            return None
+
+        origin = (ray.origin.x, ray.origin.y, ray.origin.z)
+        direction = (ray.direction.x, ray.direction.y, ray.direction.z)
+        inv = tuple(1 / d if d != 0 else inf for d in direction)
+        bounds = self.bounds
+        count = self.count
+        offset = self.offset
+        axis = self.axis
+        items = self.items
+        nearest = self.nearest if nearest is None else nearest
+
+        best = None
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if not _slabs(bounds, node, origin, direction, inv, t_min, t_max):
+                continue
+            n = count[node]
+            if n and leaf is not None:
+                for t, item in leaf(node, ray, t_min, t_max):
+                    # Hits in one leaf come back together, so each is checked against the latest t_max
+                    if t < t_max:
+                        if any_hit:
+                            return t, item
+                        t_max = t
+                        best = (t, item)
+            elif n:
+                start = offset[node]
+                for item in items[start : start + n]:
+                    t = nearest(item, ray, t_min, t_max)
+                    if t is not None:
+                        if any_hit:
+                            return t, item
+                        # Shrink the search to what is closer than this hit
+                        t_max = t
+                        best = (t, item)
+            elif direction[axis[node]] > 0:
+                # Visit the near child first so t_max shrinks sooner
+                stack.append(offset[node])
+                stack.append(node + 1)
+            else:
+                stack.append(node + 1)
+                stack.append(offset[node])
+        return best
+
+    def closest_hit(
+        self, ray, t_min: float = 0, t_max: float = inf, nearest=None, leaf=None
+    ) -> tuple:
+        """
+        Finds the nearest item the ray hits within [t_min, t_max).
+
+            Parameters:
+                ray (Ray)
+                t_min (float)
+                t_max (float)
+                nearest (function): Replaces the hierarchy's nearest for this search
+                leaf (function): leaf(node, ray, t_min, t_max) returns (t, item) for every hit in range
+                    within a leaf, for hierarchies that decode their own leaves; replaces nearest
+
+            Returns:
+                (t, item) (tuple): None if nothing is hit
+        """
+
+        return self._traverse(ray, t_min, t_max, False, nearest, leaf)
+
+    def any_hit(
+        self, ray, t_min: float = 0, t_max: float = inf, nearest=None, leaf=None
+    ) -> tuple:
+        """
+        Finds any item the ray hits within [t_min, t_max), stopping at the first one found.
+
+            Parameters:
+                ray (Ray)
+                t_min (float)
+                t_max (float)
+                nearest (function): Replaces the hierarchy's nearest for this search
+                leaf (function): As for closest_hit
+
+            Returns:
+                (t, item) (tuple): None if nothing is hit
+        """
+
+        return self._traverse(ray, t_min, t_max, True, nearest, leaf)
+
+    def all_hits(
+        self, ray, t_min: float = 0, t_max: float = inf, nearest=None, leaf=None
+    ) -> list:
+        """
+        Finds every item the ray hits within [t_min, t_max), in no particular order.
+
+            Parameters:
+                ray (Ray)
+                t_min (float)
+                t_max (float)
+                nearest (function): Replaces the hierarchy's nearest for this search
+                leaf (function): As for closest_hit
+
+            Returns:
+                hits (list): (t, item) for each item hit
+        """
+
+        if not self.items:
+            return []
+        if nearest is None:
+            nearest = self.nearest
+
+        origin = (ray.origin.x, ray.origin.y, ray.origin.z)
+        direction = (ray.direction.x, ray.direction.y, ray.direction.z)
+        inv = tuple(1 / d if d != 0 else inf for d in direction)
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if not _slabs(self.bounds, node, origin, direction, inv, t_min, t_max):
+                continue
+            n = self.count[node]
+            if n and leaf is not None:
+                found.extend(leaf(node, ray, t_min, t_max))
+            elif n:
+                start = self.offset[node]
+                for item in self.items[start : start + n]:
+                    t = nearest(item, ray, t_min, t_max)
+                    if t is not None:
+                        found.append((t, item))
+            else:
+                stack.append(self.offset[node])
+                stack.append(node + 1)
+        return found
+
+    def containing(self, p) -> list:
+        """
+        Finds the items in every leaf whose bounds contain a point. Items are candidates: a leaf's
+        bounds can contain the point even where a particular item's bounds do not.
+
+            Parameters:
+                p (Tuple): Tuple with type=point
+
+            Returns:
+                items (list)
+        """
+
+        if not self.items:
+            return []
+
+        x, y, z = p.x, p.y, p.z
+        bounds = self.bounds
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            i = 6 * node
+            if not (
+                bounds[i] <= x <= bounds[i + 3]
+                and bounds[i + 1] <= y <= bounds[i + 4]
+                and bounds[i + 2] <= z <= bounds[i + 5]
+            ):
+                continue
+            n = self.count[node]
+            if n:
+                start = self.offset[node]
+                found.extend(self.items[start : start + n])
+            else:
+                stack.append(self.offset[node])
+                stack.append(node + 1)
+        return found
+
+
+def _slabs(
+    bounds: array, node: int, origin: tuple, direction: tuple, inv: tuple, t_min, t_max
+) -> bool:
+    # Ray-box test: clip [t_min, t_max) against the three pairs of planes bounding the node
+    i = 6 * node
+    for a in range(3):
+        lo = bounds[i + a]
+        hi = bounds[i + a + 3]
+        if direction[a] == 0:
+            if origin[a] < lo or origin[a] > hi:
+                return False
+            continue
+        t0 = (lo - origin[a]) * inv[a]
+        t1 = (hi - origin[a]) * inv[a]
+        if t0 > t1:
+            t0, t1 = t1, t0
+        if t0 > t_min:
+            t_min = t0
+        if t1 < t_max:
+            t_max = t1
+        if t_min > t_max:
+            return False
+    return True
+
+
+def _union(boxes: list) -> tuple:
+    return (
+        min(b[0] for b in boxes),
+        min(b[1] for b in boxes),
+        min(b[2] for b in boxes),
+        max(b[3] for b in boxes),
+        max(b[4] for b in boxes),
+        max(b[5] for b in boxes),
+    )
+
+
+def _area(box: tuple) -> float:
+    dx = box[3] - box[0]
+    dy = box[4] - box[1]
+    dz = box[5] - box[2]
+    return 2 * (dx * dy + dy * dz + dz * dx)
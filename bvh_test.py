@@ -0,0 +1,190 @@
+import pickle
+from random import Random
+from bvh import BVH
+from ray import Ray
+from sphere import Sphere
+from transformations import translation, scaling
+from tuple import point, vector, normalize
+from world import World
+import unittest
+
+
+def random_spheres(count: int, seed: int = 7) -> list:
+    rng = Random(seed)
+    spheres = []
+    for _ in range(count):
+        s = Sphere()
+        s.set_transform(
+            translation(
+                rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10)
+            )
+            * scaling(*(rng.uniform(0.2, 1) for _ in range(3)))
+        )
+        spheres.append(s)
+    return spheres
+
+
+def random_rays(count: int, seed: int = 11) -> list:
+    rng = Random(seed)
+    return [
+        Ray(
+            point(rng.uniform(-12, 12), rng.uniform(-12, 12), -20),
+            normalize(vector(rng.uniform(-0.5, 0.5), rng.uniform(-0.5, 0.5), 1)),
+        )
+        for _ in range(count)
+    ]
+
+
+def to_box(bounds: tuple) -> tuple:
+    minimum, maximum = bounds
+    return (minimum.x, minimum.y, minimum.z, maximum.x, maximum.y, maximum.z)
+
+
+class Tests(unittest.TestCase):
+    def test_scenario1(self):
+        """
+        Scenario: The bounds of a transformed sphere
+            Given s ← sphere()
+            And set_transform(s, translation(1, 2, 3) * scaling(2, 3, 4))
+            Then bounds(s) = (point(-1, -1, -1), point(3, 5, 7))
+        """
+
+        s = Sphere()
+        s.set_transform(translation(1, 2, 3) * scaling(2, 3, 4))
+        minimum, maximum = s.bounds()
+        self.assertEqual(minimum, point(-1, -1, -1))
+        self.assertEqual(maximum, point(3, 5, 7))
+
+    def test_scenario2(self):
+        """
+        Scenario: The closest hit through a BVH matches a linear search
+            Given spheres ← 200 random spheres
+            And b ← bvh(spheres)
+            Then for every ray, closest_hit(b, ray) is the nearest hit over all spheres
+        """
+
+        spheres = random_spheres(200)
+        b = BVH(spheres, [to_box(s.bounds()) for s in spheres])
+        for r in random_rays(200):
+            expected = None
+            for s in spheres:
+                t = r.nearest(s)
+                if t is not None and (expected is None or t < expected[0]):
+                    expected = (t, s)
+            found = b.closest_hit(r)
+            if expected is None:
+                self.assertIsNone(found)
+            else:
+                self.assertAlmostEqual(found[0], expected[0])
+                self.assertIs(found[1], expected[1])
+
+    def test_scenario3(self):
+        """
+        Scenario: Any-hit queries respect t_max
+            Given s ← sphere() with transform translation(0, 0, 10)
+            And b ← bvh([s])
+            And r ← ray(point(0, 0, 0), vector(0, 0, 1))
+            Then any_hit(b, r, 0, 8) is nothing
+            And any_hit(b, r, 0, 12) = (9, s)
+        """
+
+        s = Sphere()
+        s.set_transform(translation(0, 0, 10))
+        b = BVH([s], [to_box(s.bounds())])
+        r = Ray(point(0, 0, 0), vector(0, 0, 1))
+        self.assertIsNone(b.any_hit(r, 0, 8))
+        self.assertEqual(b.any_hit(r, 0, 12), (9, s))
+
+    def test_scenario4(self):
+        """
+        Scenario: A world rebuilds its BVH when objects move or are added
+            Given w ← world with 20 random spheres
+            And r ← ray(point(0, 0, -50), vector(0, 0, 1))
+            And blocker ← sphere()
+            When blocker is added to w with transform translation(0, 0, -40)
+            Then closest_hit(w, r).object = blocker
+            When set_transform(blocker, translation(0, 100, 0))
+            Then closest_hit(w, r) does not hit blocker
+        """
+
+        w = World(random_spheres(20))
+        r = Ray(point(0, 0, -50), vector(0, 0, 1))
+        self.assertIsNotNone(w.bvh())
+        blocker = Sphere()
+        blocker.set_transform(translation(0, 0, -40))
+        w.objects.append(blocker)
+        self.assertIs(w.closest_hit(r).object, blocker)
+        blocker.set_transform(translation(0, 100, 0))
+        nearest = w.closest_hit(r)
+        self.assertTrue(nearest is None or nearest.object is not blocker)
+
+    def test_scenario5(self):
+        """
+        Scenario: A world rebuilds its BVH when objects are replaced, and only then
+            Given spare ← sphere() with transform translation(0, 0, -40)
+            And w ← world with 20 random spheres
+            And r ← ray(point(0, 0, -50), vector(0, 0, 1))
+            When w.objects[3] ← spare
+            Then closest_hit(w, r).object = spare
+            When spare is popped from w and a random sphere is appended
+            Then closest_hit(w, r) does not hit spare
+            When a sphere outside w is created and moved
+            Then bvh(w) is unchanged
+        """
+
+        spare = Sphere()
+        spare.set_transform(translation(0, 0, -40))
+        w = World(random_spheres(20))
+        r = Ray(point(0, 0, -50), vector(0, 0, 1))
+        self.assertIsNotNone(w.bvh())
+        w.objects[3] = spare
+        self.assertIs(w.closest_hit(r).object, spare)
+        self.assertIs(w.any_hit(r), spare)
+        w.objects.pop(3)
+        w.objects.append(random_spheres(1, 8)[0])
+        nearest = w.closest_hit(r)
+        self.assertTrue(nearest is None or nearest.object is not spare)
+
+        bvh = w.bvh()
+        Sphere().set_transform(translation(0, 0, -40))
+        self.assertIs(w.bvh(), bvh)
+
+    def test_scenario6(self):
+        """
+        Scenario: A world sent to another process still tracks changes to its objects
+            Given w ← unpickle(pickle(world with 20 random spheres))
+            And r ← ray(point(0, 0, -50), vector(0, 0, 1))
+            And blocker ← sphere() with transform translation(0, 0, -40)
+            When w.objects[0] ← blocker
+            Then closest_hit(w, r).object = blocker
+        """
+
+        w = pickle.loads(pickle.dumps(World(random_spheres(20))))
+        r = Ray(point(0, 0, -50), vector(0, 0, 1))
+        self.assertIsNotNone(w.bvh())
+        blocker = Sphere()
+        blocker.set_transform(translation(0, 0, -40))
+        w.objects[0] = blocker
+        self.assertIs(w.closest_hit(r).object, blocker)
+
+    def test_scenario7(self):
+        """
+        Scenario: A world's BVH only goes stale when one of its own objects changes
+            Given w1 ← world with 20 random spheres
+            And w2 ← world with 20 other random spheres
+            When w1.objects[0] is moved
+            Then bvh(w2) is unchanged
+            And bvh(w1) is rebuilt
+        """
+
+        w1 = World(random_spheres(20))
+        w2 = World(random_spheres(20, 8))
+        first = w1.bvh()
+        second = w2.bvh()
+        w1.objects[0].set_transform(translation(0, 100, 0))
+        self.assertIs(w2.bvh(), second)
+        self.assertIsNot(w1.bvh(), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
 from copy import copy
 from canvas import Canvas
 from math import tan
-from matrix import identity_matrix, inverse
+from multiprocessing import Pool
+from affine import AffineTransform, is_affine
+from matrix import Matrix, identity_matrix, inverse
 from ray import Ray
 from tuple import point, normalize
 from world import World
@@ -25,6 +27,20 @@ class Camera:
 
         self.pixel_size = (self.half_width * 2) / self.hsize
 
+    @property
+    def transform(self) -> Matrix:
+        return self._transform
+
+    @transform.setter
+    def transform(self, transformation: Matrix) -> None:
+        # The camera doesn't move during a render, so invert once instead of per pixel
+        self._transform = transformation
+        if is_affine(transformation):
+            self.inverse = AffineTransform.from_matrix(transformation).inverse()
+        else:
+            self.inverse = inverse(transformation)
+        self.origin = self.inverse * point(0, 0, 0)
+
     def ray_for_pixel(self, x: int, y: int) -> Ray:
         """
         Returns a new ray that starts at the camera and passes through the indicated (x, y) pixel on the canvas.
@@ -43,18 +59,107 @@ class Camera:
         world_x = self.half_width - xoffset
         world_y = self.half_height - yoffset
 
-        pixel = inverse(self.transform) * point(world_x, world_y, -1)
-        origin = inverse(self.transform) * point(0, 0, 0)
+        pixel = self.inverse * point(world_x, world_y, -1)
+        origin = self.origin
         direction = normalize(pixel - origin)
 
         return Ray(origin, direction)
 
-    def render(self, world: World) -> Canvas:
+    def pixel_seed(self, x: int, y: int) -> int:
+        """
+        Seed for the random choices made while shading a pixel. It depends only on the pixel, so
+        serial, tiled and streamed renders of the same scene match exactly.
+
+            Parameters:
+                x (int)
+                y (int)
+
+            Returns:
+                seed (int)
+        """
+
+        return y * self.hsize + x
+
+    def rays_for_tile(self, x0: int, y0: int, x1: int, y1: int) -> tuple:
+        """
+        Generates the primary rays through every pixel in [x0, x1) x [y0, y1) at once, row by row.
+
+            Parameters:
+                x0 (int)
+                y0 (int)
+                x1 (int)
+                y1 (int)
+
+            Returns:
+                (origins, directions) (tuple): TupleArrays, one entry per pixel
+        """
+
+        # Imported here so the scalar renderer keeps working without NumPy
+        import numpy as np
+        from arrays import TupleArray, points, normalize as normalize_all
+
+        xs, ys = np.meshgrid(np.arange(x0, x1), np.arange(y0, y1))
+        world_x = self.half_width - (xs.ravel() + 0.5) * self.pixel_size
+        world_y = self.half_height - (ys.ravel() + 0.5) * self.pixel_size
+
+        pixels = self.inverse * points(world_x, world_y, -1)
+        origin = self.origin
+        origins = TupleArray(
+            np.repeat([[origin.x], [origin.y], [origin.z], [origin.w]], len(pixels), 1)
+        )
+        directions = normalize_all(pixels - origin)
+        return origins, directions
+
+    def render_tile(self, world: World, x0: int, y0: int, x1: int, y1: int) -> Canvas:
+        """
+        Renders the pixels in [x0, x1) x [y0, y1).
+
+            Parameters:
+                world (World)
+                x0 (int)
+                y0 (int)
+                x1 (int)
+                y1 (int)
+
+            Returns:
+                tile (Canvas): (x1 - x0) x (y1 - y0) pixels
+        """
+
+        tile = Canvas(x1 - x0, y1 - y0)
+        world.reset_shadow_cache()
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                ray = self.ray_for_pixel(x, y)
+                tile.write_pixel(
+                    x - x0, y - y0, world.color_at(ray, self.pixel_seed(x, y))
+                )
+        return tile
+
+    def tiles(self, tile_size: int) -> list:
+        """
+        Splits the image into tiles of at most tile_size x tile_size pixels.
+
+            Parameters:
+                tile_size (int)
+
+            Returns:
+                tiles (list): (x0, y0, x1, y1) for each tile
+        """
+
+        return [
+            (x, y, min(x + tile_size, self.hsize), min(y + tile_size, self.vsize))
+            for y in range(0, self.vsize, tile_size)
+            for x in range(0, self.hsize, tile_size)
+        ]
+
+    def render(self, world: World, workers: int = 1, tile_size: int = 32) -> Canvas:
         """
         Render an image of the given world.
 
             Parameters:
                 world (World)
+                workers (int): Number of processes to render tiles in; 1 renders serially
+                tile_size (int): Width and height of each tile handed to a worker
 
             Returns:
                 image (Canvas)
@@ -62,10 +167,83 @@ class Camera:
 
         image = Canvas(self.hsize, self.vsize)
 
-        for y in range(self.vsize):
-            for x in range(self.hsize):
-                ray = self.ray_for_pixel(x, y)
-                color = world.color_at(ray)
-                image.write_pixel(x, y, color)
+        if workers <= 1:
+            world.reset_shadow_cache()
+            for y in range(self.vsize):
+                for x in range(self.hsize):
+                    ray = self.ray_for_pixel(x, y)
+                    color = world.color_at(ray, self.pixel_seed(x, y))
+                    image.write_pixel(x, y, color)
+            return image
+
+        # Every worker receives the camera and world once, then only tile coordinates and finished tiles travel
+        with Pool(workers, initializer=_init_worker, initargs=(self, world)) as pool:
+            for (x0, y0, _, _), tile, counts in pool.imap_unordered(
+                _render_tile, self.tiles(tile_size)
+            ):
+                image.write_block(x0, y0, tile)
+                _add_shadow_counts(world, counts)
 
         return image
+
+    def render_stream(
+        self, world: World, sink, band_height: int = 16, workers: int = 1
+    ) -> None:
+        """
+        Renders the image in full-width bands and hands each one to a sink as soon as it is
+        finished, top to bottom, so only O(width * band_height) pixels are held at once.
+
+            Parameters:
+                world (World)
+                sink (PPMWriter): Anything with write_rows(Canvas) and close(), such as PNGWriter
+                band_height (int): Rows per band
+                workers (int): Number of processes to render bands in; 1 renders serially
+
+            Returns:
+                None
+        """
+
+        bands = [
+            (0, y, self.hsize, min(y + band_height, self.vsize))
+            for y in range(0, self.vsize, band_height)
+        ]
+
+        if workers <= 1:
+            for band in bands:
+                sink.write_rows(self.render_tile(world, *band))
+        else:
+            with Pool(
+                workers, initializer=_init_worker, initargs=(self, world)
+            ) as pool:
+                # imap yields in submission order, so bands reach the sink top to bottom
+                for _, band, counts in pool.imap(_render_tile, bands):
+                    sink.write_rows(band)
+                    _add_shadow_counts(world, counts)
+
+        sink.close()
+
+
+# Per-process state for parallel rendering, set once by the pool initializer
+_worker_camera = None
+_worker_world = None
+
+
+def _init_worker(camera: Camera, world: World) -> None:
+    global _worker_camera, _worker_world
+    _worker_camera = camera
+    _worker_world = world
+
+
+def _render_tile(tile: tuple) -> tuple:
+    # The worker's shadow cache counters only change in the worker, so send back this tile's share
+    world = _worker_world
+    hits = world.shadow_cache_hits
+    misses = world.shadow_cache_misses
+    image = _worker_camera.render_tile(world, *tile)
+    counts = (world.shadow_cache_hits - hits, world.shadow_cache_misses - misses)
+    return tile, image, counts
+
+
+def _add_shadow_counts(world: World, counts: tuple) -> None:
+    world.shadow_cache_hits += counts[0]
+    world.shadow_cache_misses += counts[1]
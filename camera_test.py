@@ -1,7 +1,8 @@
 from math import pi, sqrt
+from io import BytesIO
 from camera import Camera
-from canvas import Color
-from matrix import identity_matrix
+from canvas import Color, PPMWriter
+from matrix import identity_matrix, inverse
 from transformations import rotation_y, translation, view_transform
 from tuple import point, vector
 from utils import equal
@@ -118,6 +119,113 @@ class Tests(unittest.TestCase):
         image = c.render(w)
         self.assertEqual(image.pixel_at(5, 5), Color(0.38066, 0.47583, 0.2855))
 
+    def test_scenario8(self):
+        """
+        Scenario: Rendering in parallel tiles matches rendering serially
+          Given w ← default_world()
+            And c ← camera(11, 7, π/2)
+            And c.transform ← view_transform(point(0, 0, -5), point(0, 0, 0), vector(0, 1, 0))
+          When serial ← render(c, w)
+            And parallel ← render(c, w, workers=2, tile_size=4)
+          Then every pixel of parallel is identical to serial
+        """
+
+        w = default_world()
+        c = Camera(11, 7, pi / 2)
+        c.transform = view_transform(point(0, 0, -5), point(0, 0, 0), vector(0, 1, 0))
+        serial = c.render(w)
+        parallel = c.render(w, workers=2, tile_size=4)
+        for y in range(c.vsize):
+            for x in range(c.hsize):
+                a = serial.pixel_at(x, y)
+                b = parallel.pixel_at(x, y)
+                self.assertEqual((a.red, a.green, a.blue), (b.red, b.green, b.blue))
+
+    def test_scenario9(self):
+        """
+        Scenario: The camera caches its inverse transform and origin
+          Given c ← camera(201, 101, π/2)
+          When c.transform ← rotation_y(π/4) * translation(0, -2, 5)
+          Then c.inverse = inverse(c.transform)
+            And c.origin = point(0, 2, -5)
+        """
+
+        c = Camera(201, 101, pi / 2)
+        c.transform = rotation_y(pi / 4) * translation(0, -2, 5)
+        self.assertEqual(c.inverse, inverse(c.transform))
+        self.assertEqual(c.origin, point(0, 2, -5))
+
+    def test_scenario10(self):
+        """
+        Scenario: Generating the rays for a tile at once
+          Given c ← camera(201, 101, π/2)
+            And c.transform ← rotation_y(π/4) * translation(0, -2, 5)
+          When (origins, directions) ← rays_for_tile(c, 98, 48, 102, 51)
+          Then each (origins[i], directions[i]) matches ray_for_pixel for its pixel, row by row
+        """
+
+        c = Camera(201, 101, pi / 2)
+        c.transform = rotation_y(pi / 4) * translation(0, -2, 5)
+        origins, directions = c.rays_for_tile(98, 48, 102, 51)
+        self.assertEqual(len(directions), 12)
+        i = 0
+        for y in range(48, 51):
+            for x in range(98, 102):
+                r = c.ray_for_pixel(x, y)
+                self.assertEqual(origins[i], r.origin)
+                self.assertEqual(directions[i], r.direction)
+                i += 1
+
+    def test_scenario11(self):
+        """
+        Scenario: Streaming a render writes the same image as rendering first
+          Given w ← default_world()
+            And c ← camera(11, 9, π/2)
+            And c.transform ← view_transform(point(0, 0, -5), point(0, 0, 0), vector(0, 1, 0))
+          When render_stream(c, w, ppm_writer(file), band_height=2)
+          Then file = write_ppm(render(c, w))
+            And the same holds with 2 workers
+        """
+
+        w = default_world()
+        c = Camera(11, 9, pi / 2)
+        c.transform = view_transform(point(0, 0, -5), point(0, 0, 0), vector(0, 1, 0))
+        expected = BytesIO()
+        c.render(w).write_ppm(expected)
+        for workers in (1, 2):
+            f = BytesIO()
+            c.render_stream(w, PPMWriter(f, 11, 9), band_height=2, workers=workers)
+            self.assertEqual(f.getvalue(), expected.getvalue())
+
+    def test_scenario12(self):
+        """
+        Scenario: Shadow cache counters include the tests made in worker processes
+          Given c ← camera(11, 7, π/2)
+            And c.transform ← view_transform(point(0, 0, -5), point(0, 0, 0), vector(0, 1, 0))
+            And serial ← default_world()
+            And parallel ← default_world()
+          When render(c, serial)
+            And render(c, parallel, workers=2, tile_size=4)
+          Then parallel's shadow cache hits and misses add up to serial's
+            And so do the hits and misses after render_stream(c, parallel, workers=2)
+        """
+
+        c = Camera(11, 7, pi / 2)
+        c.transform = view_transform(point(0, 0, -5), point(0, 0, 0), vector(0, 1, 0))
+        serial = default_world()
+        parallel = default_world()
+        c.render(serial)
+        c.render(parallel, workers=2, tile_size=4)
+        tests = serial.shadow_cache_hits + serial.shadow_cache_misses
+        self.assertGreater(tests, 0)
+        self.assertEqual(
+            parallel.shadow_cache_hits + parallel.shadow_cache_misses, tests
+        )
+        c.render_stream(parallel, PPMWriter(BytesIO(), 11, 7), workers=2)
+        self.assertEqual(
+            parallel.shadow_cache_hits + parallel.shadow_cache_misses, 2 * tests
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
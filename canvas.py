@@ -1,3 +1,8 @@
+from __future__ import annotations
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+import struct
+import zlib
 from tuple import Color
 from utils import interpolate
 
@@ -6,7 +11,15 @@ class Canvas:
     def __init__(self, width: int, height: int, fill: Color = Color(0, 0, 0)):
         self.width = width
         self.height = height
-        self.canvas = [fill for pixel in range(width * height)]
+        # Contiguous float32 RGB triples, row by row
+        self.buffer = array("f", [fill.red, fill.green, fill.blue]) * (width * height)
+
+    @property
+    def canvas(self) -> list:
+        # Every pixel as a Color, for callers that want to iterate over them
+        return [
+            self.pixel_at(x, y) for y in range(self.height) for x in range(self.width)
+        ]
 
     def write_pixel(self, x: int, y: int, color: Color) -> None:
         """
@@ -20,7 +33,11 @@ class Canvas:
                 None
         """
 
-        self.canvas[y * self.width + x] = color
+        i = 3 * (y * self.width + x)
+        buffer = self.buffer
+        buffer[i] = color.red
+        buffer[i + 1] = color.green
+        buffer[i + 2] = color.blue
 
     def pixel_at(self, x: int, y: int) -> Color:
         """
@@ -34,9 +51,59 @@ class Canvas:
                 pixel (Color)
         """
 
-        pixel = self.canvas[y * self.width + x]
+        i = 3 * (y * self.width + x)
+        buffer = self.buffer
+        pixel = Color(buffer[i], buffer[i + 1], buffer[i + 2])
         return pixel
 
+    def write_block(self, x: int, y: int, block: Canvas) -> None:
+        """
+        Copies a smaller canvas into this one with its top-left corner at (x, y), a row at a time.
+
+            Parameters:
+                x (int)
+                y (int)
+                block (Canvas)
+
+            Returns:
+                None
+        """
+
+        if (
+            x < 0
+            or y < 0
+            or x + block.width > self.width
+            or y + block.height > self.height
+        ):
+            raise ValueError("Block does not fit inside canvas")
+        row = 3 * block.width
+        for r in range(block.height):
+            start = 3 * ((y + r) * self.width + x)
+            self.buffer[start : start + row] = block.buffer[r * row : (r + 1) * row]
+
+    def read_block(self, x: int, y: int, width: int, height: int) -> Canvas:
+        """
+        Copies the width x height region with its top-left corner at (x, y) into a new canvas.
+
+            Parameters:
+                x (int)
+                y (int)
+                width (int)
+                height (int)
+
+            Returns:
+                block (Canvas)
+        """
+
+        if x < 0 or y < 0 or x + width > self.width or y + height > self.height:
+            raise ValueError("Block does not fit inside canvas")
+        block = Canvas(width, height)
+        row = 3 * width
+        for r in range(height):
+            start = 3 * ((y + r) * self.width + x)
+            block.buffer[r * row : (r + 1) * row] = self.buffer[start : start + row]
+        return block
+
     def to_ppm(self, as_str: bool = True) -> str:
         """
         Converts canvas to PPM file format.
@@ -74,5 +141,266 @@ class Canvas:
             return "\n".join(ppm)
         return ppm
 
+    def write_ppm(self, fileobj, binary: bool = True) -> None:
+        """
+        Streams the canvas to a file as PPM, one row at a time.
+
+            Parameters:
+                fileobj (file): Opened in binary mode
+                binary (bool): True for binary P6, False for ASCII P3
+
+            Returns:
+                None
+        """
+
+        writer = PPMWriter(fileobj, self.width, self.height, binary)
+        writer.write_rows(self)
+        writer.close()
+
+    def write_png(
+        self, path: str, compression_level: int = 6, threads: int = 1
+    ) -> None:
+        """
+        Writes the canvas as an 8-bit RGB PNG, streaming rows through the encoder.
+
+            Parameters:
+                path (str)
+                compression_level (int): zlib level, 0-9
+                threads (int): Number of row bands to compress in parallel
+
+            Returns:
+                None
+        """
+
+        with open(path, "wb") as f:
+            writer = PNGWriter(f, self.width, self.height, compression_level, threads)
+            writer.write_rows(self)
+            writer.close()
+
     def __repr__(self):
         return f"{str(self.canvas)}"
+
+
+class PPMWriter:
+    """
+    Writes PPM image data incrementally, so rows can be written as soon as they are available.
+    """
+
+    def __init__(self, fileobj, width: int, height: int, binary: bool = True):
+        self.fileobj = fileobj
+        self.width = width
+        self.height = height
+        self.binary = binary
+        magic = "P6" if binary else "P3"
+        fileobj.write(f"{magic}\n{width} {height}\n255\n".encode("ascii"))
+
+    def write_rows(self, rows: Canvas) -> None:
+        """
+        Writes every row of a canvas that is as wide as the image.
+
+            Parameters:
+                rows (Canvas)
+
+            Returns:
+                None
+        """
+
+        if rows.width != self.width:
+            raise ValueError("Rows must be as wide as the image")
+        stride = 3 * rows.width
+        for y in range(rows.height):
+            row = quantize(rows.buffer[y * stride : (y + 1) * stride])
+            if self.binary:
+                self.fileobj.write(row)
+            else:
+                self.fileobj.write(_wrap_p3(row).encode("ascii"))
+
+    def close(self) -> None:
+        """
+        Finishes the image. The file object itself is left open.
+        """
+
+        if not self.binary:
+            # PPM files are terminated by a newline character
+            self.fileobj.write(b"\n")
+
+
+class PNGWriter:
+    """
+    Writes PNG image data incrementally using only zlib and struct.
+
+    Rows are filtered as they arrive and grouped into bands of band_height rows. Each band is
+    deflated independently (zlib releases the GIL, so bands compress in parallel threads) and
+    written as its own IDAT chunk, so at most threads * band_height rows are held in memory.
+    """
+
+    def __init__(
+        self,
+        fileobj,
+        width: int,
+        height: int,
+        compression_level: int = 6,
+        threads: int = 1,
+        band_height: int = 64,
+    ):
+        self.fileobj = fileobj
+        self.width = width
+        self.height = height
+        self.compression_level = compression_level
+        self.threads = max(1, threads)
+        self.band_height = band_height
+        self._previous = bytes(3 * width)
+        self._rows = 0
+        self._band = []
+        self._bands = []
+        self._adler = 1
+
+        fileobj.write(b"\x89PNG\r\n\x1a\n")
+        # 8 bits per channel, color type 2 (RGB), default compression/filter, no interlace
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        # zlib stream header; the bands that follow are raw deflate data
+        self._chunk(b"IDAT", b"\x78\x9c")
+
+    def write_rows(self, rows: Canvas) -> None:
+        """
+        Filters and queues every row of a canvas that is as wide as the image.
+
+            Parameters:
+                rows (Canvas)
+
+            Returns:
+                None
+        """
+
+        if rows.width != self.width:
+            raise ValueError("Rows must be as wide as the image")
+        if self._rows + rows.height > self.height:
+            raise ValueError("More rows than the image height")
+        stride = 3 * rows.width
+        for y in range(rows.height):
+            row = quantize(rows.buffer[y * stride : (y + 1) * stride])
+            self._band.append(_filter_row(row, self._previous))
+            self._previous = row
+            self._rows += 1
+            if len(self._band) == self.band_height:
+                self._queue_band()
+
+    def close(self) -> None:
+        """
+        Flushes the remaining rows and finishes the image. The file object itself is left open.
+        """
+
+        if self._rows != self.height:
+            raise ValueError("Fewer rows written than the image height")
+        self._queue_band()
+        self._flush()
+        # An empty final deflate block ends the stream, followed by the Adler-32 of the filtered data
+        final = zlib.compressobj(self.compression_level, zlib.DEFLATED, -15).flush()
+        self._chunk(b"IDAT", final + struct.pack(">I", self._adler))
+        self._chunk(b"IEND", b"")
+
+    def _queue_band(self) -> None:
+        if not self._band:
+            return
+        band = b"".join(self._band)
+        self._band = []
+        self._adler = zlib.adler32(band, self._adler)
+        self._bands.append(band)
+        if len(self._bands) == self.threads:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._bands:
+            return
+        if self.threads > 1 and len(self._bands) > 1:
+            with ThreadPoolExecutor(self.threads) as pool:
+                compressed = list(pool.map(self._deflate, self._bands))
+        else:
+            compressed = [self._deflate(band) for band in self._bands]
+        self._bands = []
+        for data in compressed:
+            self._chunk(b"IDAT", data)
+
+    def _deflate(self, band: bytes) -> bytes:
+        # A sync flush ends on a byte boundary without a final block, so bands can be concatenated
+        compressor = zlib.compressobj(self.compression_level, zlib.DEFLATED, -15)
+        return compressor.compress(band) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def _chunk(self, tag: bytes, data: bytes) -> None:
+        self.fileobj.write(struct.pack(">I", len(data)))
+        self.fileobj.write(tag)
+        self.fileobj.write(data)
+        self.fileobj.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(tag))))
+
+
+def quantize(channels) -> bytes:
+    """
+    Scales and clamps channels from [0, 1] to [0, 255], the same way as to_ppm.
+
+        Parameters:
+            channels (array): Floats
+
+        Returns:
+            quantized (bytes)
+    """
+
+    quantized = bytes(
+        [0 if v <= 0 else 255 if v >= 1 else round(v * 255) for v in channels]
+    )
+    return quantized
+
+
+def _wrap_p3(row: bytes) -> str:
+    # P3 lines may not be longer than 70 characters
+    lines = []
+    line = ""
+    for value in row:
+        token = str(value)
+        if not line:
+            line = token
+        elif len(line) + 1 + len(token) > 70:
+            lines.append(line)
+            line = token
+        else:
+            line = f"{line} {token}"
+    lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+# abs() of each byte read as a signed value, for scoring filtered rows
+_SIGNED_ABS = bytes(min(b, 256 - b) for b in range(256))
+
+
+def _filter_row(row: bytes, previous: bytes) -> bytes:
+    """
+    Applies whichever PNG filter (None, Sub, Up or Average) leaves the smallest sum of absolute
+    differences, the usual heuristic for what will compress best.
+
+        Parameters:
+            row (bytes): Quantized RGB row
+            previous (bytes): The row above, or zeros for the first row
+
+        Returns:
+            filtered (bytes): Filter type byte followed by the filtered row
+    """
+
+    # Whole rows are treated as big integers so every byte is filtered at once
+    n = len(row)
+    high = int.from_bytes(b"\x80" * n, "big")
+    low = int.from_bytes(b"\x7f" * n, "big")
+    raw = int.from_bytes(row, "big")
+    up = int.from_bytes(previous, "big")
+    # Shifting right by one pixel (3 bytes) lines each byte up with the one to its left
+    left = raw >> 24
+
+    def subtract(a: int, b: int) -> bytes:
+        # Per-byte (a - b) mod 256 without borrows crossing byte boundaries
+        return (((a | high) - (b & low)) ^ ((a ^ b ^ high) & high)).to_bytes(n, "big")
+
+    # Per-byte floor((a + b) / 2), which can never carry into the next byte
+    average = (left & up) + (((left ^ up) & int.from_bytes(b"\xfe" * n, "big")) >> 1)
+
+    candidates = (row, subtract(raw, left), subtract(raw, up), subtract(raw, average))
+    scores = [sum(c.translate(_SIGNED_ABS)) for c in candidates]
+    best = scores.index(min(scores))
+    return bytes([best]) + candidates[best]
@@ -1,6 +1,59 @@
-from canvas import Canvas
+from io import BytesIO
+from random import Random
+from canvas import Canvas, PNGWriter, quantize
 from tuple import Color
+import struct
 import unittest
+import zlib
+
+
+def decode_png(data: bytes) -> tuple:
+    """
+    Minimal PNG reader for 8-bit RGB images written without interlacing.
+
+        Parameters:
+            data (bytes)
+
+        Returns:
+            (width, height, pixels) (tuple): pixels holds the unfiltered RGB bytes, row by row
+    """
+
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    i = 8
+    idat = b""
+    while i < len(data):
+        (length,) = struct.unpack(">I", data[i : i + 4])
+        tag = data[i + 4 : i + 8]
+        chunk = data[i + 8 : i + 8 + length]
+        (crc,) = struct.unpack(">I", data[i + 8 + length : i + 12 + length])
+        assert crc == zlib.crc32(tag + chunk)
+        if tag == b"IHDR":
+            width, height = struct.unpack(">II", chunk[:8])
+        elif tag == b"IDAT":
+            idat += chunk
+        i += 12 + length
+
+    raw = zlib.decompress(idat)
+    stride = 3 * width
+    previous = bytearray(stride)
+    pixels = bytearray()
+    for y in range(height):
+        kind = raw[y * (stride + 1)]
+        row = bytearray(raw[y * (stride + 1) + 1 : (y + 1) * (stride + 1)])
+        for x in range(stride):
+            left = row[x - 3] if x >= 3 else 0
+            up = previous[x]
+            if kind == 1:
+                row[x] = (row[x] + left) % 256
+            elif kind == 2:
+                row[x] = (row[x] + up) % 256
+            elif kind == 3:
+                row[x] = (row[x] + (left + up) // 2) % 256
+            else:
+                assert kind == 0
+        pixels += row
+        previous = row
+    return width, height, bytes(pixels)
 
 
 class Tests(unittest.TestCase):
@@ -128,6 +181,123 @@ class Tests(unittest.TestCase):
         ppm = c.to_ppm()
         self.assertEqual(ppm[-1], "\n")
 
+    def test_scenario7(self):
+        """
+        Scenario: Writing a block of pixels into a canvas
+            Given c ← canvas(5, 4)
+            And block ← canvas(2, 2, color(0.5, 0.25, 1))
+            When write_block(c, 3, 1, block)
+            Then pixel_at(c, 3, 1) = color(0.5, 0.25, 1)
+            And pixel_at(c, 4, 2) = color(0.5, 0.25, 1)
+            And pixel_at(c, 2, 1) = color(0, 0, 0)
+            And pixel_at(c, 3, 3) = color(0, 0, 0)
+        """
+
+        c = Canvas(5, 4)
+        block = Canvas(2, 2, Color(0.5, 0.25, 1))
+        c.write_block(3, 1, block)
+        self.assertEqual(c.pixel_at(3, 1), Color(0.5, 0.25, 1))
+        self.assertEqual(c.pixel_at(4, 2), Color(0.5, 0.25, 1))
+        self.assertEqual(c.pixel_at(2, 1), Color(0, 0, 0))
+        self.assertEqual(c.pixel_at(3, 3), Color(0, 0, 0))
+
+    def test_scenario8(self):
+        """
+        Scenario: Reading a block of pixels out of a canvas
+            Given c ← canvas(4, 3)
+            And write_pixel(c, 1, 1, color(1, 0, 0))
+            And write_pixel(c, 2, 2, color(0, 1, 0))
+            When block ← read_block(c, 1, 1, 2, 2)
+            Then block.width = 2
+            And pixel_at(block, 0, 0) = color(1, 0, 0)
+            And pixel_at(block, 1, 1) = color(0, 1, 0)
+            And read_block(c, 3, 0, 2, 2) fails
+        """
+
+        c = Canvas(4, 3)
+        c.write_pixel(1, 1, Color(1, 0, 0))
+        c.write_pixel(2, 2, Color(0, 1, 0))
+        block = c.read_block(1, 1, 2, 2)
+        self.assertEqual(block.width, 2)
+        self.assertEqual(block.pixel_at(0, 0), Color(1, 0, 0))
+        self.assertEqual(block.pixel_at(1, 1), Color(0, 1, 0))
+        with self.assertRaises(ValueError):
+            c.read_block(3, 0, 2, 2)
+
+    def test_scenario9(self):
+        """
+        Scenario: Writing a canvas as binary P6
+            Given c ← canvas(2, 2)
+            And write_pixel(c, 0, 0, color(1.5, 0, 0))
+            And write_pixel(c, 1, 0, color(0, 0.5, 0))
+            And write_pixel(c, 0, 1, color(-0.5, 0, 1))
+            When write_ppm(c, file)
+            Then file starts with "P6\n2 2\n255\n"
+            And the pixel bytes are 255 0 0 0 128 0 0 0 255 0 0 0
+        """
+
+        c = Canvas(2, 2)
+        c.write_pixel(0, 0, Color(1.5, 0, 0))
+        c.write_pixel(1, 0, Color(0, 0.5, 0))
+        c.write_pixel(0, 1, Color(-0.5, 0, 1))
+        f = BytesIO()
+        c.write_ppm(f)
+        self.assertEqual(
+            f.getvalue(),
+            b"P6\n2 2\n255\n" + bytes([255, 0, 0, 0, 128, 0, 0, 0, 255, 0, 0, 0]),
+        )
+
+    def test_scenario10(self):
+        """
+        Scenario: Streaming a canvas as P3 matches canvas_to_ppm
+            Given c ← canvas(10, 2, color(1, 0.8, 0.6))
+            When write_ppm(c, file, binary=false)
+            Then file = canvas_to_ppm(c)
+        """
+
+        c = Canvas(10, 2, Color(1, 0.8, 0.6))
+        f = BytesIO()
+        c.write_ppm(f, binary=False)
+        self.assertEqual(f.getvalue().decode("ascii"), c.to_ppm())
+
+    def test_scenario11(self):
+        """
+        Scenario: Writing a canvas as PNG
+            Given c ← canvas(13, 7) filled with random colors
+            When write_png(c, file)
+            Then decoding file gives back the quantized pixels of c
+        """
+
+        rng = Random(3)
+        c = Canvas(13, 7)
+        for y in range(7):
+            for x in range(13):
+                c.write_pixel(x, y, Color(rng.random(), rng.random() * 1.2, 0.5))
+        f = BytesIO()
+        writer = PNGWriter(f, 13, 7)
+        writer.write_rows(c)
+        writer.close()
+        self.assertEqual(decode_png(f.getvalue()), (13, 7, quantize(c.buffer)))
+
+    def test_scenario12(self):
+        """
+        Scenario: PNG bands compressed in parallel decode to the same image
+            Given c ← canvas(9, 20) with a smooth gradient
+            When c is written in bands of 3 rows with 4 threads
+            Then decoding gives back the quantized pixels of c
+        """
+
+        c = Canvas(9, 20)
+        for y in range(20):
+            for x in range(9):
+                c.write_pixel(x, y, Color(x / 9, y / 20, (x + y) / 29))
+        f = BytesIO()
+        writer = PNGWriter(f, 9, 20, compression_level=9, threads=4, band_height=3)
+        for y in range(0, 20, 5):
+            writer.write_rows(c.read_block(0, y, 9, 5))
+        writer.close()
+        self.assertEqual(decode_png(f.getvalue()), (9, 20, quantize(c.buffer)))
+
 
 if __name__ == "__main__":
     unittest.main()
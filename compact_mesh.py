@@ -0,0 +1,308 @@
+from __future__ import annotations
+from array import array
+from bisect import bisect_right
+from copy import copy
+from math import inf, sqrt
+from bvh import BVH
+from material import Material
+from mesh import Mesh
+from ray import Ray, Intersection, Intersections, transform
+from shape import Shape
+from triangle import intersect_triangle
+from tuple import Tuple, point, vector
+
+# Largest value of a quantized 16-bit coordinate
+QUANTIZED_MAX = 65535
+# Bigger leaves than a Mesh's, so more corners are shared within a leaf and there are fewer nodes to store
+LEAF_SIZE = 8
+MAX_LEAF_SIZE = 16
+
+
+def encode_octahedral(x: float, y: float, z: float) -> tuple:
+    """
+    Packs a direction into two 16-bit integers by projecting it onto an octahedron and unfolding the
+    lower half over the upper one.
+
+        Parameters:
+            x, y, z (float): The direction, not necessarily normalized
+
+        Returns:
+            (a, b) (tuple): Integers in [0, 65535]
+    """
+
+    length = abs(x) + abs(y) + abs(z)
+    if length == 0:
+        return encode_octahedral(0, 0, 1)
+    x /= length
+    y /= length
+    if z < 0:
+        x, y = (1 - abs(y)) * _sign(x), (1 - abs(x)) * _sign(y)
+    return (
+        round((x + 1) / 2 * QUANTIZED_MAX),
+        round((y + 1) / 2 * QUANTIZED_MAX),
+    )
+
+
+def decode_octahedral(a: int, b: int) -> tuple:
+    """
+    Unpacks a direction packed by encode_octahedral.
+
+        Parameters:
+            a, b (int)
+
+        Returns:
+            (x, y, z) (tuple): Normalized
+    """
+
+    x = a / QUANTIZED_MAX * 2 - 1
+    y = b / QUANTIZED_MAX * 2 - 1
+    z = 1 - abs(x) - abs(y)
+    if z < 0:
+        x, y = (1 - abs(y)) * _sign(x), (1 - abs(x)) * _sign(y)
+    # Points on the octahedron are only unit length along the axes, and smooth shading blends these
+    # by weight, so they must be unit length everywhere
+    length = sqrt(x * x + y * y + z * z)
+    return x / length, y / length, z / length
+
+
+def _quantize(value: float, lo: float, extent: float) -> int:
+    if extent <= 0:
+        return 0
+    return min(max(round((value - lo) / extent * QUANTIZED_MAX), 0), QUANTIZED_MAX)
+
+
+def _round_down(value: float) -> float:
+    # The nearest float32 at or below value, so bounds stored as float32 still contain what they bound
+    rounded = array("f", [value])[0]
+    if rounded > value:
+        rounded = array("f", [value - abs(value) * 2**-22])[0]
+    return rounded
+
+
+def _round_up(value: float) -> float:
+    return -_round_down(-value)
+
+
+def _sign(value: float) -> float:
+    return -1.0 if value < 0 else 1.0
+
+
+class CompactMesh(Shape):
+    """
+    A mesh encoded to use a fraction of a Mesh's memory, decoded on the fly as rays reach it. It keeps
+    its own BVH, with faces stored in leaf order (a face's slot):
+        bounds_array holds six float32 bounds per node, rounded outwards
+        offset[n] is the right child of an interior node, or the number of a leaf
+        leaf_slot[k] and leaf_vertex[k] are where leaf k's slots and vertices begin
+        positions holds three 16-bit coordinates per leaf vertex, quantized to its leaf's bounds
+        local_indices holds three indexes per slot into its leaf's vertices, shared by the faces in the leaf
+        normals holds two 16-bit octahedral components per leaf vertex, or per slot for flat meshes
+    """
+
+    def __init__(self, mesh: Mesh, material: Material = None):
+        """
+        Encodes a mesh, building a hierarchy with bigger leaves over its faces. The result shares none
+        of the mesh's arrays.
+
+            Parameters:
+                mesh (Mesh)
+                material (Material): Defaults to the mesh's material
+        """
+
+        super().__init__(mesh.material if material is None else material)
+        self.transform = mesh.transform
+        faces = array("I", range(mesh.face_count))
+        bvh = BVH(
+            faces,
+            [mesh.face_bounds(f) for f in faces],
+            leaf_size=LEAF_SIZE,
+            max_leaf_size=MAX_LEAF_SIZE,
+        )
+        self.smooth = bool(mesh.normal_indices)
+        self.bounds_array = array("f")
+        for node in range(len(bvh.count)):
+            box = bvh.bounds[6 * node : 6 * node + 6]
+            self.bounds_array.extend([_round_down(c) for c in box[:3]])
+            self.bounds_array.extend([_round_up(c) for c in box[3:]])
+        self.count = array("B" if max(bvh.count, default=0) < 256 else "H", bvh.count)
+        self.offset = array("I", bvh.offset)
+        self.axis = array("b", bvh.axis)
+        self.leaf_slot = array("I")
+        self.leaf_vertex = array("I")
+        self.positions = array("H")
+        self.normals = array("H")
+        local_indices = []
+        v = mesh.vertices
+
+        for node in range(len(bvh.count)):
+            n = bvh.count[node]
+            if not n:
+                continue
+            start = bvh.offset[node]
+            self.offset[node] = len(self.leaf_slot)
+            self.leaf_slot.append(start)
+            self.leaf_vertex.append(len(self.positions) // 3)
+            lo = self.bounds_array[6 * node : 6 * node + 3]
+            hi = self.bounds_array[6 * node + 3 : 6 * node + 6]
+            extent = [h - l for l, h in zip(lo, hi)]
+
+            # Corners shared by faces in the same leaf are stored once, at a leaf-local index
+            local = {}
+            for face in bvh.items[start : start + n]:
+                corners = mesh.indices[3 * face : 3 * face + 3]
+                normal_corners = (
+                    mesh.normal_indices[3 * face : 3 * face + 3]
+                    if self.smooth
+                    else (None, None, None)
+                )
+                for vertex, normal in zip(corners, normal_corners):
+                    if (vertex, normal) not in local:
+                        local[vertex, normal] = len(local)
+                        for a in range(3):
+                            self.positions.append(
+                                _quantize(v[3 * vertex + a], lo[a], extent[a])
+                            )
+                        if self.smooth:
+                            self.normals.extend(
+                                encode_octahedral(
+                                    *mesh.normals[3 * normal : 3 * normal + 3]
+                                )
+                            )
+                    local_indices.append(local[vertex, normal])
+
+                if not self.smooth:
+                    flat = mesh.local_normal_at(None, Intersection(0, mesh, face=face))
+                    self.normals.extend(encode_octahedral(flat.x, flat.y, flat.z))
+
+        # Leaves hold at most a few faces, so leaf-local indexes nearly always fit in a byte
+        self.local_indices = array(
+            "B" if max(local_indices, default=0) < 256 else "H", local_indices
+        )
+        # Walks the encoded nodes; leaves are decoded by _leaf_hits, so a leaf's offset can hold its
+        # number rather than where its items start
+        self.bvh = BVH.from_arrays(
+            range(self.face_count),
+            self.bounds_array,
+            self.count,
+            self.offset,
+            self.axis,
+        )
+
+    @property
+    def face_count(self) -> int:
+        return len(self.local_indices) // 3
+
+    def nbytes(self) -> int:
+        """
+        Bytes held in the geometry and hierarchy arrays.
+
+            Returns:
+                size (int)
+        """
+
+        return sum(
+            len(a) * a.itemsize
+            for a in (
+                self.bounds_array,
+                self.count,
+                self.offset,
+                self.axis,
+                self.leaf_slot,
+                self.leaf_vertex,
+                self.positions,
+                self.local_indices,
+                self.normals,
+            )
+        )
+
+    def _corners(self, node: int, slot: int) -> tuple:
+        # Decode a face's corners from its leaf's bounds
+        b = self.bounds_array
+        i = 6 * node
+        lx, ly, lz = b[i], b[i + 1], b[i + 2]
+        sx = (b[i + 3] - lx) / QUANTIZED_MAX
+        sy = (b[i + 4] - ly) / QUANTIZED_MAX
+        sz = (b[i + 5] - lz) / QUANTIZED_MAX
+        base = self.leaf_vertex[self.offset[node]]
+        p = self.positions
+        corners = []
+        for local in self.local_indices[3 * slot : 3 * slot + 3]:
+            j = 3 * (base + local)
+            corners.append((lx + p[j] * sx, ly + p[j + 1] * sy, lz + p[j + 2] * sz))
+        return corners
+
+    def _leaf_hits(self, node: int, ray: Ray, t_min: float, t_max: float) -> list:
+        # Decodes a leaf's faces and tests each, as (t, (slot, u, v)) for the hits in range
+        origin = (ray.origin.x, ray.origin.y, ray.origin.z)
+        direction = (ray.direction.x, ray.direction.y, ray.direction.z)
+        start = self.leaf_slot[self.offset[node]]
+        hits = []
+        for slot in range(start, start + self.count[node]):
+            found = intersect_triangle(origin, direction, *self._corners(node, slot))
+            if found is not None and t_min <= found[0] < t_max:
+                t, u, v = found
+                hits.append((t, (slot, u, v)))
+        return hits
+
+    def local_bounds(self) -> tuple:
+        b = self.bounds_array
+        if not b:
+            return point(0, 0, 0), point(0, 0, 0)
+        return point(b[0], b[1], b[2]), point(b[3], b[4], b[5])
+
+    def local_intersect(self, ray: Ray) -> list:
+        return [t for t, _ in self.bvh.all_hits(ray, -inf, inf, leaf=self._leaf_hits)]
+
+    def intersect(self, ray: Ray) -> Intersections:
+        hits = self.bvh.all_hits(
+            transform(ray, self.inverse), -inf, inf, leaf=self._leaf_hits
+        )
+        return Intersections(
+            *(Intersection(t, self, u, v, slot) for t, (slot, u, v) in sorted(hits))
+        )
+
+    def nearest(self, ray: Ray, t_min: float = 0, t_max: float = inf) -> float:
+        found = self.bvh.closest_hit(
+            transform(ray, self.inverse), t_min, t_max, leaf=self._leaf_hits
+        )
+        return found[0] if found is not None else None
+
+    def hit(self, ray: Ray, t_min: float = 0, t_max: float = inf) -> Intersection:
+        found = self.bvh.closest_hit(
+            transform(ray, self.inverse), t_min, t_max, leaf=self._leaf_hits
+        )
+        if found is None:
+            return None
+        t, (slot, u, v) = found
+        return Intersection(t, self, u, v, slot)
+
+    def local_normal_at(self, p: Tuple, hit: Intersection = None) -> Tuple:
+        n = self.normals
+        if not self.smooth:
+            i = 2 * hit.face
+            return vector(*decode_octahedral(n[i], n[i + 1]))
+
+        # Leaves start at increasing slots, so the leaf holding a slot is found by bisection
+        base = self.leaf_vertex[bisect_right(self.leaf_slot, hit.face) - 1]
+        a, b, c = (
+            decode_octahedral(n[2 * (base + local)], n[2 * (base + local) + 1])
+            for local in self.local_indices[3 * hit.face : 3 * hit.face + 3]
+        )
+        w = 1 - hit.u - hit.v
+        return vector(
+            a[0] * w + b[0] * hit.u + c[0] * hit.v,
+            a[1] * w + b[1] * hit.u + c[1] * hit.v,
+            a[2] * w + b[2] * hit.u + c[2] * hit.v,
+        )
+
+    def __copy__(self) -> CompactMesh:
+        # Share the encoded arrays; only the transform and material belong to the copy
+        m = CompactMesh.__new__(CompactMesh)
+        m.__dict__.update(self.__dict__)
+        m._watchers = []
+        m.material = copy(self.material)
+        m.transform = copy(self.transform)
+        return m
+
+    def __repr__(self):
+        return f"Compact mesh with {self.face_count} faces"
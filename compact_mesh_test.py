@@ -0,0 +1,151 @@
+from array import array
+from math import cos, pi, sin
+from random import Random
+from compact_mesh import CompactMesh, decode_octahedral, encode_octahedral
+from mesh import Mesh
+from mesh_test import random_triangles
+from obj_parser import parse_obj
+from ray import Ray
+from transformations import translation
+from tuple import point, vector, normalize
+from world import World, prepare_computations
+import unittest
+
+
+class Tests(unittest.TestCase):
+    def test_scenario1(self):
+        """
+        Scenario: Octahedral encoding round-trips directions closely
+            Given directions ← axis directions, diagonals and random directions
+            Then normalize(decode(encode(d))) is within 0.0001 of normalize(d) for each
+        """
+
+        rng = Random(4)
+        directions = [
+            (1, 0, 0),
+            (0, -1, 0),
+            (0, 0, -1),
+            (1, 1, 1),
+            (-1, 2, -3),
+        ] + [tuple(rng.uniform(-1, 1) for _ in range(3)) for _ in range(100)]
+        for d in directions:
+            expected = normalize(vector(*d))
+            decoded = normalize(vector(*decode_octahedral(*encode_octahedral(*d))))
+            for a, b in zip(
+                (decoded.x, decoded.y, decoded.z), (expected.x, expected.y, expected.z)
+            ):
+                self.assertAlmostEqual(a, b, delta=1e-4)
+
+    def test_scenario2(self):
+        """
+        Scenario: A compact mesh finds nearly the same hits in less memory
+            Given mesh ← mesh of 300 random triangles
+            And compact ← compact_mesh(mesh)
+            Then nbytes(compact) < nbytes(mesh) / 2
+            And for 200 random rays, nearest(r, compact) ≈ nearest(r, mesh)
+        """
+
+        mesh = Mesh(*random_triangles(300))
+        compact = CompactMesh(mesh)
+        self.assertEqual(compact.face_count, 300)
+        self.assertLess(compact.nbytes(), mesh.nbytes() / 2)
+
+        rng = Random(5)
+        agree = 0
+        for _ in range(200):
+            r = Ray(
+                point(rng.uniform(-10, 10), rng.uniform(-10, 10), -20),
+                normalize(vector(rng.uniform(-0.3, 0.3), rng.uniform(-0.3, 0.3), 1)),
+            )
+            expected = r.nearest(mesh)
+            found = r.nearest(compact)
+            if expected is None or found is None:
+                # Quantization can only move an edge graze by a fraction of a leaf's size
+                agree += expected is found
+                continue
+            self.assertAlmostEqual(found, expected, delta=1e-3)
+            agree += 1
+        self.assertGreater(agree, 195)
+
+    def test_scenario3(self):
+        """
+        Scenario: A compact smooth mesh shades with decoded, interpolated normals
+            Given mesh ← parse_obj of a triangle with normals vector(0, 1, 0), vector(-1, 0, 0), vector(1, 0, 0)
+            And compact ← compact_mesh(mesh)
+            And set_transform(compact, translation(0, 0, 1))
+            And r ← ray(point(-0.2, 0.3, -2), vector(0, 0, 1))
+            When i ← closest_hit(world([compact]), r)
+            Then i.t = 3
+            And prepare_computations(i, r).normalv ≈ vector(-0.5547, 0.83205, 0)
+        """
+
+        mesh = parse_obj(
+            [
+                "v 0 1 0",
+                "v -1 0 0",
+                "v 1 0 0",
+                "vn 0 1 0",
+                "vn -1 0 0",
+                "vn 1 0 0",
+                "f 1//1 2//2 3//3",
+            ]
+        )
+        compact = CompactMesh(mesh)
+        compact.set_transform(translation(0, 0, 1))
+        r = Ray(point(-0.2, 0.3, -2), vector(0, 0, 1))
+        i = World([compact]).closest_hit(r)
+        self.assertAlmostEqual(i.t, 3)
+        n = prepare_computations(i, r).normalv
+        self.assertAlmostEqual(n.x, -0.5547, 3)
+        self.assertAlmostEqual(n.y, 0.83205, 3)
+        self.assertAlmostEqual(n.z, 0, 3)
+
+    def test_scenario4(self):
+        """
+        Scenario: A compact smooth mesh shades like the mesh it encodes when its normals are off-axis
+            Given mesh ← a tessellated unit sphere whose corner normals are its corner positions
+            And compact ← compact_mesh(mesh)
+            And rays ← 100 random rays towards the sphere
+            Then for each ray that hits both, normal_at(compact, hit) is within 0.001 of normal_at(mesh, hit)
+        """
+
+        vertices = array("f")
+        indices = array("I")
+        for i in range(9):
+            theta = pi * i / 8
+            for j in range(16):
+                phi = 2 * pi * j / 16
+                vertices.extend(
+                    (sin(theta) * cos(phi), cos(theta), sin(theta) * sin(phi))
+                )
+        for i in range(8):
+            for j in range(16):
+                a = i * 16 + j
+                b = i * 16 + (j + 1) % 16
+                indices.extend((a, a + 16, b, b, a + 16, b + 16))
+        mesh = Mesh(vertices, indices, array("f", vertices), array("I", indices))
+        compact = CompactMesh(mesh)
+
+        rng = Random(6)
+        checked = 0
+        for _ in range(100):
+            r = Ray(
+                point(rng.uniform(-0.9, 0.9), rng.uniform(-0.9, 0.9), -5),
+                vector(0, 0, 1),
+            )
+            t = r.nearest(mesh)
+            if t is None or compact.nearest(r) is None:
+                continue
+            expected = mesh.normal_at(r.position(t), mesh.hit(r))
+            i = compact.hit(r)
+            found = compact.normal_at(r.position(i.t), i)
+            for a, b in zip(
+                (found.x, found.y, found.z), (expected.x, expected.y, expected.z)
+            ):
+                self.assertAlmostEqual(a, b, delta=1e-3)
+            checked += 1
+        self.assertGreater(checked, 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+import sys
+import time
+from mesh_file import load_mesh, write_mesh
+from obj_parser import load_obj
+
+# Usage: python convert_obj.py input.obj output.mesh
+# Parses an OBJ file once, builds its BVH and saves both in the packed format that load_mesh maps in.
+
+source, destination = sys.argv[1], sys.argv[2]
+
+start = time.perf_counter()
+mesh = load_obj(source)
+print(
+    f"Parsed {mesh.face_count} faces and built the BVH in {time.perf_counter() - start:.2f} s"
+)
+
+write_mesh(mesh, destination)
+
+start = time.perf_counter()
+load_mesh(destination)
+print(
+    f"Wrote {destination}; mapping it takes {(time.perf_counter() - start) * 1e3:.2f} ms"
+)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+from copy import copy
+from math import inf
+from material import Material
+from matrix import Matrix
+from ray import Ray, Intersection, Intersections, transform
+from shape import Shape
+from tuple import Tuple
+
+
+class Instance(Shape):
+    """
+    A placement of shared geometry. Each instance has its own transform, cached inverse and material,
+    but references the geometry instead of copying it, so a scene's memory grows with its unique
+    geometry rather than with how many times it is placed. In a World, the world's BVH over instances
+    forms the top level and each geometry's own hierarchy, such as a Mesh's, the bottom level.
+    """
+
+    def __init__(
+        self, geometry: Shape, transformation: Matrix = None, material: Material = None
+    ):
+        """
+        Places geometry in the scene.
+
+            Parameters:
+                geometry (Shape): Shared between every instance of it
+                transformation (Matrix): Applied on top of the geometry's own transform
+                material (Material): Defaults to the geometry's material, shared rather than copied
+        """
+
+        super().__init__(geometry.material if material is None else material)
+        self.geometry = geometry
+        # Moving the geometry moves every instance of it
+        geometry.watch(self)
+        if transformation is not None:
+            self.transform = transformation
+
+    def local_bounds(self) -> tuple:
+        # The geometry's world space is the instance's object space
+        return self.geometry.bounds()
+
+    def local_intersect(self, ray: Ray) -> list:
+        return [i.t for i in self.geometry.intersect(ray).intersections]
+
+    def intersect(self, ray: Ray) -> Intersections:
+        xs = self.geometry.intersect(transform(ray, self.inverse))
+        return Intersections(
+            *(Intersection(i.t, self, i.u, i.v, i.face) for i in xs.intersections)
+        )
+
+    def nearest(self, ray: Ray, t_min: float = 0, t_max: float = inf) -> float:
+        return self.geometry.nearest(transform(ray, self.inverse), t_min, t_max)
+
+    def hit(self, ray: Ray, t_min: float = 0, t_max: float = inf) -> Intersection:
+        i = self.geometry.hit(transform(ray, self.inverse), t_min, t_max)
+        if i is None:
+            return None
+        return Intersection(i.t, self, i.u, i.v, i.face)
+
+    def local_normal_at(self, p: Tuple, hit: Intersection = None) -> Tuple:
+        return self.geometry.normal_at(p, hit)
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.geometry.watch(self)
+
+    def __copy__(self) -> Instance:
+        return Instance(self.geometry, copy(self.transform), self.material)
+
+    def __repr__(self):
+        return f"Instance of {self.geometry}"
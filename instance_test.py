@@ -0,0 +1,118 @@
+from array import array
+from math import pi
+from instance import Instance
+from material import Material
+from mesh import Mesh
+from ray import Ray
+from sphere import Sphere
+from transformations import rotation_y, scaling, translation
+from tuple import point, vector
+from world import World, prepare_computations
+import unittest
+
+
+def unit_square() -> Mesh:
+    # Two faces covering [-1, 1] x [-1, 1] in the xy plane
+    return Mesh(
+        array("f", [-1, -1, 0, 1, -1, 0, 1, 1, 0, -1, 1, 0]),
+        array("I", [0, 1, 3, 1, 2, 3]),
+    )
+
+
+class Tests(unittest.TestCase):
+    def test_scenario1(self):
+        """
+        Scenario: Instances share their geometry and its material
+            Given mesh ← unit_square()
+            And a ← instance(mesh, translation(5, 0, 0))
+            And b ← instance(mesh, translation(-5, 0, 0))
+            Then a.geometry is b.geometry
+            And a.material is mesh.material
+            And a.transform != b.transform
+        """
+
+        mesh = unit_square()
+        a = Instance(mesh, translation(5, 0, 0))
+        b = Instance(mesh, translation(-5, 0, 0))
+        self.assertIs(a.geometry, b.geometry)
+        self.assertIs(a.material, mesh.material)
+        self.assertNotEqual(a.transform, b.transform)
+
+    def test_scenario2(self):
+        """
+        Scenario: Intersecting and shading a transformed instance of a transformed sphere
+            Given s ← sphere() with transform scaling(2, 2, 2)
+            And i ← instance(s, translation(0, 0, 10), material() with color (1, 0, 0))
+            And r ← ray(point(0, 0, 0), vector(0, 0, 1))
+            Then intersect(i, r) has t = 8 and 12, each with object i
+            And normal_at(i, point(0, 0, 8)) = vector(0, 0, -1)
+            And i.material.color = color(1, 0, 0)
+        """
+
+        s = Sphere(material=Material())
+        s.set_transform(scaling(2, 2, 2))
+        m = Material()
+        i = Instance(s, translation(0, 0, 10), m)
+        r = Ray(point(0, 0, 0), vector(0, 0, 1))
+        xs = r.intersect(i)
+        self.assertEqual([x.t for x in xs.intersections], [8, 12])
+        self.assertTrue(all(x.object is i for x in xs.intersections))
+        self.assertEqual(i.normal_at(point(0, 0, 8)), vector(0, 0, -1))
+        self.assertIs(i.material, m)
+
+    def test_scenario3(self):
+        """
+        Scenario: A world of many instances finds hits through both levels of hierarchy
+            Given mesh ← unit_square()
+            And instances ← 100 instances of mesh, rotated a quarter turn about y, at x = 3 * k
+            And w ← world(instances)
+            And r ← ray(point(30.5, 0.5, -5), vector(-0.1, 0, 1))
+            When hit ← closest_hit(w, r)
+            Then hit.object = instances[10]
+            And hit.t = 5
+            And hit.face is set
+            And prepare_computations(hit, r).normalv points along ±x
+            And bounds(instances[10]) = (point(30, -1, -1), point(30, 1, 1))
+        """
+
+        mesh = unit_square()
+        instances = [
+            Instance(mesh, translation(3 * k, 0, 0) * rotation_y(pi / 2))
+            for k in range(100)
+        ]
+        w = World(instances)
+        self.assertIsNotNone(w.bvh())
+
+        r = Ray(point(30.5, 0.5, -5), vector(-0.1, 0, 1))
+        hit = w.closest_hit(r)
+        self.assertIs(hit.object, instances[10])
+        self.assertAlmostEqual(hit.t, 5)
+        self.assertIsNotNone(hit.face)
+        normal = prepare_computations(hit, r).normalv
+        self.assertAlmostEqual(abs(normal.x), 1)
+
+        minimum, maximum = instances[10].bounds()
+        self.assertEqual(minimum, point(30, -1, -1))
+        self.assertEqual(maximum, point(30, 1, 1))
+
+    def test_scenario4(self):
+        """
+        Scenario: Moving shared geometry moves every instance of it in a world
+            Given s ← sphere()
+            And w ← world with 10 instances of s at x = 3 * k
+            And r ← ray(point(0, 50, -5), vector(0, 0, 1))
+            And closest_hit(w, r) is nothing
+            When set_transform(s, translation(0, 50, 0))
+            Then closest_hit(w, r).object = w.objects[0]
+        """
+
+        s = Sphere()
+        w = World([Instance(s, translation(3 * k, 0, 0)) for k in range(10)])
+        r = Ray(point(0, 50, -5), vector(0, 0, 1))
+        self.assertIsNone(w.closest_hit(r))
+        s.set_transform(translation(0, 50, 0))
+        self.assertIs(w.closest_hit(r).object, w.objects[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
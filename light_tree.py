@@ -0,0 +1,147 @@
+from __future__ import annotations
+from array import array
+from math import inf
+
+
+class LightTree:
+    """
+    Binary hierarchy over lights for picking one light in proportion to its estimated contribution.
+
+    Nodes are stored depth-first in flat arrays, so a node's left child always follows it:
+        bounds[6 * n : 6 * n + 6] are the (xmin, ymin, zmin, xmax, ymax, zmax) of the light positions below it
+        reach[6 * n : 6 * n + 6] are those bounds grown by the largest radius below it (infinite if any light is unbounded)
+        power[n] is the summed intensity of the lights below it
+        offset[n] is the index of the light in a leaf, or the right child of an interior node
+        leaf[n] is 1 for a leaf, which always holds exactly one light
+
+    Point lights shine in every direction, so unlike an emitter with a cone of directions there is
+    no orientation bound to store: a node's importance comes from its power, distance and reach alone.
+    """
+
+    def __init__(self, lights: list):
+        """
+        Builds a hierarchy.
+
+            Parameters:
+                lights (list): PointLights
+        """
+
+        self.lights = lights
+        self.bounds = array("d")
+        self.reach = array("d")
+        self.power = array("d")
+        self.offset = array("l")
+        self.leaf = array("b")
+        if lights:
+            self._build(list(range(len(lights))))
+
+    def _build(self, order: list) -> int:
+        node = len(self.leaf)
+        positions = [self.lights[i].position for i in order]
+        box = (
+            min(p.x for p in positions),
+            min(p.y for p in positions),
+            min(p.z for p in positions),
+            max(p.x for p in positions),
+            max(p.y for p in positions),
+            max(p.z for p in positions),
+        )
+        radii = [self.lights[i].radius for i in order]
+        r = inf if None in radii else max(radii)
+        self.bounds.extend(box)
+        self.reach.extend(
+            (box[0] - r, box[1] - r, box[2] - r, box[3] + r, box[4] + r, box[5] + r)
+        )
+        self.power.append(sum(_power(self.lights[i]) for i in order))
+        self.offset.append(order[0])
+        self.leaf.append(1)
+
+        if len(order) == 1:
+            return node
+
+        # Median split along the axis where the lights are most spread out
+        extents = [box[3] - box[0], box[4] - box[1], box[5] - box[2]]
+        axis = extents.index(max(extents))
+        order = sorted(order, key=lambda i: _coordinate(self.lights[i].position, axis))
+        mid = len(order) // 2
+        self.leaf[node] = 0
+        self._build(order[:mid])
+        self.offset[node] = self._build(order[mid:])
+        return node
+
+    def importance(self, node: int, p) -> float:
+        """
+        Estimates how much the lights below a node contribute at a point.
+
+            Parameters:
+                node (int)
+                p (Tuple): Tuple with type=point
+
+            Returns:
+                importance (float): 0 if no light below the node reaches the point
+        """
+
+        x, y, z = p.x, p.y, p.z
+        i = 6 * node
+        reach = self.reach
+        if not (
+            reach[i] <= x <= reach[i + 3]
+            and reach[i + 1] <= y <= reach[i + 4]
+            and reach[i + 2] <= z <= reach[i + 5]
+        ):
+            return 0.0
+
+        bounds = self.bounds
+        dx = (bounds[i] + bounds[i + 3]) / 2 - x
+        dy = (bounds[i + 1] + bounds[i + 4]) / 2 - y
+        dz = (bounds[i + 2] + bounds[i + 5]) / 2 - z
+        # Clamp the distance to half the box's diagonal so points inside a cluster don't blow up
+        hx = (bounds[i + 3] - bounds[i]) / 2
+        hy = (bounds[i + 4] - bounds[i + 1]) / 2
+        hz = (bounds[i + 5] - bounds[i + 2]) / 2
+        distance2 = max(dx * dx + dy * dy + dz * dz, hx * hx + hy * hy + hz * hz, 1e-6)
+        return self.power[node] / distance2
+
+    def sample(self, p, u: float) -> tuple:
+        """
+        Picks a light by descending the tree, choosing each child in proportion to its importance.
+
+            Parameters:
+                p (Tuple): Tuple with type=point
+                u (float): Uniform random number in [0, 1)
+
+            Returns:
+                (light, pdf) (tuple): The light and the probability it was picked, or None if no light reaches the point
+        """
+
+        if not self.lights or self.importance(0, p) == 0:
+            return None
+
+        node = 0
+        pdf = 1.0
+        while not self.leaf[node]:
+            left = self.importance(node + 1, p)
+            right = self.importance(self.offset[node], p)
+            total = left + right
+            if total == 0:
+                return None
+            p_left = left / total
+            # Reuse the same random number at every level by rescaling it into the chosen interval
+            if u < p_left:
+                u /= p_left
+                pdf *= p_left
+                node = node + 1
+            else:
+                u = (u - p_left) / (1 - p_left)
+                pdf *= 1 - p_left
+                node = self.offset[node]
+        return self.lights[self.offset[node]], pdf
+
+
+def _power(light) -> float:
+    c = light.intensity
+    return c.red + c.green + c.blue
+
+
+def _coordinate(p, axis: int) -> float:
+    return (p.x, p.y, p.z)[axis]
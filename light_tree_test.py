@@ -0,0 +1,105 @@
+from random import Random
+from canvas import Color
+from light_tree import LightTree
+from lights import PointLight
+from material import Material, lighting, sample_lighting
+from tuple import point, vector
+import unittest
+
+
+def never_shadowed(p, light) -> bool:
+    return False
+
+
+class Tests(unittest.TestCase):
+    def test_scenario1(self):
+        """
+        Scenario: A light tree picks brighter lights more often
+            Given dim ← point_light(point(-1, 0, 0), color(1, 1, 1))
+            And bright ← point_light(point(1, 0, 0), color(3, 3, 3))
+            And tree ← light_tree([dim, bright])
+            Then sample(tree, point(0, 0, 0), 0.1) = (dim, 0.25)
+            And sample(tree, point(0, 0, 0), 0.5) = (bright, 0.75)
+        """
+
+        dim = PointLight(point(-1, 0, 0), Color(1, 1, 1))
+        bright = PointLight(point(1, 0, 0), Color(3, 3, 3))
+        tree = LightTree([dim, bright])
+        light, pdf = tree.sample(point(0, 0, 0), 0.1)
+        self.assertIs(light, dim)
+        self.assertAlmostEqual(pdf, 0.25)
+        light, pdf = tree.sample(point(0, 0, 0), 0.5)
+        self.assertIs(light, bright)
+        self.assertAlmostEqual(pdf, 0.75)
+
+    def test_scenario2(self):
+        """
+        Scenario: The probabilities of picking each light add up to one
+            Given lights ← 50 point lights along the x axis
+            And tree ← light_tree(lights)
+            Then the sum over lights of the pdf they are picked with = 1
+        """
+
+        lights = [
+            PointLight(point(i, i % 3, 0), Color(1 + i % 5, 1, 1)) for i in range(50)
+        ]
+        tree = LightTree(lights)
+        pdfs = {}
+        for k in range(20000):
+            light, pdf = tree.sample(point(10.5, 4, -2), (k + 0.5) / 20000)
+            pdfs[id(light)] = pdf
+        self.assertEqual(len(pdfs), 50)
+        self.assertAlmostEqual(sum(pdfs.values()), 1)
+
+    def test_scenario3(self):
+        """
+        Scenario: Lights whose radius doesn't reach a point are never picked
+            Given near ← point_light(point(0, 0, 0), color(1, 1, 1), radius=2)
+            And far ← point_light(point(100, 0, 0), color(1, 1, 1), radius=2)
+            And tree ← light_tree([near, far])
+            Then sample(tree, point(1, 0, 0), 0.9) = (near, 1)
+            And sample(tree, point(50, 0, 0), 0.5) is nothing
+        """
+
+        near = PointLight(point(0, 0, 0), Color(1, 1, 1), 2)
+        far = PointLight(point(100, 0, 0), Color(1, 1, 1), 2)
+        tree = LightTree([near, far])
+        self.assertEqual(tree.sample(point(1, 0, 0), 0.9), (near, 1))
+        self.assertIsNone(tree.sample(point(50, 0, 0), 0.5))
+
+    def test_scenario4(self):
+        """
+        Scenario: Sampled lighting averages out to the exact sum over lights
+            Given lights ← 16 point lights above the surface
+            And m ← material()
+            When result ← the mean of sample_lighting(m, light_tree(lights), ...) over many seeds
+            Then result is within 2% of the sum of lighting(m, light, ...) over lights
+        """
+
+        lights = [
+            PointLight(point(i - 8, 5, -5), Color(0.1, 0.1, 0.1 + i / 100))
+            for i in range(16)
+        ]
+        m = Material()
+        position = point(0, 0, 0)
+        eyev = vector(0, 0, -1)
+        normalv = vector(0, 0, -1)
+        exact = Color(0, 0, 0)
+        for light in lights:
+            exact = exact + lighting(m, light, position, eyev, normalv)
+
+        tree = LightTree(lights)
+        runs = 2000
+        total = Color(0, 0, 0)
+        for seed in range(runs):
+            total = total + sample_lighting(
+                m, tree, position, eyev, normalv, 2, Random(seed), never_shadowed
+            )
+        mean = total * (1 / runs)
+        self.assertAlmostEqual(mean.red, exact.red, delta=0.02 * exact.red)
+        self.assertAlmostEqual(mean.green, exact.green, delta=0.02 * exact.green)
+        self.assertAlmostEqual(mean.blue, exact.blue, delta=0.02 * exact.blue)
+
+
+if __name__ == "__main__":
+    unittest.main()
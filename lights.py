@@ -1,16 +1,115 @@
 from __future__ import annotations
 from copy import copy
 from canvas import Color
-from tuple import Tuple
+from tuple import Tuple, magnitude
+from watched import Watched
 
 
-class PointLight:
-    def __init__(self, position: Tuple, intensity: Color):
+class PointLight(Watched):
+    __slots__ = ("_position", "_intensity", "_radius", "_attenuation", "_watchers")
+
+    def __init__(
+        self,
+        position: Tuple,
+        intensity: Color,
+        radius: float = None,
+        attenuation: tuple = (1, 0, 0),
+    ):
+        """
+        A light that shines equally in every direction from a point.
+
+            Parameters:
+                position (Tuple): Tuple with type=point
+                intensity (Color)
+                radius (float): Distance past which the light has no influence, or None for unlimited reach
+                attenuation (tuple): (constant, linear, quadratic) falloff coefficients
+        """
+
+        # Whatever watches a light is told when it moves or changes reach or power
+        self._watchers = []
         self.position = position
         self.intensity = intensity
+        self.radius = radius
+        self.attenuation = attenuation
+
+    @property
+    def position(self) -> Tuple:
+        return self._position
+
+    @position.setter
+    def position(self, position: Tuple) -> None:
+        self._position = position
+        self._changed()
+
+    @property
+    def intensity(self) -> Color:
+        return self._intensity
+
+    @intensity.setter
+    def intensity(self, intensity: Color) -> None:
+        self._intensity = intensity
+        self._changed()
+
+    @property
+    def radius(self) -> float:
+        return self._radius
+
+    @radius.setter
+    def radius(self, radius: float) -> None:
+        self._radius = radius
+        self._changed()
+
+    @property
+    def attenuation(self) -> tuple:
+        return self._attenuation
+
+    @attenuation.setter
+    def attenuation(self, attenuation: tuple) -> None:
+        self._attenuation = attenuation
+        self._changed()
+
+    def attenuation_at(self, p: Tuple) -> float:
+        """
+        Fraction of the light's intensity that reaches a point.
+
+            Parameters:
+                p (Tuple): Tuple with type=point
+
+            Returns:
+                factor (float): 1 for an unattenuated light, 0 outside its radius
+        """
+
+        constant, linear, quadratic = self._attenuation
+        if self._radius is None and linear == 0 and quadratic == 0:
+            return 1 / constant
+
+        distance = magnitude(self._position - p)
+        factor = 1 / (constant + linear * distance + quadratic * distance * distance)
+        if self._radius is not None:
+            if distance >= self._radius:
+                return 0
+            # Window the falloff so it reaches zero at the radius instead of cutting off abruptly
+            window = 1 - (distance / self._radius) ** 4
+            factor *= window * window
+        return factor
 
     def __eq__(self, other: PointLight) -> bool:
-        return self.position == other.position and self.intensity == other.intensity
+        return (
+            self.position == other.position
+            and self.intensity == other.intensity
+            and self.radius == other.radius
+            and self.attenuation == other.attenuation
+        )
+
+    def __getstate__(self) -> tuple:
+        # Watchers are held weakly and belong to this process, so a pickled light starts unwatched
+        return self._position, self._intensity, self._radius, self._attenuation
+
+    def __setstate__(self, state: tuple) -> None:
+        self._watchers = []
+        self._position, self._intensity, self._radius, self._attenuation = state
 
     def __copy__(self) -> PointLight:
-        return PointLight(copy(self.position), copy(self.intensity))
+        return PointLight(
+            copy(self.position), copy(self.intensity), self.radius, self.attenuation
+        )
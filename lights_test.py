@@ -21,6 +21,34 @@ class Tests(unittest.TestCase):
         self.assertEqual(light.position, position)
         self.assertEqual(light.intensity, intensity)
 
+    def test_scenario2(self):
+        """
+        Scenario: A point light without falloff reaches everywhere at full intensity
+          Given light ← point_light(point(0, 0, 0), color(1, 1, 1))
+          Then attenuation_at(light, point(100, 0, 0)) = 1
+        """
+
+        light = PointLight(point(0, 0, 0), Color(1, 1, 1))
+        self.assertEqual(light.attenuation_at(point(100, 0, 0)), 1)
+
+    def test_scenario3(self):
+        """
+        Scenario: Attenuation falls off with distance and reaches zero at the radius
+          Given light ← point_light(point(0, 0, 0), color(1, 1, 1), radius=10, attenuation=(1, 0, 1))
+          Then attenuation_at(light, point(0, 0, 0)) = 1
+            And attenuation_at(light, point(1, 0, 0)) = 0.5 * (1 - 0.1^4)^2
+            And attenuation_at(light, point(10, 0, 0)) = 0
+            And attenuation_at(light, point(0, 20, 0)) = 0
+        """
+
+        light = PointLight(point(0, 0, 0), Color(1, 1, 1), 10, (1, 0, 1))
+        self.assertEqual(light.attenuation_at(point(0, 0, 0)), 1)
+        self.assertAlmostEqual(
+            light.attenuation_at(point(1, 0, 0)), 0.5 * (1 - 0.1**4) ** 2
+        )
+        self.assertEqual(light.attenuation_at(point(10, 0, 0)), 0)
+        self.assertEqual(light.attenuation_at(point(0, 20, 0)), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
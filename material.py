@@ -7,6 +7,8 @@ from tuple import Tuple, cross, dot, normalize, reflect
 
 
 class Material(object):
+    __slots__ = ("color", "ambient", "diffuse", "specular", "shininess")
+
     def __init__(
         self,
         color: Color = Color(1, 1, 1),
@@ -40,7 +42,12 @@ class Material(object):
 
 
 def lighting(
-    material: Material, light: PointLight, point: Tuple, eyev: Tuple, normalv: Tuple
+    material: Material,
+    light: PointLight,
+    point: Tuple,
+    eyev: Tuple,
+    normalv: Tuple,
+    in_shadow: bool = False,
 ) -> Tuple:
     """
     Shading for objects.
@@ -51,19 +58,30 @@ def lighting(
             point (Tuple): Tuple with type=point
             eyev (Tuple): Tuple with type=vector
             normalv (Tuple): Tuple with type=vector
+            in_shadow (bool): True if something blocks the light, leaving only the ambient contribution
 
         Returns:
             intensity (float)
     """
 
+    # Scale the light by how much of it reaches this point
+    intensity = light.intensity
+    falloff = light.attenuation_at(point)
+    if falloff == 0:
+        return Color(0, 0, 0)
+    elif falloff != 1:
+        intensity = intensity * falloff
+
     # Combine the surface color with the light's color/intensity
-    effective_color = material.color * light.intensity
+    effective_color = material.color * intensity
 
     # Find the direction to the light source
     lightv = normalize(light.position - point)
 
     # Compute the ambient contribution
     ambient = effective_color * material.ambient
+    if in_shadow:
+        return ambient
 
     # light_dot_normal represents the cosine of the angle between the light vector and the normal vector. A negative number means the light is on the other side of the surface.
     light_dot_normal = dot(lightv, normalv)
@@ -83,7 +101,50 @@ def lighting(
         else:
             # Compute the specular contribution
             factor = pow(reflect_dot_eye, material.shininess)
-            specular = light.intensity * material.specular * factor
+            specular = intensity * material.specular * factor
 
     # Add the three contributions together to get the final shading
     return ambient + diffuse + specular
+
+
+def sample_lighting(
+    material: Material,
+    tree,
+    point: Tuple,
+    eyev: Tuple,
+    normalv: Tuple,
+    samples: int,
+    rng,
+    is_shadowed,
+) -> Color:
+    """
+    Estimates the shading from every light in a tree by evaluating only a few of them, picked in
+    proportion to their estimated contribution. Each sample is weighted by 1 / (pdf * samples), so
+    the estimate averages out to the sum over all lights.
+
+        Parameters:
+            material (Material)
+            tree (LightTree)
+            point (Tuple): Tuple with type=point
+            eyev (Tuple): Tuple with type=vector
+            normalv (Tuple): Tuple with type=vector
+            samples (int): Number of lights to evaluate
+            rng (Random): Source of the random numbers used to pick lights
+            is_shadowed (function): is_shadowed(point, light) returns True if something blocks the light
+
+        Returns:
+            color (Color)
+    """
+
+    color = Color(0, 0, 0)
+    for _ in range(samples):
+        picked = tree.sample(point, rng.random())
+        if picked is None:
+            # No light reaches the point, so no other sample will find one either
+            break
+        light, pdf = picked
+        shade = lighting(
+            material, light, point, eyev, normalv, is_shadowed(point, light)
+        )
+        color = color + shade * (1 / (pdf * samples))
+    return color
@@ -109,6 +109,49 @@ class Tests(unittest.TestCase):
         result = lighting(m, light, position, eyev, normalv)
         self.assertEqual(result, Color(1.6364, 1.6364, 1.6364))
 
+    def test_scenario6(self):
+        """
+        Background:
+          Given m ← material()
+            And position ← point(0, 0, 0)
+        Scenario: Lighting with the surface in shadow
+          Given eyev ← vector(0, 0, -1)
+            And normalv ← vector(0, 0, -1)
+            And light ← point_light(point(0, 0, -10), color(1, 1, 1))
+            And in_shadow ← true
+          When result ← lighting(m, light, position, eyev, normalv, in_shadow)
+          Then result = color(0.1, 0.1, 0.1)
+        """
+
+        m = Material()
+        position = point(0, 0, 0)
+        eyev = vector(0, 0, -1)
+        normalv = vector(0, 0, -1)
+        light = PointLight(point(0, 0, -10), Color(1, 1, 1))
+        result = lighting(m, light, position, eyev, normalv, True)
+        self.assertEqual(result, Color(0.1, 0.1, 0.1))
+
+    def test_scenario7(self):
+        """
+        Background:
+          Given m ← material()
+            And position ← point(0, 0, 0)
+        Scenario: Lighting with the surface outside the light's radius
+          Given eyev ← vector(0, 0, -1)
+            And normalv ← vector(0, 0, -1)
+            And light ← point_light(point(0, 0, -10), color(1, 1, 1), radius=5)
+          When result ← lighting(m, light, position, eyev, normalv)
+          Then result = color(0, 0, 0)
+        """
+
+        m = Material()
+        position = point(0, 0, 0)
+        eyev = vector(0, 0, -1)
+        normalv = vector(0, 0, -1)
+        light = PointLight(point(0, 0, -10), Color(1, 1, 1), 5)
+        result = lighting(m, light, position, eyev, normalv)
+        self.assertEqual(result, Color(0, 0, 0))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -31,6 +31,16 @@ class Matrix:
                     )
             return Matrix(self.rows, self.cols, matrix)
         elif isinstance(other, Tuple):
+            if self.rows == 4 and self.cols == 4:
+                # Unrolled 4x4 path: read the cells and the tuple components once, no intermediate lists
+                m = self.matrix
+                x, y, z, w = other.x, other.y, other.z, other.w
+                return Tuple(
+                    m[0] * x + m[1] * y + m[2] * z + m[3] * w,
+                    m[4] * x + m[5] * y + m[6] * z + m[7] * w,
+                    m[8] * x + m[9] * y + m[10] * z + m[11] * w,
+                    m[12] * x + m[13] * y + m[14] * z + m[15] * w,
+                )
             # Multiply by tuple
             t = []
             for row in range(self.rows):
@@ -39,6 +49,7 @@ class Matrix:
                     r.append(self[row][col] * other[col])
                 t.append(sum(r))
             return Tuple(*t)
+        return NotImplemented
 
     def __eq__(self, other: Matrix) -> bool:
         if self.rows == other.rows and self.cols == other.cols:
@@ -77,10 +88,10 @@ def transpose(matrix: Matrix) -> Matrix:
 
 def determinant(matrix: Matrix) -> float:
     """
-    Finds the determinant of a 2x2 matrix.
+    Finds the determinant of a matrix. 4x4 matrices use a closed-form expansion.
 
         Parameters:
-            matrix (Matrix): 2x2 matrix
+            matrix (Matrix)
 
         Returns:
             determinant (float)
@@ -88,7 +99,9 @@ def determinant(matrix: Matrix) -> float:
 
     det = 0
 
-    if matrix.rows == 2 and matrix.cols == 2:
+    if matrix.rows == 4 and matrix.cols == 4:
+        det = _determinant4(matrix.matrix)
+    elif matrix.rows == 2 and matrix.cols == 2:
         det = matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]
     else:
         for col in range(matrix.cols):
@@ -173,13 +186,20 @@ def invertible(matrix: Matrix) -> bool:
 
 def inverse(matrix: Matrix) -> Matrix:
     """
-    Finds the inverse of a given matrix.
+    Finds the inverse of a given matrix. 4x4 matrices use a closed-form expansion.
 
         Parameters:
             matrix (Matrix)
+
+        Returns:
+            inverted (Matrix)
     """
 
-    if not invertible(matrix):
+    if matrix.rows == 4 and matrix.cols == 4:
+        return _inverse4(matrix.matrix)
+
+    det = determinant(matrix)
+    if det == 0:
         raise ValueError("Matrix cannot be inverted")
 
     m2 = Matrix(matrix.rows, matrix.cols)
@@ -187,9 +207,167 @@ def inverse(matrix: Matrix) -> Matrix:
     for row in range(matrix.rows):
         for col in range(matrix.cols):
             c = cofactor(matrix, row, col)
-            m2.set_cell(col, row, c / determinant(matrix))
+            m2.set_cell(col, row, c / det)
 
     return m2
 
 
+def transform_points(matrix: Matrix, points: list) -> list:
+    """
+    Applies one 4x4 transformation to many points at once.
+
+        Parameters:
+            matrix (Matrix): Matrix or AffineTransform
+            points (list): Tuples with type=point
+
+        Returns:
+            transformed (list)
+    """
+
+    m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 = matrix.matrix
+    return [
+        Tuple(
+            m0 * p.x + m1 * p.y + m2 * p.z + m3,
+            m4 * p.x + m5 * p.y + m6 * p.z + m7,
+            m8 * p.x + m9 * p.y + m10 * p.z + m11,
+            m12 * p.x + m13 * p.y + m14 * p.z + m15,
+        )
+        for p in points
+    ]
+
+
+def transform_vectors(matrix: Matrix, vectors: list) -> list:
+    """
+    Applies one 4x4 transformation to many vectors at once. Translation is ignored.
+
+        Parameters:
+            matrix (Matrix): Matrix or AffineTransform
+            vectors (list): Tuples with type=vector
+
+        Returns:
+            transformed (list)
+    """
+
+    m0, m1, m2, _, m4, m5, m6, _, m8, m9, m10, _, m12, m13, m14, _ = matrix.matrix
+    return [
+        Tuple(
+            m0 * v.x + m1 * v.y + m2 * v.z,
+            m4 * v.x + m5 * v.y + m6 * v.z,
+            m8 * v.x + m9 * v.y + m10 * v.z,
+            m12 * v.x + m13 * v.y + m14 * v.z,
+        )
+        for v in vectors
+    ]
+
+
+def _subdeterminants4(m: list) -> tuple:
+    """
+    Computes the twelve 2x2 sub-determinants used by the Laplace expansion of a 4x4 matrix.
+
+        Parameters:
+            m (list): Row-major cells of a 4x4 matrix
+
+        Returns:
+            (s, c) (tuple): Sub-determinants of the top two rows and bottom two rows
+    """
+
+    a00, a01, a02, a03, a10, a11, a12, a13 = m[0:8]
+    a20, a21, a22, a23, a30, a31, a32, a33 = m[8:16]
+
+    # 2x2 determinants of the top two rows...
+    s = (
+        a00 * a11 - a10 * a01,
+        a00 * a12 - a10 * a02,
+        a00 * a13 - a10 * a03,
+        a01 * a12 - a11 * a02,
+        a01 * a13 - a11 * a03,
+        a02 * a13 - a12 * a03,
+    )
+    # ...and of the bottom two rows, paired so that det = sum(s[i] * c[5 - i]) with alternating signs
+    c = (
+        a20 * a31 - a30 * a21,
+        a20 * a32 - a30 * a22,
+        a20 * a33 - a30 * a23,
+        a21 * a32 - a31 * a22,
+        a21 * a33 - a31 * a23,
+        a22 * a33 - a32 * a23,
+    )
+    return s, c
+
+
+def _determinant4(m: list) -> float:
+    """
+    Closed-form determinant of a 4x4 matrix.
+
+        Parameters:
+            m (list): Row-major cells of a 4x4 matrix
+
+        Returns:
+            determinant (float)
+    """
+
+    s, c = _subdeterminants4(m)
+    return (
+        s[0] * c[5]
+        - s[1] * c[4]
+        + s[2] * c[3]
+        + s[3] * c[2]
+        - s[4] * c[1]
+        + s[5] * c[0]
+    )
+
+
+def _inverse4(m: list) -> Matrix:
+    """
+    Closed-form inverse of a 4x4 matrix, computing the determinant only once.
+
+        Parameters:
+            m (list): Row-major cells of a 4x4 matrix
+
+        Returns:
+            inverted (Matrix)
+    """
+
+    s, c = _subdeterminants4(m)
+    det = (
+        s[0] * c[5]
+        - s[1] * c[4]
+        + s[2] * c[3]
+        + s[3] * c[2]
+        - s[4] * c[1]
+        + s[5] * c[0]
+    )
+    if det == 0:
+        raise ValueError("Matrix cannot be inverted")
+
+    a00, a01, a02, a03, a10, a11, a12, a13 = m[0:8]
+    a20, a21, a22, a23, a30, a31, a32, a33 = m[8:16]
+    s0, s1, s2, s3, s4, s5 = s
+    c0, c1, c2, c3, c4, c5 = c
+    inv = 1 / det
+
+    return Matrix(
+        4,
+        4,
+        [
+            (a11 * c5 - a12 * c4 + a13 * c3) * inv,
+            (-a01 * c5 + a02 * c4 - a03 * c3) * inv,
+            (a31 * s5 - a32 * s4 + a33 * s3) * inv,
+            (-a21 * s5 + a22 * s4 - a23 * s3) * inv,
+            (-a10 * c5 + a12 * c2 - a13 * c1) * inv,
+            (a00 * c5 - a02 * c2 + a03 * c1) * inv,
+            (-a30 * s5 + a32 * s2 - a33 * s1) * inv,
+            (a20 * s5 - a22 * s2 + a23 * s1) * inv,
+            (a10 * c4 - a11 * c2 + a13 * c0) * inv,
+            (-a00 * c4 + a01 * c2 - a03 * c0) * inv,
+            (a30 * s4 - a31 * s2 + a33 * s0) * inv,
+            (-a20 * s4 + a21 * s2 - a23 * s0) * inv,
+            (-a10 * c3 + a11 * c1 - a12 * c0) * inv,
+            (a00 * c3 - a01 * c1 + a02 * c0) * inv,
+            (-a30 * s3 + a31 * s1 - a32 * s0) * inv,
+            (a20 * s3 - a21 * s1 + a22 * s0) * inv,
+        ],
+    )
+
+
 identity_matrix = Matrix(4, 4, [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1])
@@ -8,6 +8,8 @@ from matrix import (
     cofactor,
     invertible,
     inverse,
+    transform_points,
+    transform_vectors,
 )
 from tuple import Tuple
 from utils import equal
@@ -508,6 +510,70 @@ class Tests(unittest.TestCase):
         C = A * B
         self.assertEqual(C * inverse(B), A)
 
+    def test_scenario25(self):
+        """
+        Scenario: The closed-form 4x4 determinant agrees with cofactor expansion
+            Given the following 4x4 matrix A:
+              | -2 | -8 | 3  | 5  |
+              | -3 | 1  | 7  | 3  |
+              | 1  | 2  | -9 | 6  |
+              | -6 | 7  | 7  | -9 |
+            Then determinant(A) = A[0][0] * cofactor(A, 0, 0) + ... + A[0][3] * cofactor(A, 0, 3)
+        """
+
+        A = Matrix(4, 4, [-2, -8, 3, 5, -3, 1, 7, 3, 1, 2, -9, 6, -6, 7, 7, -9])
+        expanded = sum(A[0][col] * cofactor(A, 0, col) for col in range(4))
+        self.assertEqual(determinant(A), expanded)
+
+    def test_scenario26(self):
+        """
+        Scenario: Calculating the inverse of a 3x3 matrix
+            Given the following 3x3 matrix A:
+              | 2 | 0 | 0 |
+              | 0 | 4 | 0 |
+              | 1 | 0 | 1 |
+            Then inverse(A) is the following 3x3 matrix:
+              | 0.5  | 0    | 0 |
+              | 0    | 0.25 | 0 |
+              | -0.5 | 0    | 1 |
+        """
+
+        A = Matrix(3, 3, [2, 0, 0, 0, 4, 0, 1, 0, 1])
+        self.assertEqual(inverse(A), Matrix(3, 3, [0.5, 0, 0, 0, 0.25, 0, -0.5, 0, 1]))
+
+    def test_scenario27(self):
+        """
+        Scenario: Transforming a batch of points by one matrix
+            Given the following matrix A:
+              | 1 | 2 | 3 | 4 |
+              | 2 | 4 | 4 | 2 |
+              | 8 | 6 | 4 | 1 |
+              | 0 | 0 | 0 | 1 |
+            And points ← [point(1, 2, 3), point(0, 0, 0)]
+            Then transform_points(A, points) = [A * point(1, 2, 3), A * point(0, 0, 0)]
+            And transform_points(A, points)[0] = tuple(18, 24, 33, 1)
+        """
+
+        A = Matrix(4, 4, [1, 2, 3, 4, 2, 4, 4, 2, 8, 6, 4, 1, 0, 0, 0, 1])
+        points = [Tuple(1, 2, 3, 1), Tuple(0, 0, 0, 1)]
+        transformed = transform_points(A, points)
+        self.assertEqual(transformed, [A * p for p in points])
+        self.assertEqual(transformed[0], Tuple(18, 24, 33, 1))
+
+    def test_scenario28(self):
+        """
+        Scenario: Transforming a batch of vectors ignores translation
+            Given the following matrix A:
+              | 1 | 0 | 0 | 5  |
+              | 0 | 2 | 0 | -3 |
+              | 0 | 0 | 3 | 2  |
+              | 0 | 0 | 0 | 1  |
+            Then transform_vectors(A, [vector(1, 1, 1)]) = [vector(1, 2, 3)]
+        """
+
+        A = Matrix(4, 4, [1, 0, 0, 5, 0, 2, 0, -3, 0, 0, 3, 2, 0, 0, 0, 1])
+        self.assertEqual(transform_vectors(A, [Tuple(1, 1, 1, 0)]), [Tuple(1, 2, 3, 0)])
+
 
 if __name__ == "__main__":
     unittest.main()
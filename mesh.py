@@ -0,0 +1,209 @@
+from __future__ import annotations
+from array import array
+from copy import copy
+from math import inf
+from bvh import BVH
+from material import Material
+from ray import Ray, Intersection, Intersections, transform
+from shape import Shape
+from triangle import intersect_triangle
+from tuple import Tuple, point, vector
+
+
+class Mesh(Shape):
+    """
+    A triangle mesh kept in flat arrays rather than one object per triangle:
+        vertices[3 * i : 3 * i + 3] is the (x, y, z) of vertex i, as float32
+        indices[3 * f : 3 * f + 3] are the vertices of face f, as uint32
+        normals and normal_indices do the same for per-corner normals, if the mesh has them
+
+    A BVH over the faces lets a ray skip most of them, so the world sees the whole mesh as one object.
+    """
+
+    def __init__(
+        self,
+        vertices: array,
+        indices: array,
+        normals: array = None,
+        normal_indices: array = None,
+        material: Material = None,
+        bvh: BVH = None,
+    ):
+        """
+        Builds a mesh, and a BVH over its faces unless one is supplied.
+
+            Parameters:
+                vertices (array): Packed (x, y, z) positions
+                indices (array): Packed vertex indexes, three per face
+                normals (array): Packed (x, y, z) normals, or None for flat shading
+                normal_indices (array): Packed normal indexes, three per face
+                material (Material)
+                bvh (BVH): A hierarchy already built over these faces
+        """
+
+        super().__init__(material)
+        self.vertices = vertices
+        self.indices = indices
+        self.normals = normals
+        self.normal_indices = normal_indices
+        if bvh is None:
+            faces = array("I", range(self.face_count))
+            bvh = BVH(faces, [self.face_bounds(f) for f in faces])
+        # Copies share the hierarchy, so each query passes in the face test for this mesh's arrays
+        # rather than the hierarchy holding one
+        self.bvh = bvh
+
+    @property
+    def face_count(self) -> int:
+        return len(self.indices) // 3
+
+    def nbytes(self) -> int:
+        """
+        Bytes held in the geometry and hierarchy arrays.
+
+            Returns:
+                size (int)
+        """
+
+        arrays = [
+            self.vertices,
+            self.indices,
+            self.bvh.items,
+            self.bvh.bounds,
+            self.bvh.count,
+            self.bvh.offset,
+            self.bvh.axis,
+        ]
+        if self.normal_indices:
+            arrays += [self.normals, self.normal_indices]
+        return sum(len(a) * a.itemsize for a in arrays)
+
+    def corners(self, face: int) -> tuple:
+        """
+        The three corners of a face.
+
+            Parameters:
+                face (int)
+
+            Returns:
+                (a, b, c) (tuple): (x, y, z) of each corner
+        """
+
+        v = self.vertices
+        i = 3 * face
+        a = 3 * self.indices[i]
+        b = 3 * self.indices[i + 1]
+        c = 3 * self.indices[i + 2]
+        return v[a : a + 3], v[b : b + 3], v[c : c + 3]
+
+    def face_bounds(self, face: int) -> tuple:
+        a, b, c = self.corners(face)
+        return (
+            min(a[0], b[0], c[0]),
+            min(a[1], b[1], c[1]),
+            min(a[2], b[2], c[2]),
+            max(a[0], b[0], c[0]),
+            max(a[1], b[1], c[1]),
+            max(a[2], b[2], c[2]),
+        )
+
+    def _hit_face(self, face: int, ray: Ray) -> tuple:
+        # Reads the corners straight out of the packed arrays, without building a Tuple per vertex
+        v = self.vertices
+        indices = self.indices
+        i = 3 * face
+        a = 3 * indices[i]
+        b = 3 * indices[i + 1]
+        c = 3 * indices[i + 2]
+        o = ray.origin
+        d = ray.direction
+        return intersect_triangle(
+            (o.x, o.y, o.z),
+            (d.x, d.y, d.z),
+            (v[a], v[a + 1], v[a + 2]),
+            (v[b], v[b + 1], v[b + 2]),
+            (v[c], v[c + 1], v[c + 2]),
+        )
+
+    def _nearest_face(self, face: int, ray: Ray, t_min: float, t_max: float) -> float:
+        found = self._hit_face(face, ray)
+        if found is not None and t_min <= found[0] < t_max:
+            return found[0]
+        return None
+
+    def local_bounds(self) -> tuple:
+        b = self.bvh.bounds
+        if not b:
+            return point(0, 0, 0), point(0, 0, 0)
+        return point(b[0], b[1], b[2]), point(b[3], b[4], b[5])
+
+    def local_intersect(self, ray: Ray) -> list:
+        return [t for t, _ in self.bvh.all_hits(ray, -inf, inf, self._nearest_face)]
+
+    def intersect(self, ray: Ray) -> Intersections:
+        local = transform(ray, self.inverse)
+        intersections = []
+        for t, face in self.bvh.all_hits(local, -inf, inf, self._nearest_face):
+            _, u, v = self._hit_face(face, local)
+            intersections.append(Intersection(t, self, u, v, face))
+        return Intersections(*sorted(intersections, key=lambda i: i.t))
+
+    def nearest(self, ray: Ray, t_min: float = 0, t_max: float = inf) -> float:
+        found = self.bvh.closest_hit(
+            transform(ray, self.inverse), t_min, t_max, self._nearest_face
+        )
+        return found[0] if found is not None else None
+
+    def hit(self, ray: Ray, t_min: float = 0, t_max: float = inf) -> Intersection:
+        local = transform(ray, self.inverse)
+        found = self.bvh.closest_hit(local, t_min, t_max, self._nearest_face)
+        if found is None:
+            return None
+        t, face = found
+        # Only the winning face is tested again, to find where on it the ray landed
+        _, u, v = self._hit_face(face, local)
+        return Intersection(t, self, u, v, face)
+
+    def local_normal_at(self, p: Tuple, hit: Intersection = None) -> Tuple:
+        face = hit.face
+        i = 3 * face
+        if self.normal_indices:
+            # Interpolate the corner normals by where the hit landed on the face
+            n = self.normals
+            a = 3 * self.normal_indices[i]
+            b = 3 * self.normal_indices[i + 1]
+            c = 3 * self.normal_indices[i + 2]
+            w = 1 - hit.u - hit.v
+            return vector(
+                n[a] * w + n[b] * hit.u + n[c] * hit.v,
+                n[a + 1] * w + n[b + 1] * hit.u + n[c + 1] * hit.v,
+                n[a + 2] * w + n[b + 2] * hit.u + n[c + 2] * hit.v,
+            )
+
+        a, b, c = self.corners(face)
+        e1 = (b[0] - a[0], b[1] - a[1], b[2] - a[2])
+        e2 = (c[0] - a[0], c[1] - a[1], c[2] - a[2])
+        # cross(e2, e1), matching Triangle
+        return vector(
+            e2[1] * e1[2] - e2[2] * e1[1],
+            e2[2] * e1[0] - e2[0] * e1[2],
+            e2[0] * e1[1] - e2[1] * e1[0],
+        )
+
+    def __copy__(self) -> Mesh:
+        # The geometry is shared; only the transform and material belong to the copy
+        m = Mesh(
+            self.vertices,
+            self.indices,
+            self.normals,
+            self.normal_indices,
+            copy(self.material),
+            self.bvh,
+        )
+        m.transform = copy(self.transform)
+        return m
+
+    def __repr__(self):
+        return (
+            f"Mesh with {len(self.vertices) // 3} vertices and {self.face_count} faces"
+        )
@@ -0,0 +1,172 @@
+from __future__ import annotations
+import mmap
+import struct
+from copy import copy
+import sys
+from array import array
+from bvh import BVH
+from material import Material
+from mesh import Mesh
+
+# File layout, all little-endian:
+#   header: magic, version, vertex count, normal count, face count, whether faces index normals, BVH node count
+#   then 8-byte aligned sections, in order:
+#     vertices        float32 x 3 per vertex
+#     normals         float32 x 3 per normal
+#     indices         uint32  x 3 per face
+#     normal indices  uint32  x 3 per face, if faces index normals
+#     BVH items       uint32 per face, in leaf order
+#     BVH bounds      float64 x 6 per node
+#     BVH count       uint32 per node
+#     BVH offset      uint32 per node
+#     BVH axis        int8 per node
+MAGIC = b"PRMS"
+VERSION = 1
+HEADER = struct.Struct("<4sIQQQQQ")
+
+
+def _sections(vertices: int, normals: int, faces: int, smooth: bool, nodes: int):
+    # (typecode, item count) of every section, in file order
+    return [
+        ("f", 3 * vertices),
+        ("f", 3 * normals),
+        ("I", 3 * faces),
+        ("I", 3 * faces if smooth else 0),
+        ("I", faces),
+        ("d", 6 * nodes),
+        ("I", nodes),
+        ("I", nodes),
+        ("b", nodes),
+    ]
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def write_mesh(mesh: Mesh, path: str) -> None:
+    """
+    Saves a mesh and its BVH in the packed binary format, so it can be mapped back in without parsing
+    or rebuilding anything.
+
+        Parameters:
+            mesh (Mesh)
+            path (str)
+    """
+
+    if sys.byteorder != "little":
+        raise ValueError("Packed meshes can only be written on little-endian machines")
+
+    bvh = mesh.bvh
+    smooth = bool(mesh.normal_indices)
+    normals = mesh.normals if smooth else array("f")
+    counts = (
+        len(mesh.vertices) // 3,
+        len(normals) // 3,
+        mesh.face_count,
+        smooth,
+        len(bvh.count),
+    )
+    header = HEADER.pack(MAGIC, VERSION, *counts)
+    data = [
+        mesh.vertices,
+        normals,
+        mesh.indices,
+        mesh.normal_indices if smooth else array("I"),
+        bvh.items,
+        bvh.bounds,
+        bvh.count,
+        bvh.offset,
+        bvh.axis,
+    ]
+
+    with open(path, "wb") as f:
+        f.write(header)
+        position = len(header)
+        for (typecode, _), values in zip(_sections(*counts), data):
+            padding = _aligned(position) - position
+            f.write(b"\0" * padding)
+            if not (isinstance(values, array) and values.typecode == typecode):
+                # BVH node arrays are built with platform-sized types, so narrow them to the file's
+                values = array(typecode, values)
+            values.tofile(f)
+            position += padding + len(values) * values.itemsize
+
+
+class MappedMesh(Mesh):
+    """
+    A mesh whose arrays are views into a memory-mapped file. Opening it reads only the header; the
+    operating system pages in the parts of the file that rays actually touch, and processes that map
+    the same file share those pages.
+    """
+
+    def __init__(self, path: str, material: Material = None):
+        """
+        Maps a mesh written by write_mesh.
+
+            Parameters:
+                path (str)
+                material (Material)
+        """
+
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.path = path
+
+        view = memoryview(self._map)
+        magic, version, *counts = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} packed mesh")
+        if sys.byteorder != "little":
+            raise ValueError(
+                "Packed meshes can only be mapped on little-endian machines"
+            )
+
+        sections = []
+        position = HEADER.size
+        for typecode, length in _sections(*counts):
+            position = _aligned(position)
+            size = length * array(typecode).itemsize
+            sections.append(view[position : position + size].cast(typecode))
+            position += size
+        vertices, normals, indices, normal_indices, *nodes = sections
+        smooth = counts[3]
+
+        bvh = BVH.from_arrays(*nodes)
+        super().__init__(
+            vertices,
+            indices,
+            normals if smooth else None,
+            normal_indices if smooth else None,
+            material,
+            bvh,
+        )
+
+    def __copy__(self) -> MappedMesh:
+        # Map the file again rather than holding its views, which could not then be pickled
+        return _remap(self.path, copy(self.material), copy(self.transform))
+
+    def __reduce__(self):
+        # Worker processes map the file again rather than receiving a copy of its contents
+        return _remap, (self.path, self.material, self.transform)
+
+
+def _remap(path: str, material: Material, transform) -> MappedMesh:
+    mesh = MappedMesh(path, material)
+    mesh.transform = transform
+    return mesh
+
+
+def load_mesh(path: str, material: Material = None) -> MappedMesh:
+    """
+    Maps a packed mesh file into memory.
+
+        Parameters:
+            path (str)
+            material (Material)
+
+        Returns:
+            mesh (MappedMesh)
+    """
+
+    return MappedMesh(path, material)
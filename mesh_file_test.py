@@ -0,0 +1,134 @@
+import os
+import pickle
+import tempfile
+from copy import copy
+from random import Random
+from mesh import Mesh
+from mesh_file import MappedMesh, load_mesh, write_mesh
+from mesh_test import random_triangles
+from obj_parser import parse_obj
+from ray import Ray
+from transformations import translation
+from world import World
+from tuple import point, vector, normalize
+import unittest
+
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".mesh")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_scenario1(self):
+        """
+        Scenario: A mapped mesh finds the same hits as the mesh it was written from
+            Given mesh ← mesh of 300 random triangles
+            When write_mesh(mesh, path)
+            And mapped ← load_mesh(path)
+            Then mapped has the same vertices, indices and BVH nodes as mesh
+            And for 100 random rays, nearest(r, mapped) = nearest(r, mesh)
+        """
+
+        mesh = Mesh(*random_triangles(300))
+        write_mesh(mesh, self.path)
+        mapped = load_mesh(self.path)
+        self.assertEqual(list(mapped.vertices), list(mesh.vertices))
+        self.assertEqual(list(mapped.indices), list(mesh.indices))
+        self.assertEqual(list(mapped.bvh.bounds), list(mesh.bvh.bounds))
+        self.assertEqual(list(mapped.bvh.offset), list(mesh.bvh.offset))
+
+        rng = Random(9)
+        for _ in range(100):
+            r = Ray(
+                point(rng.uniform(-10, 10), rng.uniform(-10, 10), -20),
+                normalize(vector(rng.uniform(-0.3, 0.3), rng.uniform(-0.3, 0.3), 1)),
+            )
+            self.assertEqual(r.nearest(mapped), r.nearest(mesh))
+
+    def test_scenario2(self):
+        """
+        Scenario: Smooth normals survive the round trip
+            Given mesh ← parse_obj of a triangle with a normal per corner
+            When write_mesh(mesh, path)
+            And mapped ← load_mesh(path)
+            And r ← ray(point(-0.2, 0.3, -2), vector(0, 0, 1))
+            Then normal_at(mapped, point, intersect(mapped, r)[0]) = vector(-0.5547, 0.83205, 0)
+        """
+
+        mesh = parse_obj(
+            [
+                "v 0 1 0",
+                "v -1 0 0",
+                "v 1 0 0",
+                "vn 0 1 0",
+                "vn -1 0 0",
+                "vn 1 0 0",
+                "f 1//1 2//2 3//3",
+            ]
+        )
+        write_mesh(mesh, self.path)
+        mapped = load_mesh(self.path)
+        r = Ray(point(-0.2, 0.3, -2), vector(0, 0, 1))
+        i = r.intersect(mapped)[0]
+        n = mapped.normal_at(r.position(i.t), i)
+        self.assertEqual(n, vector(-0.5547, 0.83205, 0))
+
+    def test_scenario3(self):
+        """
+        Scenario: Pickling a mapped mesh maps the file again instead of copying it
+            Given mapped ← load_mesh(path) with transform translation(0, 0, 1)
+            When copy ← unpickle(pickle(mapped))
+            Then the pickle is smaller than 1 KB
+            And copy.transform = mapped.transform
+            And copy finds the same hits as mapped
+        """
+
+        write_mesh(Mesh(*random_triangles(300)), self.path)
+        mapped = load_mesh(self.path)
+        mapped.set_transform(translation(0, 0, 1))
+        data = pickle.dumps(mapped)
+        self.assertLess(len(data), 1024)
+        restored = pickle.loads(data)
+        self.assertIsInstance(restored, MappedMesh)
+        self.assertEqual(restored.transform, mapped.transform)
+        r = Ray(point(0, 0, -20), vector(0, 0, 1))
+        self.assertEqual(r.nearest(restored), r.nearest(mapped))
+
+    def test_scenario4(self):
+        """
+        Scenario: Mapping a file that isn't a packed mesh
+            Given path ← a file containing text
+            Then load_mesh(path) raises ValueError
+        """
+
+        with open(self.path, "w") as f:
+            f.write("v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n" * 4)
+        with self.assertRaises(ValueError):
+            load_mesh(self.path)
+
+    def test_scenario5(self):
+        """
+        Scenario: A copy of a mapped mesh maps the file again and can be sent to workers
+            Given mapped ← load_mesh(path) with transform translation(0, 0, 1)
+            When placed ← copy(mapped)
+            Then placed is a mapped mesh with its own material and transform
+            And unpickle(pickle(world([placed]))).objects[0] finds the same hits as mapped
+        """
+
+        write_mesh(Mesh(*random_triangles(300)), self.path)
+        mapped = load_mesh(self.path)
+        mapped.set_transform(translation(0, 0, 1))
+        placed = copy(mapped)
+        self.assertIsInstance(placed, MappedMesh)
+        self.assertIsNot(placed.material, mapped.material)
+        self.assertEqual(placed.transform, mapped.transform)
+        restored = pickle.loads(pickle.dumps(World([placed]))).objects[0]
+        r = Ray(point(0, 0, -20), vector(0, 0, 1))
+        self.assertEqual(r.nearest(restored), r.nearest(mapped))
+
+
+if __name__ == "__main__":
+    unittest.main()
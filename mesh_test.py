@@ -0,0 +1,161 @@
+from array import array
+from random import Random
+from mesh import Mesh
+from ray import Ray
+from transformations import scaling, translation
+from triangle import Triangle
+from tuple import point, vector, normalize
+from world import World, prepare_computations
+import unittest
+
+
+def random_triangles(count: int, seed: int = 3) -> tuple:
+    rng = Random(seed)
+    vertices = array("f")
+    indices = array("I")
+    for f in range(count):
+        cx, cy, cz = (rng.uniform(-10, 10) for _ in range(3))
+        for _ in range(3):
+            vertices.extend(
+                (
+                    cx + rng.uniform(-1, 1),
+                    cy + rng.uniform(-1, 1),
+                    cz + rng.uniform(-1, 1),
+                )
+            )
+        indices.extend((3 * f, 3 * f + 1, 3 * f + 2))
+    return vertices, indices
+
+
+class Tests(unittest.TestCase):
+    def test_scenario1(self):
+        """
+        Scenario: A mesh finds the same hits as separate triangles
+            Given (vertices, indices) ← 300 random triangles
+            And mesh ← mesh(vertices, indices)
+            And triangles ← a triangle() for each face
+            Then for 200 random rays, nearest(r, mesh) = the nearest t over triangles
+        """
+
+        vertices, indices = random_triangles(300)
+        mesh = Mesh(vertices, indices)
+        triangles = []
+        for f in range(mesh.face_count):
+            a, b, c = mesh.corners(f)
+            triangles.append(Triangle(point(*a), point(*b), point(*c)))
+
+        rng = Random(5)
+        for _ in range(200):
+            r = Ray(
+                point(rng.uniform(-10, 10), rng.uniform(-10, 10), -20),
+                normalize(vector(rng.uniform(-0.3, 0.3), rng.uniform(-0.3, 0.3), 1)),
+            )
+            ts = [t for t in (r.nearest(tri) for tri in triangles) if t is not None]
+            expected = min(ts) if ts else None
+            found = r.nearest(mesh)
+            if expected is None:
+                self.assertIsNone(found)
+            else:
+                self.assertAlmostEqual(found, expected)
+
+    def test_scenario2(self):
+        """
+        Scenario: A mesh stores its faces as packed arrays, not objects
+            Given mesh ← mesh of 100 random triangles
+            Then mesh.vertices is a float32 array
+            And mesh.indices is a uint32 array
+            And the items of mesh's BVH are a uint32 array
+        """
+
+        mesh = Mesh(*random_triangles(100))
+        self.assertEqual(mesh.vertices.typecode, "f")
+        self.assertEqual(mesh.indices.typecode, "I")
+        self.assertIsInstance(mesh.bvh.items, array)
+        self.assertEqual(sorted(mesh.bvh.items), list(range(100)))
+
+    def test_scenario3(self):
+        """
+        Scenario: The world treats a transformed mesh as one object
+            Given mesh ← a unit square in the xy plane made of two faces
+            And set_transform(mesh, translation(0, 0, 5) * scaling(2, 2, 2))
+            And w ← world([mesh])
+            And r ← ray(point(1.5, 1.5, 0), vector(0, 0, 1))
+            When i ← closest_hit(w, r)
+            Then i.t = 5
+            And i.face = 1
+            And prepare_computations(i, r).normalv = vector(0, 0, -1)
+            And bounds(mesh) = (point(-2, -2, 5), point(2, 2, 5))
+        """
+
+        mesh = Mesh(
+            array("f", [-1, -1, 0, 1, -1, 0, 1, 1, 0, -1, 1, 0]),
+            array("I", [0, 1, 3, 1, 2, 3]),
+        )
+        mesh.set_transform(translation(0, 0, 5) * scaling(2, 2, 2))
+        w = World([mesh])
+        r = Ray(point(1.5, 1.5, 0), vector(0, 0, 1))
+        i = w.closest_hit(r)
+        self.assertEqual(i.t, 5)
+        self.assertEqual(i.face, 1)
+        self.assertEqual(prepare_computations(i, r).normalv, vector(0, 0, -1))
+        minimum, maximum = mesh.bounds()
+        self.assertEqual(minimum, point(-2, -2, 5))
+        self.assertEqual(maximum, point(2, 2, 5))
+
+    def test_scenario4(self):
+        """
+        Scenario: A world finds the face it shades in the same search that finds the closest hit
+            Given mesh ← mesh of 300 random triangles
+            And w ← world([mesh])
+            And r ← ray from z = -20 towards the middle of face 0
+            When i ← closest_hit(w, r)
+            Then the faces tested are the faces tested by nearest(mesh, r)
+            And intersecting i.face alone gives i.t, i.u and i.v
+        """
+
+        mesh = Mesh(*random_triangles(300))
+        w = World([mesh])
+        a, b, c = mesh.corners(0)
+        r = Ray(
+            point((a[0] + b[0] + c[0]) / 3, (a[1] + b[1] + c[1]) / 3, -20),
+            vector(0, 0, 1),
+        )
+        tested = []
+        test_face = mesh._nearest_face
+
+        def counting(face, ray, t_min, t_max):
+            tested.append(face)
+            return test_face(face, ray, t_min, t_max)
+
+        mesh._nearest_face = counting
+        mesh.nearest(r)
+        expected = list(tested)
+        tested.clear()
+        i = w.closest_hit(r)
+        self.assertEqual(tested, expected)
+        self.assertEqual(mesh._hit_face(i.face, r), (i.t, i.u, i.v))
+
+    def test_scenario5(self):
+        """
+        Scenario: Meshes built on a shared hierarchy leave it unchanged
+            Given mesh ← mesh of 300 random triangles
+            And other ← mesh(mesh.vertices, mesh.indices) on mesh.bvh
+            Then mesh.bvh.nearest is unchanged
+            And nearest(mesh, r) = nearest(other, r) for a ray r that hits both
+        """
+
+        mesh = Mesh(*random_triangles(300))
+        original = mesh.bvh.nearest
+        other = Mesh(mesh.vertices, mesh.indices, bvh=mesh.bvh)
+        self.assertIs(mesh.bvh.nearest, original)
+        a, b, c = mesh.corners(0)
+        r = Ray(
+            point((a[0] + b[0] + c[0]) / 3, (a[1] + b[1] + c[1]) / 3, -20),
+            vector(0, 0, 1),
+        )
+        self.assertIsNotNone(r.nearest(mesh))
+        self.assertEqual(r.nearest(mesh), r.nearest(other))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+from array import array
+from material import Material
+from mesh import Mesh
+
+
+def parse_obj(lines, material: Material = None) -> Mesh:
+    """
+    Reads Wavefront OBJ vertices, normals and faces straight into a Mesh's packed arrays. Polygons
+    are split into fans of triangles, and lines the renderer has no use for (texture coordinates,
+    groups, materials) are skipped.
+
+        Parameters:
+            lines (Iterable): Lines of OBJ text, such as an open file
+            material (Material)
+
+        Returns:
+            mesh (Mesh): Smooth-shaded if every face gives a normal for each corner
+    """
+
+    vertices = array("f")
+    normals = array("f")
+    indices = array("I")
+    normal_indices = array("I")
+    smooth = True
+
+    for line in lines:
+        parts = line.split()
+        if not parts:
+            continue
+        kind = parts[0]
+        if kind == "v":
+            vertices.extend(float(c) for c in parts[1:4])
+        elif kind == "vn":
+            normals.extend(float(c) for c in parts[1:4])
+        elif kind == "f":
+            corners = []
+            corner_normals = []
+            for corner in parts[1:]:
+                fields = corner.split("/")
+                corners.append(_index(fields[0], len(vertices) // 3))
+                if len(fields) == 3 and fields[2]:
+                    corner_normals.append(_index(fields[2], len(normals) // 3))
+            if len(corner_normals) != len(corners):
+                smooth = False
+            for k in range(1, len(corners) - 1):
+                indices.extend((corners[0], corners[k], corners[k + 1]))
+                if smooth:
+                    normal_indices.extend(
+                        (corner_normals[0], corner_normals[k], corner_normals[k + 1])
+                    )
+
+    if not smooth:
+        return Mesh(vertices, indices, material=material)
+    return Mesh(vertices, indices, normals, normal_indices, material)
+
+
+def load_obj(path: str, material: Material = None) -> Mesh:
+    """
+    Reads a Wavefront OBJ file into a Mesh.
+
+        Parameters:
+            path (str)
+            material (Material)
+
+        Returns:
+            mesh (Mesh)
+    """
+
+    with open(path) as f:
+        return parse_obj(f, material)
+
+
+def _index(field: str, count: int) -> int:
+    # OBJ indexes count from 1, and negative ones count back from the most recent element
+    i = int(field)
+    return i - 1 if i > 0 else count + i
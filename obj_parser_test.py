@@ -0,0 +1,127 @@
+from obj_parser import parse_obj
+from ray import Ray
+from tuple import point, vector
+import unittest
+
+
+class Tests(unittest.TestCase):
+    def test_scenario1(self):
+        """
+        Scenario: Ignoring unrecognized lines
+            Given gibberish ← a file containing only unrecognized lines
+            When mesh ← parse_obj(gibberish)
+            Then mesh has no faces
+        """
+
+        gibberish = """There was a young lady named Bright
+who traveled much faster than light.
+She set out one day
+in a relative way,
+and came back the previous night."""
+        mesh = parse_obj(gibberish.splitlines())
+        self.assertEqual(mesh.face_count, 0)
+
+    def test_scenario2(self):
+        """
+        Scenario: Vertex records and triangle faces fill the packed arrays
+            Given file ← a file containing:
+              v -1 1 0
+              v -1 0 0
+              v 1 0 0
+              v 1 1 0
+              f 1 2 3
+              f 1 3 4
+            When mesh ← parse_obj(file)
+            Then mesh.vertices = [-1, 1, 0, -1, 0, 0, 1, 0, 0, 1, 1, 0]
+            And mesh.indices = [0, 1, 2, 0, 2, 3]
+        """
+
+        mesh = parse_obj(
+            ["v -1 1 0", "v -1 0 0", "v 1 0 0", "v 1 1 0", "f 1 2 3", "f 1 3 4"]
+        )
+        self.assertEqual(list(mesh.vertices), [-1, 1, 0, -1, 0, 0, 1, 0, 0, 1, 1, 0])
+        self.assertEqual(list(mesh.indices), [0, 1, 2, 0, 2, 3])
+        self.assertFalse(mesh.normal_indices)
+
+    def test_scenario3(self):
+        """
+        Scenario: Triangulating polygons
+            Given file ← a file containing five vertices and "f 1 2 3 4 5"
+            When mesh ← parse_obj(file)
+            Then mesh.indices = [0, 1, 2, 0, 2, 3, 0, 3, 4]
+        """
+
+        mesh = parse_obj(
+            [
+                "v -1 1 0",
+                "v -1 0 0",
+                "v 1 0 0",
+                "v 1 1 0",
+                "v 0 2 0",
+                "",
+                "f 1 2 3 4 5",
+            ]
+        )
+        self.assertEqual(list(mesh.indices), [0, 1, 2, 0, 2, 3, 0, 3, 4])
+
+    def test_scenario4(self):
+        """
+        Scenario: Faces with normals and negative indexes
+            Given file ← a file containing:
+              v 0 1 0
+              v -1 0 0
+              v 1 0 0
+              vn -1 0 0
+              vn 1 0 0
+              vn 0 1 0
+              f 1//3 2//1 3//2
+              f -3/0/-1 -2/102/-3 -1/14/-2
+            When mesh ← parse_obj(file)
+            Then mesh.indices = [0, 1, 2, 0, 1, 2]
+            And mesh.normal_indices = [2, 0, 1, 2, 0, 1]
+        """
+
+        mesh = parse_obj(
+            [
+                "v 0 1 0",
+                "v -1 0 0",
+                "v 1 0 0",
+                "vn -1 0 0",
+                "vn 1 0 0",
+                "vn 0 1 0",
+                "f 1//3 2//1 3//2",
+                "f -3/0/-1 -2/102/-3 -1/14/-2",
+            ]
+        )
+        self.assertEqual(list(mesh.indices), [0, 1, 2, 0, 1, 2])
+        self.assertEqual(list(mesh.normal_indices), [2, 0, 1, 2, 0, 1])
+
+    def test_scenario5(self):
+        """
+        Scenario: A parsed smooth mesh shades with interpolated normals
+            Given mesh ← parse_obj of a triangle with normals vector(0, 1, 0), vector(-1, 0, 0), vector(1, 0, 0)
+            And r ← ray(point(-0.2, 0.3, -2), vector(0, 0, 1))
+            When i ← intersect(mesh, r)[0]
+            Then normal_at(mesh, position(r, i.t), i) = vector(-0.5547, 0.83205, 0)
+        """
+
+        mesh = parse_obj(
+            [
+                "v 0 1 0",
+                "v -1 0 0",
+                "v 1 0 0",
+                "vn 0 1 0",
+                "vn -1 0 0",
+                "vn 1 0 0",
+                "f 1//1 2//2 3//3",
+            ]
+        )
+        r = Ray(point(-0.2, 0.3, -2), vector(0, 0, 1))
+        i = r.intersect(mesh)[0]
+        self.assertEqual(i.face, 0)
+        n = mesh.normal_at(r.position(i.t), i)
+        self.assertEqual(n, vector(-0.5547, 0.83205, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+from copy import copy
+from math import inf
+from material import Material
+from ray import Ray, Intersection, Intersections
+from shape import Shape
+from tuple import Tuple, vector, normalize
+
+
+class Plane(Shape):
+    def __init__(self, material: Material = None):
+        """
+        An infinite plane, the xz plane (y = 0) in object space.
+
+            Parameters:
+                material (Material)
+        """
+
+        super().__init__(material)
+
+    @property
+    def coefficients(self) -> tuple:
+        """
+        World-space plane equation (a, b, c, d), where a*x + b*y + c*z + d = 0 on the plane.
+        """
+
+        if self._dirty:
+            self._refresh()
+        return self._coefficients
+
+    def _refresh(self) -> None:
+        super()._refresh()
+        # Planes transform by the inverse transpose, so y = 0 becomes the second row of the inverse
+        m = self._inverse.matrix
+        self._coefficients = (m[4], m[5], m[6], m[7])
+        self._normal = normalize(vector(m[4], m[5], m[6]))
+
+    def intersect_t(self, origin: Tuple, direction: Tuple) -> float:
+        """
+        Finds where a ray crosses the plane, straight from the world-space plane equation.
+
+            Parameters:
+                origin (Tuple): Tuple with type=point
+                direction (Tuple): Tuple with type=vector
+
+            Returns:
+                t (float): None if the ray runs parallel to the plane
+        """
+
+        a, b, c, d = self.coefficients
+        denominator = a * direction.x + b * direction.y + c * direction.z
+        if denominator == 0:
+            return None
+        return -(a * origin.x + b * origin.y + c * origin.z + d) / denominator
+
+    def local_intersect(self, ray: Ray) -> list:
+        if ray.direction.y == 0:
+            return []
+        return [-ray.origin.y / ray.direction.y]
+
+    def local_normal_at(self, p: Tuple, hit: Intersection = None) -> Tuple:
+        return vector(0, 1, 0)
+
+    # The world-space plane equation answers these without moving the ray into object space
+
+    def intersect(self, ray: Ray) -> Intersections:
+        t = self.intersect_t(ray.origin, ray.direction)
+        if t is None:
+            return Intersections()
+        return Intersections(Intersection(t, self))
+
+    def nearest(self, ray: Ray, t_min: float = 0, t_max: float = inf) -> float:
+        t = self.intersect_t(ray.origin, ray.direction)
+        if t is not None and t_min <= t < t_max:
+            return t
+        return None
+
+    def normal_at(self, p: Tuple, hit: Intersection = None) -> Tuple:
+        if self._dirty:
+            self._refresh()
+        return self._normal
+
+    def __copy__(self) -> Plane:
+        p = Plane(copy(self.material))
+        p.transform = copy(self.transform)
+        return p
+
+    def __eq__(self, other: Plane) -> bool:
+        return (
+            isinstance(other, Plane)
+            and self.transform == other.transform
+            and self.material == other.material
+        )
+
+    def __repr__(self):
+        return f"Plane with transform {self.transform}"
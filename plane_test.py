@@ -0,0 +1,127 @@
+from math import pi, sqrt
+from plane import Plane
+from ray import Ray
+from transformations import rotation_x, translation
+from tuple import point, vector
+import unittest
+
+
+class Tests(unittest.TestCase):
+    def test_scenario1(self):
+        """
+        Scenario: The normal of a plane is constant everywhere
+            Given p ← plane()
+            When n1 ← normal_at(p, point(0, 0, 0))
+            And n2 ← normal_at(p, point(10, 0, -10))
+            And n3 ← normal_at(p, point(-5, 0, 150))
+            Then n1 = vector(0, 1, 0)
+            And n2 = vector(0, 1, 0)
+            And n3 = vector(0, 1, 0)
+        """
+
+        p = Plane()
+        self.assertEqual(p.normal_at(point(0, 0, 0)), vector(0, 1, 0))
+        self.assertEqual(p.normal_at(point(10, 0, -10)), vector(0, 1, 0))
+        self.assertEqual(p.normal_at(point(-5, 0, 150)), vector(0, 1, 0))
+
+    def test_scenario2(self):
+        """
+        Scenario: Intersect with a ray parallel to the plane
+            Given p ← plane()
+            And r ← ray(point(0, 10, 0), vector(0, 0, 1))
+            When xs ← intersect(p, r)
+            Then xs is empty
+        """
+
+        p = Plane()
+        r = Ray(point(0, 10, 0), vector(0, 0, 1))
+        self.assertEqual(r.intersect(p).count, 0)
+
+    def test_scenario3(self):
+        """
+        Scenario: Intersect with a coplanar ray
+            Given p ← plane()
+            And r ← ray(point(0, 0, 0), vector(0, 0, 1))
+            When xs ← intersect(p, r)
+            Then xs is empty
+        """
+
+        p = Plane()
+        r = Ray(point(0, 0, 0), vector(0, 0, 1))
+        self.assertEqual(r.intersect(p).count, 0)
+
+    def test_scenario4(self):
+        """
+        Scenario: A ray intersecting a plane from above
+            Given p ← plane()
+            And r ← ray(point(0, 1, 0), vector(0, -1, 0))
+            When xs ← intersect(p, r)
+            Then xs.count = 1
+            And xs[0].t = 1
+            And xs[0].object = p
+        """
+
+        p = Plane()
+        r = Ray(point(0, 1, 0), vector(0, -1, 0))
+        xs = r.intersect(p)
+        self.assertEqual(xs.count, 1)
+        self.assertEqual(xs[0].t, 1)
+        self.assertIs(xs[0].object, p)
+
+    def test_scenario5(self):
+        """
+        Scenario: A ray intersecting a plane from below
+            Given p ← plane()
+            And r ← ray(point(0, -1, 0), vector(0, 1, 0))
+            When xs ← intersect(p, r)
+            Then xs.count = 1
+            And xs[0].t = 1
+            And xs[0].object = p
+        """
+
+        p = Plane()
+        r = Ray(point(0, -1, 0), vector(0, 1, 0))
+        xs = r.intersect(p)
+        self.assertEqual(xs.count, 1)
+        self.assertEqual(xs[0].t, 1)
+        self.assertIs(xs[0].object, p)
+
+    def test_scenario6(self):
+        """
+        Scenario: Intersecting and shading a transformed plane
+            Given p ← plane()
+            And set_transform(p, translation(0, 0, 5) * rotation_x(π/2))
+            And r ← ray(point(1, 2, 0), vector(0, 0, 1))
+            Then nearest(r, p) = 5
+            And nearest(r, p, 0, 5) is nothing
+            And normal_at(p, point(1, 2, 5)) = vector(0, 0, 1)
+        """
+
+        p = Plane()
+        p.set_transform(translation(0, 0, 5) * rotation_x(pi / 2))
+        r = Ray(point(1, 2, 0), vector(0, 0, 1))
+        self.assertAlmostEqual(r.nearest(p), 5)
+        self.assertIsNone(r.nearest(p, 0, 5))
+        self.assertEqual(p.normal_at(point(1, 2, 5)), vector(0, 0, 1))
+
+    def test_scenario7(self):
+        """
+        Scenario: A ray hits a slanted plane where the plane equation says
+            Given p ← plane()
+            And set_transform(p, rotation_x(π/4))
+            And r ← ray(point(0, 1, -3), vector(0, 0, 1))
+            Then nearest(r, p) = 2
+            And normal_at(p, point(0, 1, -1)) = vector(0, √2/2, √2/2)
+        """
+
+        p = Plane()
+        p.set_transform(rotation_x(pi / 4))
+        r = Ray(point(0, 1, -3), vector(0, 0, 1))
+        self.assertAlmostEqual(r.nearest(p), 2)
+        self.assertEqual(
+            p.normal_at(point(0, 1, -1)), vector(0, sqrt(2) / 2, sqrt(2) / 2)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
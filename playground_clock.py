@@ -1,6 +1,7 @@
 from math import pi
 from canvas import Canvas, Color
-from transformations import rotation_y
+from matrix import transform_points
+from transformations import rotation_y, scaling, translation
 from tuple import point
 
 # Choose an axis to orient the clock. If, for example, it's oriented along the y axis and you're looking at it face-on, then you're looking toward the negative end of the y axis. This means twelve o' clock is on the z axis at point(0, 0, 1) and three o' clock is on the x axis at point(1, 0, 0).
@@ -19,10 +20,10 @@ c = Canvas(size, size)
 
 radius = (3 / 8) * size
 
-for p in points:
-    x = radius * p.x + size / 2
-    z = radius * p.z + size / 2
-    c.write_pixel(round(x), round(z), Color(0, 1, 0))
+# Scaling by the radius and moving to the center is one matrix, so every point can be mapped onto the canvas in one batch.
+to_canvas = translation(size / 2, 0, size / 2) * scaling(radius, 1, radius)
+for p in transform_points(to_canvas, points):
+    c.write_pixel(round(p.x), round(p.z), Color(0, 1, 0))
 
 with open("test.ppm", "w") as f:
     f.write(c.to_ppm())
@@ -1,35 +1,25 @@
 from math import pi
-from canvas import Color
+from canvas import Color, PPMWriter
 from camera import Camera
 from lights import PointLight
 from material import Material
+from plane import Plane
 from sphere import Sphere
 from transformations import scaling, translation, rotation_y, rotation_x, view_transform
 from tuple import point, vector
 from world import World
 
-floor = Sphere()
-floor.transform = scaling(10, 0.01, 10)
+floor = Plane()
 floor.material = Material()
 floor.material.color = Color(1, 0.9, 0.9)
 floor.material.specular = 0
 
-left_wall = Sphere()
-left_wall.transform = (
-    translation(0, 0, 5)
-    * rotation_y(-pi / 4)
-    * rotation_x(pi / 2)
-    * scaling(10, 0.01, 10)
-)
+left_wall = Plane()
+left_wall.transform = translation(0, 0, 5) * rotation_y(-pi / 4) * rotation_x(pi / 2)
 left_wall.material = floor.material
 
-right_wall = Sphere()
-right_wall.transform = (
-    translation(0, 0, 5)
-    * rotation_y(pi / 4)
-    * rotation_x(pi / 2)
-    * scaling(10, 0.01, 10)
-)
+right_wall = Plane()
+right_wall.transform = translation(0, 0, 5) * rotation_y(pi / 4) * rotation_x(pi / 2)
 right_wall.material = floor.material
 
 middle = Sphere()
@@ -56,7 +46,6 @@ world = World(
 camera = Camera(2560, 1600, pi / 3)
 camera.transform = view_transform(point(0, 1.5, -5), point(0, 1, 0), vector(0, 1, 0))
 
-canvas = camera.render(world)
-
-with open("test.ppm", "w") as f:
-    f.write(canvas.to_ppm())
+# Stream rows to the file as they are traced instead of holding the whole image
+with open("test.ppm", "wb") as f:
+    camera.render_stream(world, PPMWriter(f, camera.hsize, camera.vsize))
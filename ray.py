@@ -1,14 +1,21 @@
 from copy import copy
-from math import sqrt
-from matrix import Matrix, inverse
-from sphere import Sphere
-from tuple import Tuple, point, dot
+from math import inf
+from matrix import Matrix
+from tuple import Tuple
 
 
 class Intersection:
-    def __init__(self, t: float, object):
+    __slots__ = ("t", "object", "u", "v", "face")
+
+    def __init__(
+        self, t: float, object, u: float = None, v: float = None, face: int = None
+    ):
         self.t = t
         self.object = object
+        # Where on a triangle the hit landed, and which face of a mesh it was
+        self.u = u
+        self.v = v
+        self.face = face
 
     def __repr__(self):
         return f"{self.object} at {self.t}"
@@ -54,6 +61,8 @@ def hit(intersections: Intersections) -> Intersection:
 
 
 class Ray:
+    __slots__ = ("origin", "direction")
+
     def __init__(self, origin: Tuple, direction: Tuple):
         self.origin = origin
         self.direction = direction
@@ -72,33 +81,33 @@ class Ray:
         point = self.origin + self.direction * t
         return point
 
-    def intersect(self, obj) -> Intersection:
+    def intersect(self, obj) -> Intersections:
         """
         Determine where ray intersects object.
 
             Parameters:
-                obj (Any)
+                obj (Shape)
 
             Returns:
-                intersection (Intersection)
+                intersections (Intersections)
         """
 
-        if isinstance(obj, Sphere):
-            # Calculate intersection with sphere
-            ray2 = transform(self, inverse(obj.transform))
-            sphere_to_ray = ray2.origin - point(0, 0, 0)
-            a = dot(ray2.direction, ray2.direction)
-            b = 2 * dot(ray2.direction, sphere_to_ray)
-            c = dot(sphere_to_ray, sphere_to_ray) - 1
+        return obj.intersect(self)
 
-            discriminant = b**2 - 4 * a * c
+    def nearest(self, obj, t_min: float = 0, t_max: float = inf) -> float:
+        """
+        Finds the closest place the ray crosses an object within [t_min, t_max), without building intersections.
 
-            if discriminant < 0:
-                return Intersections()
+            Parameters:
+                obj (Shape)
+                t_min (float)
+                t_max (float)
+
+            Returns:
+                t (float): None if there is no crossing in range
+        """
 
-            t1 = (-b - sqrt(discriminant)) / (2 * a)
-            t2 = (-b + sqrt(discriminant)) / (2 * a)
-            return Intersections(Intersection(t1, obj), Intersection(t2, obj))
+        return obj.nearest(self, t_min, t_max)
 
     def __copy__(self):
         return Ray(self.origin, self.direction)
@@ -110,7 +119,7 @@ def transform(ray: Ray, transformation: Matrix) -> Ray:
 
         Parameters:
             ray (Ray)
-            transformation (Matrix)
+            transformation (Matrix): Matrix or AffineTransform
 
         Returns:
             transformed (Ray)
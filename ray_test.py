@@ -195,6 +195,24 @@ class Tests(unittest.TestCase):
         self.assertEqual(r2.origin, point(2, 6, 12))
         self.assertEqual(r2.direction, vector(0, 3, 0))
 
+    def test_scenario12(self):
+        """
+        Scenario: The nearest crossing of a sphere within a range
+            Given r ← ray(point(0, 0, -5), vector(0, 0, 1))
+            And s ← sphere()
+            Then nearest(r, s) = 4
+            And nearest(r, s, 5) = 6
+            And nearest(r, s, 0, 4) is nothing
+            And nearest(ray(point(0, 2, -5), vector(0, 0, 1)), s) is nothing
+        """
+
+        r = Ray(point(0, 0, -5), vector(0, 0, 1))
+        s = Sphere()
+        self.assertEqual(r.nearest(s), 4)
+        self.assertEqual(r.nearest(s, 5), 6)
+        self.assertIsNone(r.nearest(s, 0, 4))
+        self.assertIsNone(Ray(point(0, 2, -5), vector(0, 0, 1)).nearest(s))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,233 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from math import inf
+from affine import AffineTransform, is_affine
+from material import Material
+from matrix import Matrix, identity_matrix, inverse, transpose
+from ray import Ray, Intersection, Intersections, transform
+from tuple import Tuple, point, normalize
+from watched import Watched
+
+
+class Shape(Watched, ABC):
+    """
+    Base for everything a ray can hit. Subclasses describe themselves in object space through
+    local_intersect, local_normal_at and local_bounds; Shape moves rays, normals and bounds between
+    object space and world space using the cached inverse of its transform. Whatever watches a shape
+    is told when its transform changes.
+    """
+
+    def __init__(self, material: Material = None):
+        self._watchers = []
+        self.transform = identity_matrix
+        self.material = Material() if material is None else material
+
+    @property
+    def transform(self) -> Matrix:
+        return self._transform
+
+    @transform.setter
+    def transform(self, transformation: Matrix) -> None:
+        # Mark the cached inverse as stale so it is recomputed on next use
+        self._transform = transformation
+        self._dirty = True
+        self._changed()
+
+    def __getstate__(self) -> dict:
+        # Watchers are held weakly and belong to this process, so a pickled shape starts unwatched
+        state = self.__dict__.copy()
+        state["_watchers"] = []
+        return state
+
+    @property
+    def inverse(self) -> Matrix:
+        """
+        Inverse of the shape's transformation matrix, cached until the transform changes.
+        """
+
+        if self._dirty:
+            self._refresh()
+        return self._inverse
+
+    @property
+    def inverse_transpose(self) -> Matrix:
+        """
+        Transpose of the inverse transformation matrix, used to move normals to world space.
+        """
+
+        if self._dirty:
+            self._refresh()
+        return self._inverse_transpose
+
+    def _refresh(self) -> None:
+        if is_affine(self._transform):
+            # Affine inverses are cheaper to compute and to apply to every ray
+            self._inverse = AffineTransform.from_matrix(self._transform).inverse()
+        else:
+            self._inverse = inverse(self._transform)
+        self._inverse_transpose = transpose(self._inverse)
+        self._dirty = False
+
+    def set_transform(self, transformation: Matrix) -> None:
+        """
+        Set a shape's transformation matrix to a given one.
+
+            Parameters:
+                transformation (Matrix)
+        """
+
+        self.transform = transformation
+
+    @abstractmethod
+    def local_intersect(self, ray: Ray) -> list:
+        """
+        Finds where a ray crosses the shape, in object space.
+
+            Parameters:
+                ray (Ray): Ray already moved into object space
+
+            Returns:
+                ts (list): Every t where the ray crosses the shape
+        """
+
+    @abstractmethod
+    def local_normal_at(self, p: Tuple, hit: Intersection = None) -> Tuple:
+        """
+        Computes the normal at a point on the shape, in object space.
+
+            Parameters:
+                p (Tuple): Tuple with type=point, in object space
+                hit (Intersection): The intersection at p, for shapes that need its u, v or face
+
+            Returns:
+                normal (Tuple): Not necessarily normalized
+        """
+
+    def local_bounds(self) -> tuple:
+        """
+        Object-space axis-aligned bounding box.
+
+            Returns:
+                (minimum, maximum) (tuple): Opposite corners, as points
+        """
+
+        return point(-inf, -inf, -inf), point(inf, inf, inf)
+
+    def intersect(self, ray: Ray) -> Intersections:
+        """
+        Determine where a world-space ray intersects the shape.
+
+            Parameters:
+                ray (Ray)
+
+            Returns:
+                intersections (Intersections)
+        """
+
+        ts = self.local_intersect(transform(ray, self.inverse))
+        return Intersections(*(Intersection(t, self) for t in ts))
+
+    def nearest(self, ray: Ray, t_min: float = 0, t_max: float = inf) -> float:
+        """
+        Finds the closest place a world-space ray crosses the shape within [t_min, t_max), without
+        building intersections.
+
+            Parameters:
+                ray (Ray)
+                t_min (float)
+                t_max (float)
+
+            Returns:
+                t (float): None if there is no crossing in range
+        """
+
+        nearest = None
+        for t in self.local_intersect(transform(ray, self.inverse)):
+            if t_min <= t < t_max:
+                t_max = t
+                nearest = t
+        return nearest
+
+    def hit(self, ray: Ray, t_min: float = 0, t_max: float = inf) -> Intersection:
+        """
+        Finds the closest place a world-space ray crosses the shape within [t_min, t_max), with what
+        is needed to shade it. Shapes that need more than t to shade, such as triangles and meshes,
+        override this to fill in u, v and face from the same search that finds t.
+
+            Parameters:
+                ray (Ray)
+                t_min (float)
+                t_max (float)
+
+            Returns:
+                intersection (Intersection): None if there is no crossing in range
+        """
+
+        t = self.nearest(ray, t_min, t_max)
+        return None if t is None else self.intersection(ray, t)
+
+    def intersection(self, ray: Ray, t: float) -> Intersection:
+        """
+        Builds the Intersection for a crossing found at t, for shapes that need nothing but t to shade.
+
+            Parameters:
+                ray (Ray)
+                t (float)
+
+            Returns:
+                intersection (Intersection)
+        """
+
+        return Intersection(t, self)
+
+    def normal_at(self, p: Tuple, hit: Intersection = None) -> Tuple:
+        """
+        Computes the world-space normal at a given point on the shape.
+
+            Parameters:
+                p (Tuple)
+                hit (Intersection): The intersection at p, for shapes that need its u, v or face
+
+            Returns:
+                normal (Tuple)
+        """
+
+        local_normal = self.local_normal_at(self.inverse * p, hit)
+        world_normal = self.inverse_transpose * local_normal
+        world_normal.w = 0
+        return normalize(world_normal)
+
+    def bounds(self) -> tuple:
+        """
+        World-space axis-aligned bounding box, found by transforming the corners of the local bounds.
+
+            Returns:
+                (minimum, maximum) (tuple): Opposite corners, as points
+        """
+
+        minimum, maximum = self.local_bounds()
+        if not all(
+            abs(c) < inf
+            for c in (minimum.x, minimum.y, minimum.z, maximum.x, maximum.y, maximum.z)
+        ):
+            return point(-inf, -inf, -inf), point(inf, inf, inf)
+
+        corners = [
+            self._transform * point(x, y, z)
+            for x in (minimum.x, maximum.x)
+            for y in (minimum.y, maximum.y)
+            for z in (minimum.z, maximum.z)
+        ]
+        corners = [point(c.x / c.w, c.y / c.w, c.z / c.w) for c in corners]
+        return (
+            point(
+                min(c.x for c in corners),
+                min(c.y for c in corners),
+                min(c.z for c in corners),
+            ),
+            point(
+                max(c.x for c in corners),
+                max(c.y for c in corners),
+                max(c.z for c in corners),
+            ),
+        )
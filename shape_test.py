@@ -0,0 +1,135 @@
+from math import pi, sqrt
+from material import Material
+from matrix import identity_matrix
+from ray import Ray
+from shape import Shape
+from transformations import rotation_z, scaling, translation
+from tuple import point, vector
+import unittest
+
+
+class RecordingShape(Shape):
+    def __init__(self):
+        super().__init__()
+        self.saved_ray = None
+
+    def local_intersect(self, ray: Ray) -> list:
+        self.saved_ray = ray
+        return []
+
+    def local_normal_at(self, p, hit=None):
+        return vector(p.x, p.y, p.z)
+
+    def local_bounds(self) -> tuple:
+        return point(-1, -1, -1), point(1, 1, 1)
+
+
+class Tests(unittest.TestCase):
+    def test_scenario1(self):
+        """
+        Scenario: The default transformation and material
+            Given s ← test_shape()
+            Then s.transform = identity_matrix
+            And s.material = material()
+        """
+
+        s = RecordingShape()
+        self.assertEqual(s.transform, identity_matrix)
+        self.assertEqual(s.material, Material())
+
+    def test_scenario2(self):
+        """
+        Scenario: Intersecting a scaled shape with a ray
+            Given r ← ray(point(0, 0, -5), vector(0, 0, 1))
+            And s ← test_shape()
+            When set_transform(s, scaling(2, 2, 2))
+            And xs ← intersect(s, r)
+            Then s.saved_ray.origin = point(0, 0, -2.5)
+            And s.saved_ray.direction = vector(0, 0, 0.5)
+        """
+
+        r = Ray(point(0, 0, -5), vector(0, 0, 1))
+        s = RecordingShape()
+        s.set_transform(scaling(2, 2, 2))
+        r.intersect(s)
+        self.assertEqual(s.saved_ray.origin, point(0, 0, -2.5))
+        self.assertEqual(s.saved_ray.direction, vector(0, 0, 0.5))
+
+    def test_scenario3(self):
+        """
+        Scenario: Intersecting a translated shape with a ray
+            Given r ← ray(point(0, 0, -5), vector(0, 0, 1))
+            And s ← test_shape()
+            When set_transform(s, translation(5, 0, 0))
+            And xs ← intersect(s, r)
+            Then s.saved_ray.origin = point(-5, 0, -5)
+            And s.saved_ray.direction = vector(0, 0, 1)
+        """
+
+        r = Ray(point(0, 0, -5), vector(0, 0, 1))
+        s = RecordingShape()
+        s.set_transform(translation(5, 0, 0))
+        r.intersect(s)
+        self.assertEqual(s.saved_ray.origin, point(-5, 0, -5))
+        self.assertEqual(s.saved_ray.direction, vector(0, 0, 1))
+
+    def test_scenario4(self):
+        """
+        Scenario: Computing the normal on a translated shape
+            Given s ← test_shape()
+            When set_transform(s, translation(0, 1, 0))
+            And n ← normal_at(s, point(0, 1.70711, -0.70711))
+            Then n = vector(0, 0.70711, -0.70711)
+        """
+
+        s = RecordingShape()
+        s.set_transform(translation(0, 1, 0))
+        n = s.normal_at(point(0, 1.70711, -0.70711))
+        self.assertEqual(n, vector(0, 0.70711, -0.70711))
+
+    def test_scenario5(self):
+        """
+        Scenario: Computing the normal on a transformed shape
+            Given s ← test_shape()
+            And m ← scaling(1, 0.5, 1) * rotation_z(π/5)
+            When set_transform(s, m)
+            And n ← normal_at(s, point(0, √2/2, -√2/2))
+            Then n = vector(0, 0.97014, -0.24254)
+        """
+
+        s = RecordingShape()
+        s.set_transform(scaling(1, 0.5, 1) * rotation_z(pi / 5))
+        n = s.normal_at(point(0, sqrt(2) / 2, -sqrt(2) / 2))
+        self.assertEqual(n, vector(0, 0.97014, -0.24254))
+
+    def test_scenario6(self):
+        """
+        Scenario: World bounds come from the transformed local bounds
+            Given s ← test_shape()
+            When set_transform(s, translation(1, 2, 3) * scaling(2, 1, 1))
+            Then bounds(s) = (point(-1, 1, 2), point(3, 3, 4))
+        """
+
+        s = RecordingShape()
+        s.set_transform(translation(1, 2, 3) * scaling(2, 1, 1))
+        minimum, maximum = s.bounds()
+        self.assertEqual(minimum, point(-1, 1, 2))
+        self.assertEqual(maximum, point(3, 3, 4))
+
+    def test_scenario7(self):
+        """
+        Scenario: A shape that doesn't say how rays cross it can't be created
+            Given a Shape subclass with local_normal_at but no local_intersect
+            Then creating one raises TypeError
+        """
+
+        class Incomplete(Shape):
+            def local_normal_at(self, p, hit=None):
+                return vector(p.x, p.y, p.z)
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,50 +1,75 @@
 from __future__ import annotations
 from copy import copy
+from math import sqrt
+from affine import is_affine
 from canvas import Color
 from material import Material
-from matrix import Matrix, identity_matrix, inverse, transpose
-from tuple import Tuple, point, normalize
+from ray import Ray, Intersection
+from shape import Shape
+from tuple import Tuple, point, dot
 
 
-class Sphere(object):
+class Sphere(Shape):
     def __init__(
         self,
         origin: Tuple = point(0, 0, 0),
         radius: float = 1,
         material: Material = Material(Color(1, 1, 1), 0.1, 0.9, 0.9, 200),
     ):
+        super().__init__(material)
         self.origin = origin
         self.radius = radius
-        self.transform = identity_matrix
-        self.material = material
 
-    def set_transform(self, transformation: Matrix) -> None:
+    def local_intersect(self, ray: Ray) -> list:
         """
-        Set a sphere's transformation matrix to a given one.
+        Solves the ray-sphere quadratic for the unit sphere at the object space origin.
 
             Parameters:
-                transformation (Matrix)
+                ray (Ray): Ray already moved into object space
+
+            Returns:
+                ts (list): Sorted roots, empty if the ray misses
         """
 
-        self.transform = transformation
+        sphere_to_ray = ray.origin - point(0, 0, 0)
+        a = dot(ray.direction, ray.direction)
+        b = 2 * dot(ray.direction, sphere_to_ray)
+        c = dot(sphere_to_ray, sphere_to_ray) - 1
 
-    def normal_at(self, p: Tuple) -> Tuple:
-        """
-        Computes the normal at a given point on a sphere.
+        discriminant = b**2 - 4 * a * c
 
-            Parameters:
-                p (Tuple)
+        if discriminant < 0:
+            return []
+
+        t1 = (-b - sqrt(discriminant)) / (2 * a)
+        t2 = (-b + sqrt(discriminant)) / (2 * a)
+        return [t1, t2]
+
+    def local_normal_at(self, p: Tuple, hit: Intersection = None) -> Tuple:
+        return p - point(0, 0, 0)
+
+    def local_bounds(self) -> tuple:
+        return point(-1, -1, -1), point(1, 1, 1)
+
+    def bounds(self) -> tuple:
+        """
+        World-space axis-aligned bounding box of the transformed unit sphere.
 
             Returns:
-                normal (Tuple)
+                (minimum, maximum) (tuple): Opposite corners, as points
         """
 
-        object_point = inverse(self.transform) * p
-        object_normal = object_point - point(0, 0, 0)
-        world_normal = transpose(inverse(self.transform)) * object_normal
-        world_normal.w = 0
-        normal = normalize(world_normal)
-        return normal
+        if not is_affine(self._transform):
+            return super().bounds()
+        # A transformed unit sphere extends sqrt(sum of squares of each linear row) around its center
+        m = self._transform.matrix
+        ex = sqrt(m[0] ** 2 + m[1] ** 2 + m[2] ** 2)
+        ey = sqrt(m[4] ** 2 + m[5] ** 2 + m[6] ** 2)
+        ez = sqrt(m[8] ** 2 + m[9] ** 2 + m[10] ** 2)
+        return (
+            point(m[3] - ex, m[7] - ey, m[11] - ez),
+            point(m[3] + ex, m[7] + ey, m[11] + ez),
+        )
 
     def __copy__(self) -> Sphere:
         s = Sphere(copy(self.origin), self.radius, copy(self.material))
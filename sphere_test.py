@@ -1,6 +1,6 @@
 from math import sqrt, pi
 from material import Material
-from matrix import identity_matrix
+from matrix import identity_matrix, inverse, transpose
 from ray import Ray, Intersection, Intersections, hit
 from sphere import Sphere
 from transformations import translation, scaling, rotation_z
@@ -272,6 +272,36 @@ class Tests(unittest.TestCase):
         s.material = m
         self.assertEqual(s.material, m)
 
+    def test_scenario19(self):
+        """
+        Scenario: A sphere caches the inverse of its transformation
+            Given s ← sphere()
+            And t ← translation(2, 3, 4) * scaling(2, 2, 2)
+            When set_transform(s, t)
+            Then s.inverse = inverse(t)
+            And s.inverse_transpose = transpose(inverse(t))
+        """
+
+        s = Sphere()
+        t = translation(2, 3, 4) * scaling(2, 2, 2)
+        s.set_transform(t)
+        self.assertEqual(s.inverse, inverse(t))
+        self.assertEqual(s.inverse_transpose, transpose(inverse(t)))
+
+    def test_scenario20(self):
+        """
+        Scenario: Assigning a sphere's transform invalidates the cached inverse
+            Given s ← sphere()
+            And s.inverse = identity_matrix
+            When s.transform ← scaling(2, 2, 2)
+            Then s.inverse = scaling(0.5, 0.5, 0.5)
+        """
+
+        s = Sphere()
+        self.assertEqual(s.inverse, identity_matrix)
+        s.transform = scaling(2, 2, 2)
+        self.assertEqual(s.inverse, scaling(0.5, 0.5, 0.5))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 from copy import copy
 from math import cos, sin
+from affine import AffineTransform
 from matrix import Matrix, identity_matrix
 from tuple import Tuple, normalize, cross
 
@@ -134,26 +135,18 @@ def view_transform(start: Tuple, to: Tuple, up: Tuple):
     upn = normalize(up)
     left = cross(forward, upn)
     true_up = cross(left, forward)
-    orientation = Matrix(
-        4,
-        4,
+    orientation = AffineTransform(
         [
             left.x,
             left.y,
             left.z,
-            0,
             true_up.x,
             true_up.y,
             true_up.z,
-            0,
             -forward.x,
             -forward.y,
             -forward.z,
-            0,
-            0,
-            0,
-            0,
-            1,
-        ],
+        ]
     )
-    return orientation * translation(-start.x, -start.y, -start.z)
+    offset = AffineTransform(offset=[-start.x, -start.y, -start.z])
+    return (orientation * offset).to_matrix()
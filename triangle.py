@@ -0,0 +1,175 @@
+from __future__ import annotations
+from copy import copy
+from math import inf
+from material import Material
+from ray import Ray, Intersection, Intersections, transform
+from shape import Shape
+from tuple import Tuple, point, cross, normalize
+from utils import EPSILON
+
+
+def intersect_triangle(
+    origin: tuple, direction: tuple, a: tuple, b: tuple, c: tuple
+) -> tuple:
+    """
+    Möller–Trumbore ray-triangle test on plain (x, y, z) sequences, so packed vertex arrays can be
+    tested without building a Tuple per vertex.
+
+        Parameters:
+            origin (tuple): Ray origin
+            direction (tuple): Ray direction
+            a (tuple): First corner
+            b (tuple): Second corner
+            c (tuple): Third corner
+
+        Returns:
+            (t, u, v) (tuple): Where the ray crosses the triangle and the barycentric coordinates of the
+            crossing, weighting the second and third corners, or None if the ray misses
+    """
+
+    ox, oy, oz = origin
+    dx, dy, dz = direction
+    ax, ay, az = a
+    bx, by, bz = b
+    cx, cy, cz = c
+    e1x = bx - ax
+    e1y = by - ay
+    e1z = bz - az
+    e2x = cx - ax
+    e2y = cy - ay
+    e2z = cz - az
+
+    # dir_cross_e2 = cross(direction, e2)
+    px = dy * e2z - dz * e2y
+    py = dz * e2x - dx * e2z
+    pz = dx * e2y - dy * e2x
+    det = e1x * px + e1y * py + e1z * pz
+    if -EPSILON < det < EPSILON:
+        # The ray runs parallel to the triangle
+        return None
+
+    f = 1 / det
+    sx = ox - ax
+    sy = oy - ay
+    sz = oz - az
+    u = f * (sx * px + sy * py + sz * pz)
+    if u < 0 or u > 1:
+        return None
+
+    # origin_cross_e1 = cross(p1_to_origin, e1)
+    qx = sy * e1z - sz * e1y
+    qy = sz * e1x - sx * e1z
+    qz = sx * e1y - sy * e1x
+    v = f * (dx * qx + dy * qy + dz * qz)
+    if v < 0 or u + v > 1:
+        return None
+
+    return f * (e2x * qx + e2y * qy + e2z * qz), u, v
+
+
+class Triangle(Shape):
+    def __init__(self, p1: Tuple, p2: Tuple, p3: Tuple, material: Material = None):
+        """
+        A flat triangle between three points.
+
+            Parameters:
+                p1 (Tuple): Tuple with type=point
+                p2 (Tuple): Tuple with type=point
+                p3 (Tuple): Tuple with type=point
+                material (Material)
+        """
+
+        super().__init__(material)
+        self.p1 = p1
+        self.p2 = p2
+        self.p3 = p3
+        self.e1 = p2 - p1
+        self.e2 = p3 - p1
+        self.normal = normalize(cross(self.e2, self.e1))
+        self._corners = [(p.x, p.y, p.z) for p in (p1, p2, p3)]
+
+    def _local_hit(self, ray: Ray) -> tuple:
+        o = ray.origin
+        d = ray.direction
+        return intersect_triangle(
+            (o.x, o.y, o.z),
+            (d.x, d.y, d.z),
+            self._corners[0],
+            self._corners[1],
+            self._corners[2],
+        )
+
+    def local_intersect(self, ray: Ray) -> list:
+        found = self._local_hit(ray)
+        return [] if found is None else [found[0]]
+
+    def local_normal_at(self, p: Tuple, hit: Intersection = None) -> Tuple:
+        return self.normal
+
+    def local_bounds(self) -> tuple:
+        ps = (self.p1, self.p2, self.p3)
+        return (
+            point(min(p.x for p in ps), min(p.y for p in ps), min(p.z for p in ps)),
+            point(max(p.x for p in ps), max(p.y for p in ps), max(p.z for p in ps)),
+        )
+
+    def intersect(self, ray: Ray) -> Intersections:
+        found = self._local_hit(transform(ray, self.inverse))
+        if found is None:
+            return Intersections()
+        t, u, v = found
+        return Intersections(Intersection(t, self, u, v))
+
+    def hit(self, ray: Ray, t_min: float = 0, t_max: float = inf) -> Intersection:
+        found = self._local_hit(transform(ray, self.inverse))
+        if found is None or not t_min <= found[0] < t_max:
+            return None
+        t, u, v = found
+        return Intersection(t, self, u, v)
+
+    def __copy__(self) -> Triangle:
+        t = Triangle(self.p1, self.p2, self.p3, copy(self.material))
+        t.transform = copy(self.transform)
+        return t
+
+    def __repr__(self):
+        return f"Triangle with corners {self.p1}, {self.p2} and {self.p3}"
+
+
+class SmoothTriangle(Triangle):
+    def __init__(
+        self,
+        p1: Tuple,
+        p2: Tuple,
+        p3: Tuple,
+        n1: Tuple,
+        n2: Tuple,
+        n3: Tuple,
+        material: Material = None,
+    ):
+        """
+        A triangle whose normal is interpolated between a normal at each corner.
+
+            Parameters:
+                p1, p2, p3 (Tuple): Tuples with type=point
+                n1, n2, n3 (Tuple): Tuples with type=vector, the normal at each point
+                material (Material)
+        """
+
+        super().__init__(p1, p2, p3, material)
+        self.n1 = n1
+        self.n2 = n2
+        self.n3 = n3
+
+    def local_normal_at(self, p: Tuple, hit: Intersection = None) -> Tuple:
+        return self.n2 * hit.u + self.n3 * hit.v + self.n1 * (1 - hit.u - hit.v)
+
+    def __copy__(self) -> SmoothTriangle:
+        t = SmoothTriangle(
+            self.p1, self.p2, self.p3, self.n1, self.n2, self.n3, copy(self.material)
+        )
+        t.transform = copy(self.transform)
+        return t
+
+    def __repr__(self):
+        return f"Smooth triangle with corners {self.p1}, {self.p2} and {self.p3}"
@@ -0,0 +1,114 @@
+from ray import Ray, Intersection
+from triangle import Triangle, SmoothTriangle
+from tuple import point, vector
+from world import prepare_computations
+import unittest
+
+
+class Tests(unittest.TestCase):
+    def test_scenario1(self):
+        """
+        Scenario: Constructing a triangle
+            Given p1 ← point(0, 1, 0)
+            And p2 ← point(-1, 0, 0)
+            And p3 ← point(1, 0, 0)
+            And t ← triangle(p1, p2, p3)
+            Then t.e1 = vector(-1, -1, 0)
+            And t.e2 = vector(1, -1, 0)
+            And t.normal = vector(0, 0, -1)
+        """
+
+        t = Triangle(point(0, 1, 0), point(-1, 0, 0), point(1, 0, 0))
+        self.assertEqual(t.e1, vector(-1, -1, 0))
+        self.assertEqual(t.e2, vector(1, -1, 0))
+        self.assertEqual(t.normal, vector(0, 0, -1))
+
+    def test_scenario2(self):
+        """
+        Scenario: Intersecting a ray parallel to the triangle
+            Given t ← triangle(point(0, 1, 0), point(-1, 0, 0), point(1, 0, 0))
+            And r ← ray(point(0, -1, -2), vector(0, 1, 0))
+            When xs ← local_intersect(t, r)
+            Then xs is empty
+        """
+
+        t = Triangle(point(0, 1, 0), point(-1, 0, 0), point(1, 0, 0))
+        r = Ray(point(0, -1, -2), vector(0, 1, 0))
+        self.assertEqual(t.local_intersect(r), [])
+
+    def test_scenario3(self):
+        """
+        Scenario: A ray misses each edge of the triangle
+            Given t ← triangle(point(0, 1, 0), point(-1, 0, 0), point(1, 0, 0))
+            Then rays from point(1, 1, -2), point(-1, 1, -2) and point(0, -1, -2) along vector(0, 0, 1) miss
+        """
+
+        t = Triangle(point(0, 1, 0), point(-1, 0, 0), point(1, 0, 0))
+        for origin in (point(1, 1, -2), point(-1, 1, -2), point(0, -1, -2)):
+            self.assertEqual(t.local_intersect(Ray(origin, vector(0, 0, 1))), [])
+
+    def test_scenario4(self):
+        """
+        Scenario: A ray strikes a triangle
+            Given t ← triangle(point(0, 1, 0), point(-1, 0, 0), point(1, 0, 0))
+            And r ← ray(point(0, 0.5, -2), vector(0, 0, 1))
+            When xs ← local_intersect(t, r)
+            Then xs.count = 1
+            And xs[0].t = 2
+        """
+
+        t = Triangle(point(0, 1, 0), point(-1, 0, 0), point(1, 0, 0))
+        r = Ray(point(0, 0.5, -2), vector(0, 0, 1))
+        self.assertEqual(t.local_intersect(r), [2])
+
+    def test_scenario5(self):
+        """
+        Scenario: An intersection with a smooth triangle stores u/v
+            Given tri ← smooth_triangle(point(0, 1, 0), point(-1, 0, 0), point(1, 0, 0),
+                                        vector(0, 1, 0), vector(-1, 0, 0), vector(1, 0, 0))
+            When r ← ray(point(-0.2, 0.3, -2), vector(0, 0, 1))
+            And xs ← intersect(tri, r)
+            Then xs[0].u = 0.45
+            And xs[0].v = 0.25
+        """
+
+        tri = SmoothTriangle(
+            point(0, 1, 0),
+            point(-1, 0, 0),
+            point(1, 0, 0),
+            vector(0, 1, 0),
+            vector(-1, 0, 0),
+            vector(1, 0, 0),
+        )
+        xs = Ray(point(-0.2, 0.3, -2), vector(0, 0, 1)).intersect(tri)
+        self.assertAlmostEqual(xs[0].u, 0.45)
+        self.assertAlmostEqual(xs[0].v, 0.25)
+
+    def test_scenario6(self):
+        """
+        Scenario: A smooth triangle uses u/v to interpolate the normal
+            Given tri ← smooth_triangle(point(0, 1, 0), point(-1, 0, 0), point(1, 0, 0),
+                                        vector(0, 1, 0), vector(-1, 0, 0), vector(1, 0, 0))
+            When i ← intersection_with_uv(1, tri, 0.45, 0.25)
+            And n ← normal_at(tri, point(0, 0, 0), i)
+            Then n = vector(-0.5547, 0.83205, 0)
+            And prepare_computations(i, ray(point(-0.2, 0.3, -2), vector(0, 0, 1))).normalv = n
+        """
+
+        tri = SmoothTriangle(
+            point(0, 1, 0),
+            point(-1, 0, 0),
+            point(1, 0, 0),
+            vector(0, 1, 0),
+            vector(-1, 0, 0),
+            vector(1, 0, 0),
+        )
+        i = Intersection(1, tri, 0.45, 0.25)
+        n = tri.normal_at(point(0, 0, 0), i)
+        self.assertEqual(n, vector(-0.5547, 0.83205, 0))
+        comps = prepare_computations(i, Ray(point(-0.2, 0.3, -2), vector(0, 0, 1)))
+        self.assertEqual(comps.normalv, n)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,12 +4,17 @@ import math
 
 
 class Tuple:
+    __slots__ = ("x", "y", "z", "w")
+
     def __init__(self, x: float, y: float, z: float, w: float = 1) -> None:
         self.x = x
         self.y = y
         self.z = z
         self.w = w
-        self.type = "point" if w == 1 else "vector"
+
+    @property
+    def type(self) -> str:
+        return "point" if self.w == 1 else "vector"
 
     def __getitem__(self, index):
         indexed = [self.x, self.y, self.z, self.w]
@@ -50,6 +55,8 @@ class Tuple:
 
 
 class Color:
+    __slots__ = ("red", "green", "blue")
+
     def __init__(self, red: float, green: float, blue: float):
         self.red = red
         self.green = green
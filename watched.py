@@ -0,0 +1,43 @@
+from weakref import ref
+
+
+class Watched:
+    """
+    Base for things that other structures are built over, such as a World's objects and lights.
+    Whatever builds over one registers with watch and has its _changed called whenever the item
+    changes, so it only rebuilds when one of its own items changes. Watchers are held weakly and told
+    apart by identity.
+    """
+
+    __slots__ = ()
+
+    def watch(self, watcher) -> None:
+        """
+        Registers something to be told when this changes.
+
+            Parameters:
+                watcher (Any): Anything with a _changed method
+        """
+
+        self._watchers[:] = [
+            w for w in self._watchers if w() is not None and w() is not watcher
+        ]
+        self._watchers.append(ref(watcher))
+
+    def unwatch(self, watcher) -> None:
+        """
+        Stops telling a watcher about changes.
+
+            Parameters:
+                watcher (Any)
+        """
+
+        self._watchers[:] = [
+            w for w in self._watchers if w() is not None and w() is not watcher
+        ]
+
+    def _changed(self) -> None:
+        for w in self._watchers:
+            watcher = w()
+            if watcher is not None:
+                watcher._changed()
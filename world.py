@@ -1,29 +1,258 @@
 from __future__ import annotations
 from copy import copy
+from math import inf, isfinite
+from random import Random
+from bvh import BVH
 from canvas import Color
+from light_tree import LightTree
 from lights import PointLight
-from material import lighting, Material
-from ray import Ray, Intersection, Intersections, hit
+from material import lighting, sample_lighting, Material
+from plane import Plane
+from ray import Ray, Intersection, Intersections
 from sphere import Sphere
-from tuple import point, dot
+from tuple import Tuple, point, dot, magnitude, normalize
 from transformations import scaling
-from utils import equal
+from utils import EPSILON, equal
+
+# Scenes with fewer objects than this are tested linearly; a hierarchy costs more than it saves
+BVH_MIN_OBJECTS = 8
+
+
+class _TrackedList(list):
+    """
+    A list that watches its items and counts changes to itself and to them, so structures built over
+    it can tell when to rebuild by comparing a single number.
+    """
+
+    # A class default, because unpickling appends the items before it restores the instance's own
+    version = 0
+
+    def __init__(self, items=()):
+        super().__init__(items)
+        for item in self:
+            item.watch(self)
+
+    def _changed(self) -> None:
+        self.version += 1
+
+    def _added(self, items) -> None:
+        for item in items:
+            item.watch(self)
+        self._changed()
+
+    def _removed(self, items) -> None:
+        for item in items:
+            # The same item can appear more than once; keep watching it until the last one goes
+            if not any(other is item for other in self):
+                item.unwatch(self)
+        self._changed()
+
+    def __setitem__(self, index, value) -> None:
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        new = list(value) if isinstance(index, slice) else [value]
+        super().__setitem__(index, new if isinstance(index, slice) else value)
+        self._removed(old)
+        self._added(new)
+
+    def __delitem__(self, index) -> None:
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        self._removed(old)
+
+    def __iadd__(self, items) -> _TrackedList:
+        self.extend(items)
+        return self
+
+    def __imul__(self, n: int) -> _TrackedList:
+        old = list(self)
+        super().__imul__(n)
+        self._removed(old)
+        return self
+
+    def append(self, item) -> None:
+        super().append(item)
+        self._added([item])
+
+    def extend(self, items) -> None:
+        items = list(items)
+        super().extend(items)
+        self._added(items)
+
+    def insert(self, index: int, item) -> None:
+        super().insert(index, item)
+        self._added([item])
+
+    def pop(self, index: int = -1):
+        item = super().pop(index)
+        self._removed([item])
+        return item
+
+    def remove(self, item) -> None:
+        del self[self.index(item)]
+
+    def clear(self) -> None:
+        old = list(self)
+        super().clear()
+        self._removed(old)
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        super().sort(key=key, reverse=reverse)
+        self._changed()
 
 
 class Computations:
+    __slots__ = ("t", "object", "point", "over_point", "eyev", "normalv", "inside")
+
     def __init__(self):
         self.t = None
         self.object = None
         self.point = None
+        self.over_point = None
         self.eyev = None
         self.normalv = None
         self.inside = None
 
 
 class World:
-    def __init__(self, objects: list = [], light_source: PointLight = None):
+    def __init__(
+        self,
+        objects: list = [],
+        light_source: PointLight = None,
+        lights: list = None,
+    ):
+        """
+        A scene to render. The world keeps its own copies of the objects and lights lists, so later
+        changes go through w.objects and w.lights rather than the lists passed in.
+
+            Parameters:
+                objects (list): Shapes
+                light_source (PointLight): A single light, put first in lights
+                lights (list): PointLights
+        """
+
         self.objects = objects
-        self.light_source = light_source
+        self.lights = [] if lights is None else lights
+        if light_source is not None:
+            self.lights = [light_source] + self.lights
+        self._bvh = None
+        # Objects with infinite bounds, such as planes, which are tested outside the BVH
+        self._unbounded = []
+        self._light_bvh = None
+        self._unbounded_lights = []
+        self._bounded_lights = []
+        self._light_tree = None
+        # What each cached structure was built from, by name; see _stale
+        self._built_from = {}
+        # Lights evaluated per hit when there are more lights than this; 0 always evaluates every light
+        self.light_samples = 0
+        # (light, last object found blocking it), keyed by id(light), plus counters to measure it by
+        self._occluders = {}
+        self.shadow_cache_hits = 0
+        self.shadow_cache_misses = 0
+
+    @property
+    def objects(self) -> list:
+        return self._objects
+
+    @objects.setter
+    def objects(self, objects: list) -> None:
+        # A copy that watches every object, so the world knows when to rebuild what it built over them
+        self._objects = _TrackedList(objects)
+
+    @property
+    def lights(self) -> list:
+        return self._lights
+
+    @lights.setter
+    def lights(self, lights: list) -> None:
+        self._lights = _TrackedList(lights)
+
+    def _stale(self, name: str, items: _TrackedList) -> bool:
+        """
+        Whether the structure cached under a name was built before the items, or the list holding
+        them, last changed. Only this world's own items count, and this runs for every ray, so it
+        compares a single number.
+
+            Parameters:
+                name (str)
+                items (_TrackedList): w.objects or w.lights
+
+            Returns:
+                stale (bool)
+        """
+
+        built = self._built_from.get(name)
+        if built is not None and built[0] is items and built[1] == items.version:
+            return False
+        self._built_from[name] = (items, items.version)
+        return True
+
+    @property
+    def light_source(self) -> PointLight:
+        # The first light, for worlds lit by a single light
+        return self.lights[0] if self.lights else None
+
+    @light_source.setter
+    def light_source(self, light: PointLight) -> None:
+        self.lights = [light] if light is not None else []
+
+    def lights_at(self, p: Tuple) -> list:
+        """
+        Finds the lights whose influence reaches a point, skipping lights beyond their radius.
+
+            Parameters:
+                p (Tuple): Tuple with type=point
+
+            Returns:
+                lights (list)
+        """
+
+        if self._stale("light_bvh", self.lights):
+            self._unbounded_lights = [
+                light for light in self.lights if light.radius is None
+            ]
+            self._bounded_lights = [
+                light for light in self.lights if light.radius is not None
+            ]
+            self._light_bvh = None
+            if len(self._bounded_lights) >= BVH_MIN_OBJECTS:
+                # Index the bounded lights by the box around their sphere of influence
+                boxes = []
+                for light in self._bounded_lights:
+                    c = light.position
+                    r = light.radius
+                    boxes.append((c.x - r, c.y - r, c.z - r, c.x + r, c.y + r, c.z + r))
+                self._light_bvh = BVH(self._bounded_lights, boxes)
+
+        if not self._bounded_lights:
+            return self._unbounded_lights
+        candidates = (
+            self._light_bvh.containing(p)
+            if self._light_bvh is not None
+            else self._bounded_lights
+        )
+        return self._unbounded_lights + [
+            light
+            for light in candidates
+            if magnitude(light.position - p) < light.radius
+        ]
+
+    def light_tree(self) -> LightTree:
+        """
+        Returns the hierarchy used to sample the world's lights, building it on first use and
+        rebuilding it after lights are added, replaced, moved or change radius or power.
+
+            Returns:
+                tree (LightTree)
+        """
+
+        if self._stale("light_tree", self.lights):
+            self._light_tree = LightTree(self.lights)
+        return self._light_tree
 
     def includes(self, obj) -> bool:
         for object in self.objects:
@@ -44,52 +273,277 @@ class World:
 
         intersections = Intersections()
         for obj in self.objects:
-            intersections.intersections.extend(ray.intersect(obj))
+            intersections.intersections.extend(obj.intersect(ray))
         intersections.intersections = sorted(
             intersections.intersections, key=lambda intersection: intersection.t
         )
         return intersections
 
-    def shade_hit(self, comps: Computations) -> Color:
+    def closest_hit(
+        self, ray: Ray, t_min: float = 0, t_max: float = inf
+    ) -> Intersection:
+        """
+        Finds the nearest intersection within [t_min, t_max) without collecting and sorting every intersection.
+
+            Parameters:
+                ray (Ray)
+                t_min (float)
+                t_max (float)
+
+            Returns:
+                nearest (Intersection): None if nothing is hit in range
+        """
+
+        # Every hit accepted is closer than the one before, so the last one found is the closest, and
+        # it already carries whatever the object needs to shade it
+        hits = []
+
+        def nearest(obj, ray: Ray, t_min: float, t_max: float) -> float:
+            hit = obj.hit(ray, t_min, t_max)
+            if hit is None:
+                return None
+            hits.append(hit)
+            return hit.t
+
+        candidates = self.objects
+        bvh = self.bvh()
+        if bvh is not None:
+            found = bvh.closest_hit(ray, t_min, t_max, nearest)
+            if found is not None:
+                t_max = found[0]
+            candidates = self._unbounded
+
+        for obj in candidates:
+            t = nearest(obj, ray, t_min, t_max)
+            if t is not None:
+                # Anything further away than this can no longer be the closest hit
+                t_max = t
+        return hits[-1] if hits else None
+
+    def any_hit(self, ray: Ray, t_min: float = 0, t_max: float = inf):
+        """
+        Finds any object the ray hits within [t_min, t_max), stopping at the first one found.
+
+            Parameters:
+                ray (Ray)
+                t_min (float)
+                t_max (float)
+
+            Returns:
+                obj (Any): None if nothing is hit in range
+        """
+
+        candidates = self.objects
+        bvh = self.bvh()
+        if bvh is not None:
+            found = bvh.any_hit(ray, t_min, t_max)
+            if found is not None:
+                return found[1]
+            candidates = self._unbounded
+
+        for obj in candidates:
+            if obj.nearest(ray, t_min, t_max) is not None:
+                return obj
+        return None
+
+    def bvh(self) -> BVH:
+        """
+        Returns the bounding volume hierarchy over the world's bounded objects, building it on first
+        use and rebuilding it after objects are added, replaced or removed or one of them moves.
+        Objects with infinite bounds are left out and kept in a list to be tested linearly alongside it.
+
+            Returns:
+                bvh (BVH): None for scenes small enough to test linearly
+        """
+
+        if len(self.objects) < BVH_MIN_OBJECTS:
+            return None
+        if self._stale("bvh", self.objects):
+            bounded = []
+            bounds = []
+            self._unbounded = []
+            for obj in self.objects:
+                minimum, maximum = obj.bounds()
+                box = (minimum.x, minimum.y, minimum.z, maximum.x, maximum.y, maximum.z)
+                if all(isfinite(c) for c in box):
+                    bounded.append(obj)
+                    bounds.append(box)
+                else:
+                    self._unbounded.append(obj)
+            self._bvh = (
+                BVH(bounded, bounds) if len(bounded) >= BVH_MIN_OBJECTS else None
+            )
+        return self._bvh
+
+    def intersect_many(self, origins, directions) -> tuple:
+        """
+        Intersects a batch of rays against every object in one call.
+
+            Parameters:
+                origins (TupleArray): Ray origins, type=point
+                directions (TupleArray): Ray directions, type=vector
+
+            Returns:
+                (t, index) (tuple): Nearest non-negative t per ray (inf on a miss) and the index into objects of what was hit (-1 on a miss)
+        """
+
+        # Imported here so the scalar renderer keeps working without NumPy
+        import numpy as np
+        from arrays import intersect_planes, intersect_spheres
+
+        spheres = [i for i, obj in enumerate(self.objects) if isinstance(obj, Sphere)]
+        planes = [i for i, obj in enumerate(self.objects) if isinstance(obj, Plane)]
+        t, index = intersect_spheres(
+            origins, directions, [self.objects[i].inverse for i in spheres]
+        )
+        if len(spheres) == len(self.objects):
+            # Every object is a sphere, so sphere indexes are already object indexes
+            return t, index
+        # Map sphere indexes back to object indexes; a miss (-1) picks the trailing -1
+        index = np.array(spheres + [-1])[index]
+
+        if planes:
+            plane_t, plane_index = intersect_planes(
+                origins, directions, [self.objects[i].coefficients for i in planes]
+            )
+            closer = plane_t < t
+            t = np.where(closer, plane_t, t)
+            index = np.where(closer, np.array(planes)[plane_index], index)
+
+        # Shapes with no batched kernel, such as meshes, are tested one ray at a time
+        others = [
+            i
+            for i, obj in enumerate(self.objects)
+            if not isinstance(obj, (Sphere, Plane))
+        ]
+        if others:
+            rays = [
+                Ray(o, d) for o, d in zip(origins.to_tuples(), directions.to_tuples())
+            ]
+            for i in others:
+                for n, ray in enumerate(rays):
+                    hit_t = self.objects[i].nearest(ray, 0, t[n])
+                    if hit_t is not None:
+                        t[n] = hit_t
+                        index[n] = i
+        return t, index
+
+    def shade_hit(self, comps: Computations, seed: int = 0) -> Color:
         """
         Returns the color at the intersection encapsulated by a computation.
 
             Parameters:
                 comps (Computations)
+                seed (int): Seeds the light sampling when light_samples is set, so a pixel shades the same way every render
 
             Returns:
                 color (Color)
         """
 
-        color = lighting(
-            comps.object.material,
-            self.light_source,
-            comps.point,
-            comps.eyev,
-            comps.normalv,
-        )
+        if 0 < self.light_samples < len(self.lights):
+            return sample_lighting(
+                comps.object.material,
+                self.light_tree(),
+                comps.over_point,
+                comps.eyev,
+                comps.normalv,
+                self.light_samples,
+                Random(seed),
+                self.is_shadowed,
+            )
+
+        color = Color(0, 0, 0)
+        for light in self.lights_at(comps.over_point):
+            color = color + lighting(
+                comps.object.material,
+                light,
+                comps.over_point,
+                comps.eyev,
+                comps.normalv,
+                self.is_shadowed(comps.over_point, light),
+            )
         return color
 
-    def color_at(self, ray: Ray) -> Color:
+    def is_shadowed(self, p: Tuple, light: PointLight = None) -> bool:
+        """
+        Determines whether anything lies between a point and a light, stopping at the first occluder.
+
+            Parameters:
+                p (Tuple): Tuple with type=point
+                light (PointLight): Defaults to the world's light source
+
+            Returns:
+                shadowed (bool)
+        """
+
+        if light is None:
+            light = self.light_source
+        v = light.position - p
+        distance = magnitude(v)
+        ray = Ray(p, normalize(v))
+
+        # An occluder may since have moved or left the world
+        if self._stale("occluders", self.objects):
+            self._occluders = {}
+
+        # Neighbouring points are usually blocked by the same object, so try that one first
+        cached = self._occluders.get(id(light))
+        if (
+            cached is not None
+            and cached[0] is light
+            and cached[1].nearest(ray, 0, distance) is not None
+        ):
+            self.shadow_cache_hits += 1
+            return True
+        self.shadow_cache_misses += 1
+
+        occluder = self.any_hit(ray, 0, distance)
+        if occluder is None:
+            return False
+        # Lights compare by value and aren't hashable; holding the light keeps its id from being reused
+        self._occluders[id(light)] = (light, occluder)
+        return True
+
+    def reset_shadow_cache(self) -> None:
+        """
+        Forgets the cached occluder for every light. Renderers call this at the start of each tile.
+        """
+
+        self._occluders = {}
+
+    def shadow_cache_hit_rate(self) -> float:
+        """
+        Fraction of shadow tests answered by the cached occluder alone.
+
+            Returns:
+                rate (float)
+        """
+
+        total = self.shadow_cache_hits + self.shadow_cache_misses
+        return self.shadow_cache_hits / total if total else 0.0
+
+    def color_at(self, ray: Ray, seed: int = 0) -> Color:
         """
         Returns the color at the given intersection.
 
             Parameters:
                 ray (Ray)
+                seed (int): Passed on to shade_hit
 
             Returns:
                 color (Color)
         """
 
-        intersections = self.intersect(ray)
-        reach = hit(intersections)
+        reach = self.closest_hit(ray)
         if not reach:
             return Color(0, 0, 0)
         comps = prepare_computations(reach, ray)
-        return self.shade_hit(comps)
+        return self.shade_hit(comps, seed)
 
     def __copy__(self) -> World:
-        return World(copy(self.objects), copy(self.light_source))
+        world = World(copy(self.objects), lights=[copy(light) for light in self.lights])
+        world.light_samples = self.light_samples
+        return world
 
     def __getitem__(self, index: int):
         return self.objects[index]
@@ -115,10 +569,12 @@ def prepare_computations(intersection: Intersection, ray: Ray):
     comps.object = intersection.object
     comps.point = ray.position(comps.t)
     comps.eyev = -ray.direction
-    comps.normalv = comps.object.normal_at(comps.point)
+    comps.normalv = comps.object.normal_at(comps.point, intersection)
     if dot(comps.normalv, comps.eyev) < 0:
         comps.inside = True
         comps.normalv = -comps.normalv
     else:
         comps.inside = False
+    # Nudge the point off the surface so shadow rays don't hit the surface they start on (acne)
+    comps.over_point = comps.point + comps.normalv * EPSILON
     return comps
@@ -1,10 +1,12 @@
 from canvas import Color
 from lights import PointLight
 from material import Material
-from ray import Ray, Intersection
+from plane import Plane
+from ray import Ray, Intersection, hit
 from sphere import Sphere
-from transformations import scaling
-from tuple import point, vector
+from transformations import scaling, translation
+from tuple import point, vector, normalize
+from utils import EPSILON
 from world import World, default_world, prepare_computations
 import unittest
 
@@ -215,6 +217,395 @@ class Tests(unittest.TestCase):
         c = w.color_at(r)
         self.assertEqual(c, inner.material.color)
 
+    def test_scenario11(self):
+        """
+        Scenario: Intersecting a batch of rays with a world
+            Given w ← default_world()
+            And origins ← [point(0, 0, -5), point(0, 2, -5), point(0, 0, 0), point(0.3, 0.2, -5)]
+            And directions ← [vector(0, 0, 1), vector(0, 0, 1), vector(0, 0, 1), normalize(vector(0, 0.1, 1))]
+            When (t, index) ← intersect_many(w, origins, directions)
+            Then t = [4, inf, 0.5, hit(intersect_world(w, ray(origins[3], directions[3]))).t]
+            And index = [0, -1, 1, 0]
+        """
+
+        from arrays import TupleArray
+
+        w = default_world()
+        origins = [
+            point(0, 0, -5),
+            point(0, 2, -5),
+            point(0, 0, 0),
+            point(0.3, 0.2, -5),
+        ]
+        directions = [
+            vector(0, 0, 1),
+            vector(0, 0, 1),
+            vector(0, 0, 1),
+            normalize(vector(0, 0.1, 1)),
+        ]
+        t, index = w.intersect_many(
+            TupleArray.from_tuples(origins), TupleArray.from_tuples(directions)
+        )
+        expected = hit(w.intersect(Ray(origins[3], directions[3])))
+        self.assertEqual(list(t[[0, 2]]), [4, 0.5])
+        self.assertEqual(t[1], float("inf"))
+        self.assertAlmostEqual(t[3], expected.t)
+        self.assertEqual(list(index), [0, -1, 1, 0])
+
+    def test_scenario12(self):
+        """
+        Scenario: The closest hit matches the hit of all intersections
+            Given w ← default_world()
+            And r ← ray(point(0, 0, -5), vector(0, 0, 1))
+            When i ← closest_hit(w, r)
+            Then i.t = 4
+            And i.object = w.objects[0]
+        """
+
+        w = default_world()
+        r = Ray(point(0, 0, -5), vector(0, 0, 1))
+        i = w.closest_hit(r)
+        self.assertEqual(i.t, 4)
+        self.assertIs(i.object, w.objects[0])
+
+    def test_scenario13(self):
+        """
+        Scenario: The closest hit respects the [t_min, t_max) range
+            Given w ← default_world()
+            And r ← ray(point(0, 0, -5), vector(0, 0, 1))
+            Then closest_hit(w, r, 4.2).t = 4.5
+            And closest_hit(w, r, 4.2).object = w.objects[1]
+            And closest_hit(w, r, 0, 4) is nothing
+            And closest_hit(w, ray(point(0, 2, -5), vector(0, 0, 1))) is nothing
+        """
+
+        w = default_world()
+        r = Ray(point(0, 0, -5), vector(0, 0, 1))
+        self.assertEqual(w.closest_hit(r, 4.2).t, 4.5)
+        self.assertIs(w.closest_hit(r, 4.2).object, w.objects[1])
+        self.assertIsNone(w.closest_hit(r, 0, 4))
+        self.assertIsNone(w.closest_hit(Ray(point(0, 2, -5), vector(0, 0, 1))))
+
+    def test_scenario14(self):
+        """
+        Scenario: There is no shadow when nothing is collinear with point and light
+            Given w ← default_world()
+            And p ← point(0, 10, 0)
+            Then is_shadowed(w, p) is false
+        """
+
+        w = default_world()
+        self.assertFalse(w.is_shadowed(point(0, 10, 0)))
+
+    def test_scenario15(self):
+        """
+        Scenario: The shadow when an object is between the point and the light
+            Given w ← default_world()
+            And p ← point(10, -10, 10)
+            Then is_shadowed(w, p, w.light) is true
+        """
+
+        w = default_world()
+        self.assertTrue(w.is_shadowed(point(10, -10, 10), w.light_source))
+
+    def test_scenario16(self):
+        """
+        Scenario: There is no shadow when an object is behind the light
+            Given w ← default_world()
+            And p ← point(-20, 20, -20)
+            Then is_shadowed(w, p) is false
+        """
+
+        w = default_world()
+        self.assertFalse(w.is_shadowed(point(-20, 20, -20)))
+
+    def test_scenario17(self):
+        """
+        Scenario: There is no shadow when an object is behind the point
+            Given w ← default_world()
+            And p ← point(-2, 2, -2)
+            Then is_shadowed(w, p) is false
+        """
+
+        w = default_world()
+        self.assertFalse(w.is_shadowed(point(-2, 2, -2)))
+
+    def test_scenario18(self):
+        """
+        Scenario: shade_hit() is given an intersection in shadow
+            Given w ← world()
+            And w.light ← point_light(point(0, 0, -10), color(1, 1, 1))
+            And s1 ← sphere()
+            And s1 is added to w
+            And s2 ← sphere() with:
+              | transform | translation(0, 0, 10) |
+            And s2 is added to w
+            And r ← ray(point(0, 0, 5), vector(0, 0, 1))
+            And i ← intersection(4, s2)
+            When comps ← prepare_computations(i, r)
+            And c ← shade_hit(w, comps)
+            Then c = color(0.1, 0.1, 0.1)
+        """
+
+        s1 = Sphere(point(0, 0, 0), 1, Material())
+        s2 = Sphere(point(0, 0, 0), 1, Material())
+        s2.set_transform(translation(0, 0, 10))
+        w = World([s1, s2], PointLight(point(0, 0, -10), Color(1, 1, 1)))
+        r = Ray(point(0, 0, 5), vector(0, 0, 1))
+        i = Intersection(4, s2)
+        comps = prepare_computations(i, r)
+        self.assertEqual(w.shade_hit(comps), Color(0.1, 0.1, 0.1))
+
+    def test_scenario19(self):
+        """
+        Scenario: The hit should offset the point
+            Given r ← ray(point(0, 0, -5), vector(0, 0, 1))
+            And shape ← sphere() with:
+              | transform | translation(0, 0, 1) |
+            And i ← intersection(5, shape)
+            When comps ← prepare_computations(i, r)
+            Then comps.over_point.z < -EPSILON/2
+            And comps.point.z > comps.over_point.z
+        """
+
+        r = Ray(point(0, 0, -5), vector(0, 0, 1))
+        shape = Sphere()
+        shape.set_transform(translation(0, 0, 1))
+        i = Intersection(5, shape)
+        comps = prepare_computations(i, r)
+        self.assertLess(comps.over_point.z, -EPSILON / 2)
+        self.assertGreater(comps.point.z, comps.over_point.z)
+
+    def test_scenario20(self):
+        """
+        Scenario: Shadow tests reuse the last occluder for a light
+            Given w ← default_world()
+            When is_shadowed(w, point(10, -10, 10))
+            And is_shadowed(w, point(10, -10, 9))
+            Then w.shadow_cache_hits = 1
+            And w.shadow_cache_misses = 1
+            And shadow_cache_hit_rate(w) = 0.5
+        """
+
+        w = default_world()
+        self.assertTrue(w.is_shadowed(point(10, -10, 10)))
+        self.assertTrue(w.is_shadowed(point(10, -10, 9)))
+        self.assertEqual(w.shadow_cache_hits, 1)
+        self.assertEqual(w.shadow_cache_misses, 1)
+        self.assertEqual(w.shadow_cache_hit_rate(), 0.5)
+
+    def test_scenario21(self):
+        """
+        Scenario: A cached occluder that doesn't block falls back to the full test
+            Given w ← default_world()
+            When is_shadowed(w, point(10, -10, 10))
+            Then is_shadowed(w, point(0, 10, 0)) is false
+            When reset_shadow_cache(w)
+            Then is_shadowed(w, point(10, -10, 10)) is true
+            And w.shadow_cache_misses = 3
+        """
+
+        w = default_world()
+        self.assertTrue(w.is_shadowed(point(10, -10, 10)))
+        self.assertFalse(w.is_shadowed(point(0, 10, 0)))
+        w.reset_shadow_cache()
+        self.assertTrue(w.is_shadowed(point(10, -10, 10)))
+        self.assertEqual(w.shadow_cache_misses, 3)
+
+    def test_scenario22(self):
+        """
+        Scenario: A world with a single light source exposes it as its light list
+            Given w ← default_world()
+            Then w.lights = [w.light_source]
+            When w.light_source ← point_light(point(0, 0, 0), color(1, 1, 1))
+            Then w.lights has 1 light
+        """
+
+        w = default_world()
+        self.assertEqual(w.lights, [w.light_source])
+        w.light_source = PointLight(point(0, 0, 0), Color(1, 1, 1))
+        self.assertEqual(len(w.lights), 1)
+
+    def test_scenario23(self):
+        """
+        Scenario: shade_hit adds up the contribution of every light
+            Given w ← default_world()
+            And r ← ray(point(0, 0, -5), vector(0, 0, 1))
+            And comps ← prepare_computations(intersection(4, w.objects[0]), r)
+            And c ← shade_hit(w, comps)
+            When a second copy of the light is added to w
+            Then shade_hit(w, comps) = c * 2
+        """
+
+        w = default_world()
+        r = Ray(point(0, 0, -5), vector(0, 0, 1))
+        comps = prepare_computations(Intersection(4, w.objects[0]), r)
+        c = w.shade_hit(comps)
+        w.lights.append(PointLight(point(-10, 10, -10), Color(1, 1, 1)))
+        self.assertEqual(w.shade_hit(comps), c * 2)
+
+    def test_scenario24(self):
+        """
+        Scenario: Only lights whose radius reaches a point are used
+            Given w ← world with lights at point(i, 0, 0) of radius 1.5 for i in 0..19
+            And an unbounded light at point(0, 100, 0)
+            Then lights_at(w, point(5.2, 0, 0)) is the unbounded light and the lights at x = 4, 5, 6
+        """
+
+        bounded = [PointLight(point(i, 0, 0), Color(1, 1, 1), 1.5) for i in range(20)]
+        unbounded = PointLight(point(0, 100, 0), Color(1, 1, 1))
+        w = World([], lights=bounded + [unbounded])
+        found = w.lights_at(point(5.2, 0, 0))
+        self.assertEqual(len(found), 4)
+        self.assertIs(found[0], unbounded)
+        self.assertEqual(sorted(light.position.x for light in found[1:]), [4, 5, 6])
+        bounded[5].position = point(50, 0, 0)
+        self.assertEqual(len(w.lights_at(point(5.2, 0, 0))), 3)
+
+    def test_scenario25(self):
+        """
+        Scenario: Sampling lights is repeatable for a given seed
+            Given w ← world with a sphere and 32 lights
+            And w.light_samples ← 4
+            And r ← ray(point(0, 0, -5), vector(0, 0, 1))
+            Then color_at(w, r, 3) = color_at(w, r, 3)
+            And color_at(w, r, 3) != the color with every light evaluated
+        """
+
+        w = default_world()
+        w.lights = [
+            PointLight(point(i - 16, 10, -10), Color(0.05, 0.05, 0.05))
+            for i in range(32)
+        ]
+        r = Ray(point(0, 0, -5), vector(0, 0, 1))
+        exact = w.color_at(r)
+        w.light_samples = 4
+        self.assertEqual(w.color_at(r, 3), w.color_at(r, 3))
+        self.assertNotEqual(w.color_at(r, 3), exact)
+
+    def test_scenario26(self):
+        """
+        Scenario: Planes are found alongside a BVH over the bounded objects
+            Given w ← world with 10 small spheres along the x axis at z = 5 and a floor plane at y = -1
+            And r1 ← ray(point(0, 0, -5), vector(0, 0, 1))
+            And r2 ← ray(point(0, 0, -5), vector(0, -1, 1))
+            Then closest_hit(w, r1).object is a sphere
+            And closest_hit(w, r2).object = the floor
+            And closest_hit(w, r2).t = 1
+        """
+
+        spheres = []
+        for i in range(10):
+            s = Sphere()
+            s.set_transform(translation(i * 3 - 15, 0, 5) * scaling(0.5, 0.5, 0.5))
+            spheres.append(s)
+        floor = Plane()
+        floor.set_transform(translation(0, -1, 0))
+        w = World(spheres + [floor], PointLight(point(-10, 10, -10), Color(1, 1, 1)))
+        self.assertIsNotNone(w.bvh())
+
+        i = w.closest_hit(Ray(point(0, 0, -5), vector(0, 0, 1)))
+        self.assertIs(i.object, spheres[5])
+        i = w.closest_hit(Ray(point(0, 0, -5), vector(0, -1, 1)))
+        self.assertIs(i.object, floor)
+        self.assertEqual(i.t, 1)
+        self.assertIs(w.any_hit(Ray(point(0, 0, -5), vector(0, -1, 0))), floor)
+
+    def test_scenario27(self):
+        """
+        Scenario: Intersecting many rays with a world containing a plane
+            Given w ← default_world() with a plane at y = -1 added
+            And origins ← [point(0, 0, -5), point(0, 0, -5)]
+            And directions ← [vector(0, 0, 1), vector(0, -1, 0)]
+            When (t, index) ← intersect_many(w, origins, directions)
+            Then t = [4, 1]
+            And index = [0, 2]
+        """
+
+        from arrays import TupleArray
+
+        w = default_world()
+        floor = Plane()
+        floor.set_transform(translation(0, -1, 0))
+        w.objects.append(floor)
+        t, index = w.intersect_many(
+            TupleArray.from_tuples([point(0, 0, -5), point(0, 0, -5)]),
+            TupleArray.from_tuples([vector(0, 0, 1), vector(0, -1, 0)]),
+        )
+        self.assertEqual(list(t), [4, 1])
+        self.assertEqual(list(index), [0, 2])
+
+    def test_scenario28(self):
+        """
+        Scenario: Replacing a light in place re-indexes the lights by radius
+            Given spare ← point_light(point(100, 0, 0), color(1, 1, 1)) with radius 1.5
+            And w ← world with lights at point(i, 0, 0) of radius 1.5 for i in 0..19
+            And lights_at(w, point(100, 0, 0)) is empty
+            When w.lights[3] ← spare
+            Then lights_at(w, point(100, 0, 0)) = [spare]
+            And lights_at(w, point(3, 0, 0)) has no light at x = 3
+        """
+
+        spare = PointLight(point(100, 0, 0), Color(1, 1, 1), 1.5)
+        w = World(
+            [],
+            lights=[PointLight(point(i, 0, 0), Color(1, 1, 1), 1.5) for i in range(20)],
+        )
+        self.assertEqual(w.lights_at(point(100, 0, 0)), [])
+        w.lights[3] = spare
+        self.assertEqual(len(w.lights_at(point(100, 0, 0))), 1)
+        self.assertIs(w.lights_at(point(100, 0, 0))[0], spare)
+        self.assertNotIn(3, [light.position.x for light in w.lights_at(point(3, 0, 0))])
+
+    def test_scenario29(self):
+        """
+        Scenario: The light tree is rebuilt when a light's power changes
+            Given w ← world with 8 lights of intensity color(1, 1, 1)
+            And w.lights[0].intensity ← color(0, 0, 0)
+            And tree ← light_tree(w)
+            When w.lights[0].intensity ← color(1, 1, 1)
+            Then light_tree(w) is not tree
+            And light_tree(w) samples w.lights[0] with nonzero probability
+            When w.lights[0].attenuation ← (1, 0, 1)
+            Then light_tree(w) is rebuilt again
+        """
+
+        w = World(
+            [], lights=[PointLight(point(i, 0, 0), Color(1, 1, 1)) for i in range(8)]
+        )
+        w.lights[0].intensity = Color(0, 0, 0)
+        tree = w.light_tree()
+        w.lights[0].intensity = Color(1, 1, 1)
+        rebuilt = w.light_tree()
+        self.assertIsNot(rebuilt, tree)
+        sampled = {id(rebuilt.sample(point(0, 1, 0), u / 64)[0]) for u in range(64)}
+        self.assertIn(id(w.lights[0]), sampled)
+        w.lights[0].attenuation = (1, 0, 1)
+        self.assertIsNot(w.light_tree(), rebuilt)
+
+    def test_scenario30(self):
+        """
+        Scenario: A cached occluder that leaves the world or moves no longer casts a shadow
+            Given s ← sphere() with transform translation(0, 5, 0)
+            And w ← world([s]) with a light at point(0, 10, 0)
+            And is_shadowed(w, point(0, 0, 0)) is true
+            When s is removed from w
+            Then is_shadowed(w, point(0, 0, 0)) is false
+            When s is added back and set_transform(s, translation(20, 5, 0))
+            Then is_shadowed(w, point(0, 0, 0)) is false
+        """
+
+        s = Sphere()
+        s.set_transform(translation(0, 5, 0))
+        w = World([s], PointLight(point(0, 10, 0), Color(1, 1, 1)))
+        self.assertTrue(w.is_shadowed(point(0, 0, 0)))
+        w.objects.remove(s)
+        self.assertFalse(w.is_shadowed(point(0, 0, 0)))
+        w.objects.append(s)
+        self.assertTrue(w.is_shadowed(point(0, 0, 0)))
+        s.set_transform(translation(20, 5, 0))
+        self.assertFalse(w.is_shadowed(point(0, 0, 0)))
+
 
 if __name__ == "__main__":
     unittest.main()